@@ -48,6 +48,10 @@ if implementation.name == 'circuitpython':
     SCL = board.IO41
     IRQ = board.IO6
     I2CBUS = busio.I2C(SCL, SDA)
+if implementation.name == 'cpython':
+    # Linux single board computer, /dev/i2c-1
+    from LinuxI2C import I2C
+    I2CBUS = I2C(1)
 pmu_flag = False
 irq = None
 
@@ -336,6 +340,10 @@ while True:
     if implementation.name == 'circuitpython':
         if irq.value == False:
             pmu_flag = True
+    if implementation.name == 'cpython':
+        # No interrupt pin wired, poll the status registers
+        time.sleep(1)
+        pmu_flag = True
 
     if pmu_flag:
         pmu_flag = False
@@ -0,0 +1,97 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      AXP2101_Async.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+from AXP2101 import *
+from AsyncPMU import AsyncPMU
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+SDA = None
+SCL = None
+I2CBUS = None
+IRQPIN = None
+
+if implementation.name == 'micropython':
+    from machine import Pin, I2C
+    SDA = 21
+    SCL = 22
+    IRQ = 35
+    I2CBUS = I2C(scl=Pin(SCL), sda=Pin(SDA))
+    IRQPIN = Pin(IRQ, Pin.IN, Pin.PULL_UP)
+if implementation.name == 'circuitpython':
+    import digitalio
+    import board
+    import busio
+    SDA = board.IO42
+    SCL = board.IO41
+    IRQ = board.IO6
+    I2CBUS = busio.I2C(SCL, SDA)
+    IRQPIN = digitalio.DigitalInOut(IRQ)
+    IRQPIN.switch_to_input()
+if implementation.name == 'cpython':
+    # Linux single board computer, /dev/i2c-1
+    from LinuxI2C import I2C
+    I2CBUS = I2C(1)
+
+PMU = AXP2101(I2CBUS, addr=AXP2101_SLAVE_ADDRESS)
+print('getID:%s' % hex(PMU.getChipID()))
+
+PMU.disableIRQ(PMU.XPOWERS_AXP2101_ALL_IRQ)
+#  Clear all interrupt flags
+PMU.clearIrqStatus()
+PMU.enableIRQ(
+    PMU.XPOWERS_AXP2101_PKEY_SHORT_IRQ | PMU.XPOWERS_AXP2101_PKEY_LONG_IRQ |  # POWER KEY
+    PMU.XPOWERS_AXP2101_VBUS_INSERT_IRQ | PMU.XPOWERS_AXP2101_VBUS_REMOVE_IRQ  # VBUS
+)
+
+
+async def powerKey(apmu):
+    while True:
+        irq = await apmu.waitIrq(PMU.XPOWERS_AXP2101_PKEY_LONG_IRQ)
+        print('Power key long press, irq:%s' % hex(irq))
+
+
+async def eventLog(apmu):
+    async for irq, name in apmu.events():
+        print('IRQ:%s' % name)
+
+
+async def telemetry(apmu):
+    async for t in apmu.telemetry(1000):
+        print('VBAT:%umV VSYS:%umV TEMP:%.1fC' % (t.battVoltage, t.systemVoltage, t.temperature))
+
+
+async def main():
+    apmu = AsyncPMU(PMU, IRQPIN).start()
+    await asyncio.gather(powerKey(apmu), eventLog(apmu), telemetry(apmu))
+
+
+asyncio.run(main())
@@ -0,0 +1,106 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      AXP2101_IrqDispatcher.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+from AXP2101 import *
+import time
+
+SDA = None
+SCL = None
+I2CBUS = None
+
+if implementation.name == 'micropython':
+    from machine import Pin, I2C
+    SDA = 21
+    SCL = 22
+    IRQ = 35
+    I2CBUS = I2C(scl=Pin(SCL), sda=Pin(SDA))
+if implementation.name == 'circuitpython':
+    import digitalio
+    import board
+    import busio
+    SDA = board.IO42
+    SCL = board.IO41
+    IRQ = board.IO6
+    I2CBUS = busio.I2C(SCL, SDA)
+if implementation.name == 'cpython':
+    # Linux single board computer, /dev/i2c-1
+    from LinuxI2C import I2C
+    I2CBUS = I2C(1)
+
+
+def onPowerKey(irq):
+    if irq == PMU.XPOWERS_AXP2101_PKEY_SHORT_IRQ:
+        print("isPekeyShortPress")
+    else:
+        print("isPekeyLongPress")
+
+
+def onVbus(irq):
+    print(("isVbusRemove", "isVbusInsert")[irq == PMU.XPOWERS_AXP2101_VBUS_INSERT_IRQ])
+
+
+def onCharge(irq):
+    print(("isBatChargeStart", "isBatChargeDone")[irq == PMU.XPOWERS_AXP2101_BAT_CHG_DONE_IRQ])
+
+
+PMU = AXP2101(I2CBUS, addr=AXP2101_SLAVE_ADDRESS)
+print('getID:%s' % hex(PMU.getChipID()))
+
+PMU.disableIRQ(PMU.XPOWERS_AXP2101_ALL_IRQ)
+#  Clear all interrupt flags
+PMU.clearIrqStatus()
+
+PMU.enableIRQ(
+    PMU.XPOWERS_AXP2101_PKEY_SHORT_IRQ | PMU.XPOWERS_AXP2101_PKEY_LONG_IRQ |  # POWER KEY
+    PMU.XPOWERS_AXP2101_VBUS_INSERT_IRQ | PMU.XPOWERS_AXP2101_VBUS_REMOVE_IRQ |  # VBUS
+    PMU.XPOWERS_AXP2101_BAT_CHG_START_IRQ | PMU.XPOWERS_AXP2101_BAT_CHG_DONE_IRQ  # CHARGE
+)
+
+# One handler per group of interrupts, the dispatcher only calls the
+# handlers of the pending interrupts and clears them in one write
+dispatcher = PMU.getIrqDispatcher()
+dispatcher.on(PMU.XPOWERS_AXP2101_PKEY_SHORT_IRQ | PMU.XPOWERS_AXP2101_PKEY_LONG_IRQ, onPowerKey)
+dispatcher.on(PMU.XPOWERS_AXP2101_VBUS_INSERT_IRQ | PMU.XPOWERS_AXP2101_VBUS_REMOVE_IRQ, onVbus)
+dispatcher.on(PMU.XPOWERS_AXP2101_BAT_CHG_START_IRQ | PMU.XPOWERS_AXP2101_BAT_CHG_DONE_IRQ, onCharge)
+
+if implementation.name == 'micropython':
+    # The pin handler only schedules the dispatch, the handlers above run
+    # right after the interrupted code instead of on the next loop pass
+    PMU.attachIrq(Pin(IRQ, Pin.IN, Pin.PULL_UP))
+if implementation.name == 'circuitpython':
+    irq = digitalio.DigitalInOut(IRQ)
+    irq.switch_to_input()
+    PMU.attachIrq(irq)
+
+while True:
+    if implementation.name != 'micropython':
+        # No pin interrupts, dispatch when the IRQ pin is low (or every
+        # pass when no pin is attached)
+        dispatcher.poll()
+
+    time.sleep(0.2)
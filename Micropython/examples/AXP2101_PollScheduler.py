@@ -0,0 +1,91 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      AXP2101_PollScheduler.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+from AXP2101 import *
+from PollScheduler import PollScheduler
+import time
+
+SDA = None
+SCL = None
+I2CBUS = None
+
+if implementation.name == 'micropython':
+    from machine import Pin, I2C
+    SDA = 21
+    SCL = 22
+    I2CBUS = I2C(scl=Pin(SCL), sda=Pin(SDA))
+if implementation.name == 'circuitpython':
+    import board
+    import busio
+    SDA = board.IO42
+    SCL = board.IO41
+    I2CBUS = busio.I2C(SCL, SDA)
+if implementation.name == 'cpython':
+    # Linux single board computer, /dev/i2c-1
+    from LinuxI2C import I2C
+    I2CBUS = I2C(1)
+
+PMU = AXP2101(I2CBUS, addr=AXP2101_SLAVE_ADDRESS)
+print('getID:%s' % hex(PMU.getChipID()))
+
+# Getters called elsewhere in the application may reuse what the
+# scheduler read in the last 100 ms instead of reading the bus again
+PMU.setMaxAge(100)
+
+
+def onVbus(name, value):
+    print('VBUS:%s' % ('yes' if value else 'no'))
+
+
+def onCharging(name, value):
+    print('Charging:%s' % ('yes' if value else 'no'))
+    # Watch the battery closely while charging
+    sched.setPeriod('battVoltage', 200 if value else 1000)
+
+
+def onValue(name, value):
+    print('%s:%s' % (name, value))
+
+
+sched = PollScheduler(PMU, capacity=16)
+sched.add('vbusIn', 50, onVbus, changesOnly=True)         # 20 Hz
+sched.add('charging', 50, onCharging, changesOnly=True)
+sched.add('battVoltage', 1000, onValue)                    # 1 Hz
+sched.add('vbusVoltage', 1000, onValue)
+sched.add('temperature', 10000, onValue)                   # 0.1 Hz
+
+if implementation.name == 'micropython':
+    # Polled from a hardware timer, the main loop stays free
+    from machine import Timer
+    sched.attachTimer(Timer(0))
+    while True:
+        time.sleep(1)
+else:
+    while True:
+        sched.poll()
+        time.sleep(sched.nextDueMs() / 1000)
@@ -91,6 +91,7 @@ _AXP192_INTSTS3 = const(0x46)
 _AXP192_INTSTS4 = const(0x47)
 _AXP192_INTSTS5 = const(0x4D)
 _AXP192_INTSTS_CNT = const(5)
+_AXP192_IRQ_CLEAR_ALL = b'\xff\xff\xff\xff'   # INTSTS1~4
 _AXP192_DC1_VLOTAGE = const(0x26)
 _AXP192_LDO23OUT_VOL = const(0x28)
 _AXP192_GPIO0_CTL = const(0x90)
@@ -161,7 +162,7 @@ _AXP192_DC1_VOL_MIN = const(700)
 _AXP192_DC1_VOL_MAX = const(3500)
 _AXP192_DC2_VOL_STEPS = const(25)
 _AXP192_DC2_VOL_MIN = const(700)
-_AXP192_DC2_VOL_MAX = const(3500)
+_AXP192_DC2_VOL_MAX = const(2275)
 _AXP192_DC3_VOL_STEPS = const(25)
 _AXP192_DC3_VOL_MIN = const(700)
 _AXP192_DC3_VOL_MAX = const(3500)
@@ -175,7 +176,7 @@ _AXP192_CHG_EXT_CURR_MIN = const(300)
 _AXP192_CHG_EXT_CURR_MAX = const(1000)
 _AXP192_CHG_EXT_CURR_STEP = const(100)
 _AXP192_INTERNAL_TEMP_H8 = const(0x5E)
-_AXP192_INTERNAL_TEMP_L4 = const(0x5)
+_AXP192_INTERNAL_TEMP_L4 = const(0x5F)
 _AXP192_INTERNAL_TEMP_STEP = const(0.1)
 _AXP192_INERNAL_TEMP_OFFSET = const(144.7)
 
@@ -202,6 +203,32 @@ class PMU_Gpio:
         self.val = 0
 
 
+class AXP192Telemetry:
+    def __init__(self) -> None:
+        self.status = 0
+        self.chargeStatus = 0
+        self.acinVoltage = 0
+        self.vbusVoltage = 0
+        self.vbusCurrent = 0
+        self.battVoltage = 0
+        self.battChargeCurrent = 0
+        self.battDischargeCurrent = 0
+        self.systemVoltage = 0
+        self.temperature = 0.0
+
+    def isAcinIn(self) -> bool:
+        return bool(self.status & 0x80)
+
+    def isVbusIn(self) -> bool:
+        return bool(self.status & 0x20)
+
+    def isBatteryConnect(self) -> bool:
+        return bool(self.chargeStatus & 0x20)
+
+    def isCharging(self) -> bool:
+        return bool(self.chargeStatus & 0x40)
+
+
 class AXP192(I2CInterface):
 
     # ARGS ARGS ARGS ARGS ARGS ARGS ARGS ARGS ARGS
@@ -385,6 +412,74 @@ class AXP192(I2CInterface):
     XPOWERS_AXP192_TIMER_TIMEOUT_IRQ = const(1 << 39)
     XPOWERS_AXP192_ALL_IRQ = const(0xFFFFFFFFFF)
 
+    """Registers never served from the register shadow cache"""
+    _VOLATILE_REGISTERS = (
+        _AXP192_STATUS,
+        _AXP192_MODE_CHGSTATUS,
+        _AXP192_OTG_STATUS,
+        _AXP192_INTSTS1,
+        _AXP192_INTSTS2,
+        _AXP192_INTSTS3,
+        _AXP192_INTSTS4,
+        _AXP192_INTSTS5,
+        _AXP192_TIMER_CTL,          # timer flag is write 1 to clear
+        _AXP192_GPIO012_SIGNAL,     # input levels
+        _AXP192_GPIO34_SIGNAL,
+        _AXP192_GPIO5_CTL,
+        _AXP192_COULOMB_CTL,        # clear bit self clears
+    ) + tuple(range(_AXP192_ACIN_VOL_H8, _AXP192_APS_AVERVOL_L4 + 1)) \
+      + tuple(range(_AXP192_BAT_CHGCOULOMB3, _AXP192_BAT_DISCHGCOULOMB0 + 1))
+
+    # Interrupt enable and status registers, byte n of an IRQ mask value
+    # maps to the n-th register of each, see IrqDispatcher.py
+    _IRQ_ENABLE_REGS = (_AXP192_INTEN1, _AXP192_INTEN2, _AXP192_INTEN3, _AXP192_INTEN4, _AXP192_INTEN5)
+    _IRQ_STATUS_REGS = (_AXP192_INTSTS1, _AXP192_INTSTS2, _AXP192_INTSTS3, _AXP192_INTSTS4, _AXP192_INTSTS5)
+
+    # Power key interrupts: (pressed edge, released edge, short press,
+    # long press), see PowerKey.py.  The AXP192 has no edge interrupts.
+    _PKEY_IRQS = (0, 0, XPOWERS_AXP192_PKEY_SHORT_IRQ, XPOWERS_AXP192_PKEY_LONG_IRQ)
+
+    # Registers whose timestamped copies (see setMaxAge()) an interrupt
+    # makes stale: (IRQ mask, registers)
+    _IRQ_AFFECTS = (
+        (XPOWERS_AXP192_VBUS_INSERT_IRQ | XPOWERS_AXP192_VBUS_REMOVE_IRQ |
+         XPOWERS_AXP192_VBUS_VAILD_IRQ | XPOWERS_AXP192_VBUS_INVALID_IRQ |
+         XPOWERS_AXP192_ACIN_CONNECT_IRQ | XPOWERS_AXP192_ACIN_REMOVED_IRQ |
+         XPOWERS_AXP192_BAT_INSERT_IRQ | XPOWERS_AXP192_BAT_REMOVE_IRQ |
+         XPOWERS_AXP192_BAT_CHG_START_IRQ | XPOWERS_AXP192_BAT_CHG_DONE_IRQ |
+         XPOWERS_AXP192_BATT_ACTIVATE_IRQ | XPOWERS_AXP192_BATT_EXIT_ACTIVATE_IRQ |
+         XPOWERS_AXP192_CHARGE_LOW_CUR_IRQ | XPOWERS_AXP192_CHIP_TEMP_HIGH_IRQ,
+         (_AXP192_STATUS, _AXP192_MODE_CHGSTATUS)),
+        (XPOWERS_AXP192_VBUS_INSERT_IRQ | XPOWERS_AXP192_VBUS_REMOVE_IRQ |
+         XPOWERS_AXP192_VBUS_VAILD_IRQ | XPOWERS_AXP192_VBUS_INVALID_IRQ,
+         tuple(range(_AXP192_VBUS_VOL_H8, _AXP192_VBUS_CUR_L4 + 1))),
+        (XPOWERS_AXP192_ACIN_CONNECT_IRQ | XPOWERS_AXP192_ACIN_REMOVED_IRQ,
+         tuple(range(_AXP192_ACIN_VOL_H8, _AXP192_ACIN_CUR_L4 + 1))),
+        (XPOWERS_AXP192_BAT_INSERT_IRQ | XPOWERS_AXP192_BAT_REMOVE_IRQ |
+         XPOWERS_AXP192_BAT_CHG_START_IRQ | XPOWERS_AXP192_BAT_CHG_DONE_IRQ,
+         tuple(range(_AXP192_BAT_AVERVOL_H8, _AXP192_BAT_AVERDISCHGCUR_L5 + 1))),
+    )
+
+    # Regulator outputs, see Rail.py.  name: (enable register, enable mask,
+    # enable value, voltage register, voltage mask, voltage shift, flags,
+    # ((min mV, max mV, step mV, first code), ...)), flags 1 keeps the
+    # register bits outside the voltage mask on writes
+    _RAILS = {
+        'DC1': (_AXP192_LDO23_DC123_EXT_CTL, 0x01, 0x01, _AXP192_DC1_VLOTAGE, 0x7F, 0, 1,
+                ((_AXP192_DC1_VOL_MIN, _AXP192_DC1_VOL_MAX, _AXP192_DC1_VOL_STEPS, 0),)),
+        'DC2': (_AXP192_LDO23_DC123_EXT_CTL, 0x10, 0x10, _AXP192_DC2OUT_VOL, 0x3F, 0, 1,
+                ((_AXP192_DC2_VOL_MIN, _AXP192_DC2_VOL_MAX, _AXP192_DC2_VOL_STEPS, 0),)),
+        'DC3': (_AXP192_LDO23_DC123_EXT_CTL, 0x02, 0x02, _AXP192_DC3OUT_VOL, 0x7F, 0, 0,
+                ((_AXP192_DC3_VOL_MIN, _AXP192_DC3_VOL_MAX, _AXP192_DC3_VOL_STEPS, 0),)),
+        'LDO2': (_AXP192_LDO23_DC123_EXT_CTL, 0x04, 0x04, _AXP192_LDO23OUT_VOL, 0xF0, 4, 1,
+                 ((_AXP192_LDO2_VOL_MIN, _AXP192_LDO2_VOL_MAX, _AXP192_LDO2_VOL_STEPS, 0),)),
+        'LDO3': (_AXP192_LDO23_DC123_EXT_CTL, 0x08, 0x08, _AXP192_LDO23OUT_VOL, 0x0F, 0, 1,
+                 ((_AXP192_LDO3_VOL_MIN, _AXP192_LDO3_VOL_MAX, _AXP192_LDO3_VOL_STEPS, 0),)),
+        # GPIO0 in low noise LDO mode
+        'LDOIO': (_AXP192_GPIO0_CTL, 0x07, 0x02, _AXP192_GPIO0_VOL, 0xF0, 4, 1,
+                  ((_AXP192_LDOIO_VOL_MIN, _AXP192_LDOIO_VOL_MAX, _AXP192_LDOIO_VOL_STEPS, 0),)),
+    }
+
     LOW = const(0x0)
     HIGH = const(0x1)
 
@@ -397,6 +492,40 @@ class AXP192(I2CInterface):
     INPUT_PULLDOWN = const(0x09)
     ANALOG = const(0x10)
 
+    # Values for readFields(), see ReadPlan.py.  name: (registers, kind,
+    # a, b), kind 0: (register & a) >> b, 1: 12 bit / 2: 13 bit reading
+    # times a plus b, 5: little endian mask, 6: big endian counter
+    _FIELDS = {
+        'status': ((_AXP192_STATUS,), 0, 0xFF, 0),
+        'chargeStatus': ((_AXP192_MODE_CHGSTATUS,), 0, 0xFF, 0),
+        'acinIn': ((_AXP192_STATUS,), 0, 0x80, 7),
+        'vbusIn': ((_AXP192_STATUS,), 0, 0x20, 5),
+        'batteryConnected': ((_AXP192_MODE_CHGSTATUS,), 0, 0x20, 5),
+        'charging': ((_AXP192_MODE_CHGSTATUS,), 0, 0x40, 6),
+        'acinVoltage': ((_AXP192_ACIN_VOL_H8, _AXP192_ACIN_VOL_L4), 1, _AXP192_ACIN_VOLTAGE_STEP, 0),
+        'acinCurrent': ((_AXP192_ACIN_CUR_H8, _AXP192_ACIN_CUR_L4), 1, _AXP192_ACIN_CUR_STEP, 0),
+        'vbusVoltage': ((_AXP192_VBUS_VOL_H8, _AXP192_VBUS_VOL_L4), 1, _AXP192_VBUS_VOLTAGE_STEP, 0),
+        'vbusCurrent': ((_AXP192_VBUS_CUR_H8, _AXP192_VBUS_CUR_L4), 1, _AXP192_VBUS_CUR_STEP, 0),
+        'temperature': ((_AXP192_INTERNAL_TEMP_H8, _AXP192_INTERNAL_TEMP_L4), 1,
+                        _AXP192_INTERNAL_TEMP_STEP, -_AXP192_INERNAL_TEMP_OFFSET),
+        'battVoltage': ((_AXP192_BAT_AVERVOL_H8, _AXP192_BAT_AVERVOL_L4), 1, _AXP192_BATT_VOLTAGE_STEP, 0),
+        'battChargeCurrent': ((_AXP192_BAT_AVERCHGCUR_H8, _AXP192_BAT_AVERCHGCUR_L5), 2,
+                              _AXP192_BATT_CHARGE_CUR_STEP, 0),
+        'battDischargeCurrent': ((_AXP192_BAT_AVERDISCHGCUR_H8, _AXP192_BAT_AVERDISCHGCUR_L5), 2,
+                                 _AXP192_BATT_DISCHARGE_CUR_STEP, 0),
+        'systemVoltage': ((_AXP192_APS_AVERVOL_H8, _AXP192_APS_AVERVOL_L4), 1, _AXP192_APS_VOLTAGE_STEP, 0),
+        'irqStatus': (_IRQ_STATUS_REGS, 5, 1, 0),
+        'chargeCoulomb': ((_AXP192_BAT_CHGCOULOMB3, _AXP192_BAT_CHGCOULOMB2,
+                           _AXP192_BAT_CHGCOULOMB1, _AXP192_BAT_CHGCOULOMB0), 6, 1, 0),
+        'dischargeCoulomb': ((_AXP192_BAT_DISCHGCOULOMB3, _AXP192_BAT_DISCHGCOULOMB2,
+                              _AXP192_BAT_DISCHGCOULOMB1, _AXP192_BAT_DISCHGCOULOMB0), 6, 1, 0),
+    }
+
+    # Fields of readTelemetry(), in the order it decodes them
+    _TELEMETRY_FIELDS = ('status', 'chargeStatus', 'acinVoltage', 'vbusVoltage', 'vbusCurrent',
+                         'battVoltage', 'battChargeCurrent', 'battDischargeCurrent',
+                         'systemVoltage', 'temperature')
+
     # INT
     RISING = const(0x01)
     FALLING = const(0x02)
@@ -413,38 +542,40 @@ class AXP192(I2CInterface):
         self.statusRegister = [0] * _AXP192_INTSTS_CNT
 
         self.intRegister = [0] * _AXP192_INTSTS_CNT
+        self._statusBuf = bytearray(_AXP192_INTSTS5 - _AXP192_INTSTS1 + 1)
+        self._coulomb = bytearray(4)
         self.gpio = [PMU_Gpio(), PMU_Gpio(), PMU_Gpio(),
                      PMU_Gpio(), PMU_Gpio(), PMU_Gpio()]
 
-    def isAcinVbusStart(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_STATUS, 0))
+    def isAcinVbusStart(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_STATUS, 0, maxAgeMs))
 
-    def isDischarge(self) -> bool:
-        return not bool(super().getRegisterBit(_AXP192_STATUS, 2))
+    def isDischarge(self, maxAgeMs=None) -> bool:
+        return not bool(super().getRegisterBit(_AXP192_STATUS, 2, maxAgeMs))
 
-    def isVbusIn(void) -> bool:
-        return bool(super().getRegisterBit(_AXP192_STATUS, 5))
+    def isVbusIn(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_STATUS, 5, maxAgeMs))
 
-    def isAcinEfficient(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_STATUS, 6))
+    def isAcinEfficient(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_STATUS, 6, maxAgeMs))
 
-    def isAcinIn(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_STATUS, 7))
+    def isAcinIn(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_STATUS, 7, maxAgeMs))
 
-    def isOverTemperature(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 7))
+    def isOverTemperature(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 7, maxAgeMs))
 
-    def isCharging(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 6))
+    def isCharging(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 6, maxAgeMs))
 
-    def isBatteryConnect(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 5))
+    def isBatteryConnect(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 5, maxAgeMs))
 
-    def isBattInActiveMode(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 3))
+    def isBattInActiveMode(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 3, maxAgeMs))
 
-    def isChargeCurrLessPreset(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 2))
+    def isChargeCurrLessPreset(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP192_MODE_CHGSTATUS, 2, maxAgeMs))
 
     def enableVbusVoltageLimit(self) -> None:
         super().setRegisterBit(_AXP192_IPS_SET, 6)
@@ -453,7 +584,7 @@ class AXP192(I2CInterface):
         super().clrRegisterBit(_AXP192_IPS_SET, 6)
 
     def setVbusVoltageLimit(self, opt: int) -> None:
-        val = super().readRegister(_AXP192_IPS_SET)[0]
+        val = super().readRegisterByte(_AXP192_IPS_SET)
         val &= 0xC7
         super().writeRegister(_AXP192_IPS_SET, val | (opt << 3))
 
@@ -493,14 +624,14 @@ class AXP192(I2CInterface):
         elif millivolt > _AXP192_VOFF_VOL_MAX:
             raise ValueError("Mistake ! SYS maximum output voltage is  %umV" %
                              _AXP192_VOFF_VOL_MAX)
-        val = super().readRegister(_AXP192_VOFF_SET)[0]
+        val = super().readRegisterByte(_AXP192_VOFF_SET)
         val &= 0xF8
         val |= (int)((millivolt - _AXP192_VOFF_VOL_MIN) /
                      _AXP192_SYS_VOL_STEPS)
         super().writeRegister(_AXP192_VOFF_SET, val)
 
     def getSysPowerDownVoltage(self) -> int:
-        val = super().readRegister(_AXP192_VOFF_SET)[0]
+        val = super().readRegisterByte(_AXP192_VOFF_SET)
         val &= 0x07
         return (val * _AXP192_SYS_VOL_STEPS) + _AXP192_VOFF_VOL_MIN
 
@@ -522,14 +653,14 @@ class AXP192(I2CInterface):
         if not 0 <= opt <= 3:
             raise ValueError(
                 "Charger target voltage must be a value within 0-3!")
-        val = super().readRegister(_AXP192_CHARGE1)[0]
+        val = super().readRegisterByte(_AXP192_CHARGE1)
         val &= 0x9F
         super().writeRegister(_AXP192_CHARGE1, val | (opt << 5))
 
      # @brief Get charge target voltage settings.
      # @retval See _AXP192_chg_vol_t enum for details.
     def getChargeTargetVoltage(self) -> int:
-        val = super().readRegister(_AXP192_CHARGE1)[0]
+        val = super().readRegisterByte(_AXP192_CHARGE1)
         return (val & 0x60) >> 5
 
     # @brief Set charge current settings.
@@ -539,14 +670,14 @@ class AXP192(I2CInterface):
         if not 0 <= opt <= 15:
             raise ValueError(
                 "Charger current must be a value within 0-15!")
-        val = super().readRegister(_AXP192_CHARGE1)[0]
+        val = super().readRegisterByte(_AXP192_CHARGE1)
         val &= 0xF0
         super().writeRegister(_AXP192_CHARGE1, val | opt)
 
     # @brief Get charge current settings.
     # @retval See _AXP192_chg_curr_t enum for details.
     def getChargerConstantCurr(self) -> int:
-        val = super().readRegister(_AXP192_CHARGE1)[0] & 0x0F
+        val = super().readRegisterByte(_AXP192_CHARGE1) & 0x0F
         return val
 
     def setChargerTerminationCurr(self, opt: int) -> None:
@@ -559,7 +690,7 @@ class AXP192(I2CInterface):
         return super().getRegisterBit(_AXP192_CHARGE1, 4)
 
     def setPrechargeTimeout(self, opt: int):
-        val = super().readRegister(_AXP192_CHARGE2)[0]
+        val = super().readRegisterByte(_AXP192_CHARGE2)
         val &= 0x3F
         super().writeRegister(_AXP192_CHARGE2, val | (opt << 6))
 
@@ -574,7 +705,7 @@ class AXP192(I2CInterface):
         elif milliampere > _AXP192_CHG_EXT_CURR_MAX:
             raise ValueError("Mistake ! The maximum external channel charge current setting is:  %umA" %
                              _AXP192_CHG_EXT_CURR_MAX)
-        val = super().readRegister(_AXP192_CHARGE2)[0]
+        val = super().readRegisterByte(_AXP192_CHARGE2)
         val &= 0xC7
         val |= (int)((milliampere - _AXP192_CHG_EXT_CURR_MIN) /
                      _AXP192_CHG_EXT_CURR_STEP)
@@ -588,7 +719,7 @@ class AXP192(I2CInterface):
 
     #  Timeout setting in constant current mode
     def setChargerConstantTimeout(self, opt: int) -> None:
-        val = super().readRegister(_AXP192_CHARGE2)[0]
+        val = super().readRegisterByte(_AXP192_CHARGE2)
         val &= 0xFC
         super().writeRegister(_AXP192_CHARGE2, val | opt)
 
@@ -602,18 +733,18 @@ class AXP192(I2CInterface):
         return bool(super().getRegisterBit(_AXP192_BACKUP_CHG, 7))
 
     def setBackupBattChargerVoltage(self, opt: int) -> int:
-        val = super().readRegister(_AXP192_BACKUP_CHG)[0]
+        val = super().readRegisterByte(_AXP192_BACKUP_CHG)
         val &= 0x9F
         super().writeRegister(_AXP192_BACKUP_CHG, val | (opt << 5))
 
     def setBackupBattChargerCurr(self, opt: int):
-        val = super().readRegister(_AXP192_BACKUP_CHG)[0]
+        val = super().readRegisterByte(_AXP192_BACKUP_CHG)
         val &= 0xFC
         super().writeRegister(_AXP192_BACKUP_CHG, val | opt)
 
     # Temperature
-    def getTemperature(self) -> float:
-        return super().readRegisterH8L4(_AXP192_INTERNAL_TEMP_H8, _AXP192_INTERNAL_TEMP_L4) * _AXP192_INTERNAL_TEMP_STEP - _AXP192_INERNAL_TEMP_OFFSET
+    def getTemperature(self, maxAgeMs=None) -> float:
+        return super().readRegisterH8L4(_AXP192_INTERNAL_TEMP_H8, _AXP192_INTERNAL_TEMP_L4, maxAgeMs) * _AXP192_INTERNAL_TEMP_STEP - _AXP192_INERNAL_TEMP_OFFSET
 
     def enableTemperatureMeasure(self) -> None:
         super().setRegisterBit(_AXP192_ADC_EN2, 7)
@@ -623,226 +754,143 @@ class AXP192(I2CInterface):
 
     # Power control LDOio functions
     def isEnableLDOio(self) -> bool:
-        return bool(super().readRegister(_AXP192_GPIO0_CTL)[0] & 0x02)
+        return self.rail('LDOIO').isEnabled()
 
     def enableLDOio(self) -> None:
-        val = super().readRegister(_AXP192_GPIO0_CTL)[0] & 0xF8
-        super().writeRegister(_AXP192_GPIO0_CTL, val | 0x02)
+        self.rail('LDOIO').enable()
 
     def disableLDOio(self) -> None:
-        val = super().readRegister(_AXP192_GPIO0_CTL)[0] & 0xF8
-        super().writeRegister(_AXP192_GPIO0_CTL, val)
+        self.rail('LDOIO').disable()
 
     def setLDOioVoltage(self, millivolt: int) -> None:
-        if millivolt % _AXP192_LDOIO_VOL_STEPS:
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP192_LDOIO_VOL_STEPS)
-        if millivolt < _AXP192_LDOIO_VOL_MIN:
-            raise ValueError("Mistake ! LDOIO minimum output voltage is  %umV" %
-                             _AXP192_LDOIO_VOL_MIN)
-        elif millivolt > _AXP192_LDOIO_VOL_MAX:
-            raise ValueError("Mistake ! LDOIO maximum output voltage is  %umV" %
-                             _AXP192_LDOIO_VOL_MAX)
-        val = super().readRegister(_AXP192_GPIO0_VOL)[0]
-        val |= ((int)((millivolt - _AXP192_LDOIO_VOL_MIN) /
-                _AXP192_LDOIO_VOL_STEPS) << 4)
-        super().writeRegister(_AXP192_GPIO0_VOL, val)
+        self.rail('LDOIO').setVoltage(millivolt)
 
     def getLDOioVoltage(self) -> int:
-        val = super().readRegister(_AXP192_GPIO0_VOL)[0]
-        val >>= 4
-        val *= _AXP192_LDOIO_VOL_STEPS
-        val += _AXP192_LDOIO_VOL_MIN
-        return val
+        return self.rail('LDOIO').getVoltage()
 
     # Power control LDO2 functions
     def isEnableLDO2(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 2))
+        return self.rail('LDO2').isEnabled()
 
     def enableLDO2(self) -> None:
-        super().setRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 2)
+        self.rail('LDO2').enable()
 
     def disableLDO2(self) -> None:
-        super().clrRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 2)
+        self.rail('LDO2').disable()
 
     def setLDO2Voltage(self, millivolt: int) -> None:
-        if millivolt % _AXP192_LDO2_VOL_STEPS:
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP192_LDO2_VOL_STEPS)
-        if millivolt < _AXP192_LDO2_VOL_MIN:
-            raise ValueError("Mistake ! LDO2 minimum output voltage is  %umV" %
-                             _AXP192_LDO2_VOL_MIN)
-        elif millivolt > _AXP192_LDO2_VOL_MAX:
-            raise ValueError("Mistake ! LDO2 maximum output voltage is  %umV" %
-                             _AXP192_LDO2_VOL_MAX)
-        val = super().readRegister(_AXP192_LDO23OUT_VOL)[0]
-        val &= 0x0F
-        super().writeRegister(_AXP192_LDO23OUT_VOL, val | ((int)((millivolt -
-                                                                  _AXP192_LDO2_VOL_MIN) / _AXP192_LDO2_VOL_STEPS) << _AXP192_LDO2_VOL_BIT_MASK))
+        self.rail('LDO2').setVoltage(millivolt)
 
     def getLDO2Voltage(self) -> int:
-        val = super().readRegister(_AXP192_LDO23OUT_VOL)[0] & 0xF0
-        return (val >> _AXP192_LDO2_VOL_BIT_MASK) * _AXP192_LDO2_VOL_STEPS + _AXP192_LDO2_VOL_MIN
+        return self.rail('LDO2').getVoltage()
 
     # Power control LDO3 functions
 
     def isEnableLDO3(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 3))
+        return self.rail('LDO3').isEnabled()
 
     def enableLDO3(self) -> None:
-        super().setRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 3)
+        self.rail('LDO3').enable()
 
     def disableLDO3(self) -> None:
-        super().clrRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 3)
+        self.rail('LDO3').disable()
 
     def setLDO3Voltage(self, millivolt: int) -> None:
-        if millivolt % _AXP192_LDO3_VOL_STEPS:
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP192_LDO3_VOL_STEPS)
-        if millivolt < _AXP192_LDO3_VOL_MIN:
-            raise ValueError("Mistake ! LDO3 minimum output voltage is  %umV" %
-                             _AXP192_LDO3_VOL_MIN)
-        elif millivolt > _AXP192_LDO3_VOL_MAX:
-            raise ValueError("Mistake ! LDO3 maximum output voltage is  %umV" %
-                             _AXP192_LDO3_VOL_MAX)
-        val = super().readRegister(_AXP192_LDO23OUT_VOL)[0] & 0xF0
-        super().writeRegister(_AXP192_LDO23OUT_VOL, val | (int)(
-            (millivolt - _AXP192_LDO3_VOL_MIN) / _AXP192_LDO3_VOL_STEPS))
+        self.rail('LDO3').setVoltage(millivolt)
 
     def getLDO3Voltage(self) -> int:
-        val = super().readRegister(_AXP192_LDO23OUT_VOL)[0]
-        val &= 0x0F
-        return (val * _AXP192_LDO3_VOL_STEPS) + _AXP192_LDO3_VOL_MIN
+        return self.rail('LDO3').getVoltage()
 
     # Power control DCDC1 functions
     def setDC1PwmMode(self) -> None:
-        val = super().readRegister(_AXP192_DCDC_MODESET)[0] & 0xF7
+        val = super().readRegisterByte(_AXP192_DCDC_MODESET) & 0xF7
         super().writeRegister(_AXP192_DCDC_MODESET, val | 0x08)
 
     def setDC1AutoMode(self) -> None:
-        val = super().readRegister(_AXP192_DCDC_MODESET)[0] & 0xF7
+        val = super().readRegisterByte(_AXP192_DCDC_MODESET) & 0xF7
         super().writeRegister(_AXP192_DCDC_MODESET, val)
 
     def isEnableDC1(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 0))
+        return self.rail('DC1').isEnabled()
 
     def enableDC1(self) -> None:
-        super().setRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 0)
+        self.rail('DC1').enable()
 
     def disableDC1(self) -> None:
-        super().clrRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 0)
+        self.rail('DC1').disable()
 
     def setDC1Voltage(self, millivolt) -> None:
-        if millivolt % _AXP192_DC1_VOL_STEPS:
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP192_DC1_VOL_STEPS)
-        if millivolt < _AXP192_DC1_VOL_STEPS:
-            raise ValueError("Mistake ! DCDC1 minimum output voltage is  %umV" %
-                             _AXP192_DC1_VOL_STEPS)
-        elif millivolt > _AXP192_DC1_VOL_MAX:
-            raise ValueError("Mistake ! DCDC1 maximum output voltage is  %umV" %
-                             _AXP192_DC1_VOL_MAX)
-        val = super().readRegister(_AXP192_DC1_VLOTAGE)[0]
-        val &= 0x80
-        val |= (int)((millivolt - _AXP192_DC1_VOL_MIN) /
-                     _AXP192_DC1_VOL_STEPS)
-        super().writeRegister(_AXP192_DC1_VLOTAGE, val)
+        self.rail('DC1').setVoltage(millivolt)
 
     def getDC1Voltage(self) -> int:
-        val = super().readRegister(_AXP192_DC1_VLOTAGE)[0] & 0x7F
-        return val * _AXP192_DC1_VOL_STEPS + _AXP192_DC1_VOL_MIN
+        return self.rail('DC1').getVoltage()
 
     # Power control DCDC2 functions
 
     def setDC2PwmMode(self) -> None:
-        val = super().readRegister(_AXP192_DCDC_MODESET)[0] & 0xFB
+        val = super().readRegisterByte(_AXP192_DCDC_MODESET) & 0xFB
         super().writeRegister(_AXP192_DCDC_MODESET, val | 0x04)
 
     def setDC2AutoMode(self) -> None:
-        val = super().readRegister(_AXP192_DCDC_MODESET)[0] & 0xFB
+        val = super().readRegisterByte(_AXP192_DCDC_MODESET) & 0xFB
         super().writeRegister(_AXP192_DCDC_MODESET, val)
 
     def enableDC2VRC(self) -> None:
-        val = super().readRegister(_AXP192_DC2_DVM)[0]
+        val = super().readRegisterByte(_AXP192_DC2_DVM)
         super().writeRegister(_AXP192_DC2_DVM, val | 0x04)
 
     def disableDC2VRC(self) -> None:
-        val = super().readRegister(_AXP192_DC2_DVM)[0]
+        val = super().readRegisterByte(_AXP192_DC2_DVM)
         super().writeRegister(_AXP192_DC2_DVM, val & 0xFB)
 
     def setDC2VRC(self, opts: int) -> None:
         if opts > 1:
             raise ValueError(
                 "DCDC VRC a value within 0-1!")
-        val = super().readRegister(_AXP192_DC2_DVM)[0] & 0xFE
+        val = super().readRegisterByte(_AXP192_DC2_DVM) & 0xFE
         super().writeRegister(_AXP192_DC2_DVM, val | opts)
 
     def isEnableDC2VRC(self) -> bool:
-        return (super().readRegister(_AXP192_DC2_DVM)[0] & 0x04) == 0x04
+        return (super().readRegisterByte(_AXP192_DC2_DVM) & 0x04) == 0x04
 
     def isEnableDC2(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 4))
+        return self.rail('DC2').isEnabled()
 
     def enableDC2(self) -> None:
-        super().setRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 4)
+        self.rail('DC2').enable()
 
     def disableDC2(self) -> None:
-        super().clrRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 4)
+        self.rail('DC2').disable()
 
     def setDC2Voltage(self, millivolt: int) -> None:
-        if millivolt % _AXP192_DC2_VOL_STEPS:
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP192_DC2_VOL_STEPS)
-        if millivolt < _AXP192_DC2_VOL_MIN:
-            raise ValueError("Mistake ! DCDC2 minimum output voltage is  %umV" %
-                             _AXP192_DC2_VOL_MIN)
-        elif millivolt > _AXP192_DC2_VOL_MAX:
-            raise ValueError("Mistake ! DCDC2 maximum output voltage is  %umV" %
-                             _AXP192_DC2_VOL_MAX)
-        val = super().readRegister(_AXP192_DC2OUT_VOL)[0]
-        val &= 0x80
-        val |= (int)((millivolt - _AXP192_DC2_VOL_MIN) /
-                     _AXP192_DC2_VOL_STEPS)
-        super().writeRegister(_AXP192_DC2OUT_VOL, val)
+        self.rail('DC2').setVoltage(millivolt)
 
     def getDC2Voltage(self) -> int:
-        val = super().readRegister(_AXP192_DC2OUT_VOL)[0]
-        return (val * _AXP192_DC2_VOL_STEPS) + _AXP192_DC2_VOL_MIN
+        return self.rail('DC2').getVoltage()
 
     # Power control DCDC3 functions
     def setDC3PwmMode(self) -> None:
-        val = super().readRegister(_AXP192_DCDC_MODESET)[0] & 0xFD
+        val = super().readRegisterByte(_AXP192_DCDC_MODESET) & 0xFD
         super().writeRegister(_AXP192_DCDC_MODESET, val | 0x02)
 
     def setDC3AutoMode(self) -> None:
-        val = super().readRegister(_AXP192_DCDC_MODESET)[0] & 0xFD
+        val = super().readRegisterByte(_AXP192_DCDC_MODESET) & 0xFD
         super().writeRegister(_AXP192_DCDC_MODESET, val)
 
     def isEnableDC3(self) -> bool:
-        return bool(super().getRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 1))
+        return self.rail('DC3').isEnabled()
 
     def enableDC3(self) -> None:
-        super().setRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 1)
+        self.rail('DC3').enable()
 
     def disableDC3(self) -> None:
-        super().clrRegisterBit(_AXP192_LDO23_DC123_EXT_CTL, 1)
+        self.rail('DC3').disable()
 
     def setDC3Voltage(self, millivolt: int) -> None:
-        if millivolt % _AXP192_DC3_VOL_STEPS:
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP192_DC3_VOL_STEPS)
-        if millivolt < _AXP192_DC3_VOL_MIN:
-            raise ValueError("Mistake ! DCDC3 minimum output voltage is  %umV" %
-                             _AXP192_DC3_VOL_MIN)
-        elif millivolt > _AXP192_DC3_VOL_MAX:
-            raise ValueError("Mistake ! DCDC3 maximum output voltage is  %umV" %
-                             _AXP192_DC3_VOL_MAX)
-        super().writeRegister(_AXP192_DC3OUT_VOL, (int)(
-            (millivolt - _AXP192_DC3_VOL_MIN) / _AXP192_DC3_VOL_STEPS))
+        self.rail('DC3').setVoltage(millivolt)
 
     def getDC3Voltage(self) -> int:
-        val = super().readRegister(_AXP192_DC3OUT_VOL)[0]
-        return (val * _AXP192_DC3_VOL_STEPS) + _AXP192_DC3_VOL_MIN
+        return self.rail('DC3').getVoltage()
 
     # Power control EXTEN functions
     def enableExternalPin(self) -> None:
@@ -858,7 +906,12 @@ class AXP192(I2CInterface):
     # @brief  Get the interrupt controller mask value.
     # @retval   Mask value corresponds to _AXP192_irq_t ,
     def getIrqStatus(self) -> int:
-        self.statusRegister = super().readRegister(_AXP192_INTSTS1, 5)
+        # INTSTS5 is not adjacent to INTSTS1~4, one burst covers the gap
+        buf = super().readRegisters(_AXP192_INTSTS1, _AXP192_INTSTS5 - _AXP192_INTSTS1 + 1, self._statusBuf)
+        for i in range(_AXP192_INTSTS_CNT - 1):
+            self.statusRegister[i] = buf[i]
+        self.statusRegister[4] = buf[_AXP192_INTSTS5 - _AXP192_INTSTS1]
+        super()._recordIrqStatus()
         return (self.statusRegister[4]) << 32 |\
                (self.statusRegister[3]) << 24 |\
                (self.statusRegister[2]) << 16 |\
@@ -867,9 +920,12 @@ class AXP192(I2CInterface):
 
      # @brief  Clear interrupt controller state.
     def clearIrqStatus(self) -> None:
-        for i in range(_AXP192_INTSTS_CNT-1):
-            super().writeRegister(_AXP192_INTSTS1 + i, 0xFF)
-        super().writeRegister(_AXP192_INTSTS5, 0xFF)
+        with super().session():
+            super().writeRegisters(_AXP192_INTSTS1, _AXP192_IRQ_CLEAR_ALL)
+            super().writeRegister(_AXP192_INTSTS5, 0xFF)
+        for i in range(_AXP192_INTSTS_CNT):
+            self.statusRegister[i] = 0
+            super()._forgetIrqStatus(i, 0xFF)
 
      # @brief  Enable PMU interrupt control mask .
      # @ param  opt: View the related chip type _AXP192_irq_t enumeration
@@ -1162,45 +1218,72 @@ class AXP192(I2CInterface):
     def disableAdcChannel(self, opts: int) -> None:
         self._setSignalCaptureImpl(opts, False)
 
-    def getVbusVoltage(self) -> int:
-        if not self.isVbusIn():
+    def getVbusVoltage(self, maxAgeMs=None) -> int:
+        if not self.isVbusIn(maxAgeMs):
             return 0
         return super().readRegisterH8L4(_AXP192_VBUS_VOL_H8,
-                                        _AXP192_VBUS_VOL_L4
+                                        _AXP192_VBUS_VOL_L4, maxAgeMs
                                         ) * _AXP192_VBUS_VOLTAGE_STEP
 
-    def getVbusCurrent(self) -> float:
-        if not self.isVbusIn():
+    def getVbusCurrent(self, maxAgeMs=None) -> float:
+        if not self.isVbusIn(maxAgeMs):
             return 0
         return super().readRegisterH8L4(_AXP192_VBUS_CUR_H8,
-                                        _AXP192_VBUS_CUR_L4
+                                        _AXP192_VBUS_CUR_L4, maxAgeMs
                                         ) * _AXP192_VBUS_CUR_STEP
 
-    def getBattVoltage(self) -> float:
-        if not self.isBatteryConnect():
+    def getBattVoltage(self, maxAgeMs=None) -> float:
+        if not self.isBatteryConnect(maxAgeMs):
             return 0
         return super().readRegisterH8L4(_AXP192_BAT_AVERVOL_H8,
-                                        _AXP192_BAT_AVERVOL_L4
+                                        _AXP192_BAT_AVERVOL_L4, maxAgeMs
                                         ) * _AXP192_BATT_VOLTAGE_STEP
 
-    def getBattDischargeCurrent(self) -> float:
-        if not self.isBatteryConnect():
+    def getBattDischargeCurrent(self, maxAgeMs=None) -> float:
+        if not self.isBatteryConnect(maxAgeMs):
             return 0
         return super().readRegisterH8L5(_AXP192_BAT_AVERDISCHGCUR_H8,
-                                        _AXP192_BAT_AVERDISCHGCUR_L5) * _AXP192_BATT_DISCHARGE_CUR_STEP
+                                        _AXP192_BAT_AVERDISCHGCUR_L5, maxAgeMs) * _AXP192_BATT_DISCHARGE_CUR_STEP
 
-    def getAcinVoltage(self) -> float:
-        if not self.isAcinIn():
+    def getAcinVoltage(self, maxAgeMs=None) -> float:
+        if not self.isAcinIn(maxAgeMs):
             return 0
-        return super().readRegisterH8L4(_AXP192_ACIN_VOL_H8, _AXP192_ACIN_VOL_L4) * _AXP192_ACIN_VOLTAGE_STEP
+        return super().readRegisterH8L4(_AXP192_ACIN_VOL_H8, _AXP192_ACIN_VOL_L4, maxAgeMs) * _AXP192_ACIN_VOLTAGE_STEP
 
-    def getAcinCurrent(self) -> float:
-        if not self.isAcinIn():
+    def getAcinCurrent(self, maxAgeMs=None) -> float:
+        if not self.isAcinIn(maxAgeMs):
             return 0
-        return super().readRegisterH8L4(_AXP192_ACIN_CUR_H8, _AXP192_ACIN_CUR_L4) * _AXP192_ACIN_CUR_STEP
-
-    def getSystemVoltage(self) -> float:
-        return super().readRegisterH8L4(_AXP192_APS_AVERVOL_H8, _AXP192_APS_AVERVOL_L4) * _AXP192_APS_VOLTAGE_STEP
+        return super().readRegisterH8L4(_AXP192_ACIN_CUR_H8, _AXP192_ACIN_CUR_L4, maxAgeMs) * _AXP192_ACIN_CUR_STEP
+
+    def getSystemVoltage(self, maxAgeMs=None) -> float:
+        return super().readRegisterH8L4(_AXP192_APS_AVERVOL_H8, _AXP192_APS_AVERVOL_L4, maxAgeMs) * _AXP192_APS_VOLTAGE_STEP
+
+    # @brief  Read status, ADC results and battery currents as one
+    #         snapshot.  00H~01H, the ADC block 56H~5FH and the battery
+    #         block 78H~7FH are fetched with the three burst reads of a
+    #         cached read plan.  Like the getters, the values of an absent
+    #         input or battery read 0.
+    # @param  out: optional AXP192Telemetry instance to fill in place
+    # @retval AXP192Telemetry
+    def readTelemetry(self, out=None):
+        if out is None:
+            out = AXP192Telemetry()
+        plan = super().getReadPlan(self._TELEMETRY_FIELDS)
+        plan.read(self)
+        out.status = plan.value(0)
+        out.chargeStatus = plan.value(1)
+        out.systemVoltage = plan.value(8)
+        out.temperature = plan.value(9)
+        acin = out.isAcinIn()
+        vbus = out.isVbusIn()
+        battery = out.isBatteryConnect()
+        out.acinVoltage = plan.value(2) if acin else 0
+        out.vbusVoltage = plan.value(3) if vbus else 0
+        out.vbusCurrent = plan.value(4) if vbus else 0
+        out.battVoltage = plan.value(5) if battery else 0
+        out.battChargeCurrent = plan.value(6)
+        out.battDischargeCurrent = plan.value(7) if battery else 0
+        return out
 
     # Timer Control
     def setTimerout(self, minute: int) -> None:
@@ -1222,10 +1305,7 @@ class AXP192(I2CInterface):
     def readDataBuffer(self, size: int) -> list:
         if size > _AXP192_DATA_BUFFER_SIZE:
             raise ValueError('Out of range!')
-        data = [0]*size
-        for i in range(size):
-            data[i] = super().readRegister(_AXP192_DATA_BUFFER1 + i)[0]
-        return list(data)
+        return super().readRegister(_AXP192_DATA_BUFFER1, size)
 
     # Charge led functions
     # @brief Set charging led mode.
@@ -1234,7 +1314,7 @@ class AXP192(I2CInterface):
         range = [self.XPOWERS_CHG_LED_OFF, self.XPOWERS_CHG_LED_BLINK_1HZ,
                  self.XPOWERS_CHG_LED_BLINK_4HZ, self.XPOWERS_CHG_LED_ON]
         if mode in range:
-            val = super().readRegister(_AXP192_OFF_CTL)[0]
+            val = super().readRegisterByte(_AXP192_OFF_CTL)
             val &= 0xC7
             val |= 0x08      # use manual ctrl
             val |= (mode << 4)
@@ -1245,7 +1325,7 @@ class AXP192(I2CInterface):
     def getChargingLedMode(self) -> int:
         if not bool(super().getRegisterBit(_AXP192_OFF_CTL, 3)):
             return self.XPOWERS_CHG_LED_CTRL_CHG
-        val = super().readRegister(_AXP192_OFF_CTL)[0]
+        val = super().readRegisterByte(_AXP192_OFF_CTL)
         val &= 0x30
         return val >> 4
 
@@ -1261,45 +1341,39 @@ class AXP192(I2CInterface):
 
     def clearCoulomb(self) -> None:
         super().setRegisterBit(_AXP192_COULOMB_CTL, 5)
+        for reg in range(_AXP192_BAT_CHGCOULOMB3, _AXP192_BAT_DISCHGCOULOMB0 + 1):
+            super()._dropStamps(reg)
 
-    def getBattChargeCoulomb(self) -> int:
-        data = [0]*4
-        data[0] = super().readRegister(_AXP192_BAT_CHGCOULOMB3)[0]
-        data[1] = super().readRegister(_AXP192_BAT_CHGCOULOMB2)[0]
-        data[2] = super().readRegister(_AXP192_BAT_CHGCOULOMB1)[0]
-        data[3] = super().readRegister(_AXP192_BAT_CHGCOULOMB0)[0]
+    def getBattChargeCoulomb(self, maxAgeMs=None) -> int:
+        data = super().readRegisters(_AXP192_BAT_CHGCOULOMB3, 4, self._coulomb, maxAgeMs)
         return (data[0] << 24) | (data[1] << 16) | (data[2] << 8) | data[3]
 
-    def getBattDischargeCoulomb(self) -> int:
-        data = [0]*4
-        data[0] = super().readRegister(_AXP192_BAT_DISCHGCOULOMB3)[0]
-        data[1] = super().readRegister(_AXP192_BAT_DISCHGCOULOMB2)[0]
-        data[2] = super().readRegister(_AXP192_BAT_DISCHGCOULOMB1)[0]
-        data[3] = super().readRegister(_AXP192_BAT_DISCHGCOULOMB0)[0]
+    def getBattDischargeCoulomb(self, maxAgeMs=None) -> int:
+        data = super().readRegisters(_AXP192_BAT_DISCHGCOULOMB3, 4, self._coulomb, maxAgeMs)
         return (data[0] << 24) | (data[1] << 16) | (data[2] << 8) | data[3]
 
-    def getAdcSamplingRate(self) -> int:
-        val = super().readRegister(_AXP192_ADC_SPEED)[0]
+    def getAdcSamplingRate(self, maxAgeMs=None) -> int:
+        val = super().readRegisterByte(_AXP192_ADC_SPEED, maxAgeMs)
         return 25 * math.pow(2, (val & 0xC0) >> 6)
 
-    def getCoulombData(self) -> float:
-        charge = self.getBattChargeCoulomb()
-        discharge = self.getBattDischargeCoulomb()
-        rate = self.getAdcSamplingRate()
+    def getCoulombData(self, maxAgeMs=None) -> float:
+        charge = self.getBattChargeCoulomb(maxAgeMs)
+        discharge = self.getBattDischargeCoulomb(maxAgeMs)
+        rate = self.getAdcSamplingRate(maxAgeMs)
         return 65536.0 * 0.5 * (charge - discharge) / 3600.0 / rate
 
     # GPIO control functions
-    def getBatteryChargeCurrent(self) -> float:
+    def getBatteryChargeCurrent(self, maxAgeMs=None) -> float:
         return super().readRegisterH8L5(
             _AXP192_BAT_AVERCHGCUR_H8,
-            _AXP192_BAT_AVERCHGCUR_L5
+            _AXP192_BAT_AVERCHGCUR_L5, maxAgeMs
         ) * _AXP192_BATT_CHARGE_CUR_STEP
 
-    def getGpio0Voltage(self) -> int:
-        return super().readRegisterH8L4(_AXP192_GPIO0_VOL_ADC_H8, _AXP192_GPIO0_VOL_ADC_L4) * _AXP192_GPIO0_STEP * 1000
+    def getGpio0Voltage(self, maxAgeMs=None) -> int:
+        return super().readRegisterH8L4(_AXP192_GPIO0_VOL_ADC_H8, _AXP192_GPIO0_VOL_ADC_L4, maxAgeMs) * _AXP192_GPIO0_STEP * 1000
 
-    def getGpio1Voltage(self) -> int:
-        return super().readRegisterH8L4(_AXP192_GPIO1_VOL_ADC_H8, _AXP192_GPIO1_VOL_ADC_L4) * _AXP192_GPIO1_STEP * 1000
+    def getGpio1Voltage(self, maxAgeMs=None) -> int:
+        return super().readRegisterH8L4(_AXP192_GPIO1_VOL_ADC_H8, _AXP192_GPIO1_VOL_ADC_L4, maxAgeMs) * _AXP192_GPIO1_STEP * 1000
 
     def pwmSetup(self, channel: int,  freq: int, duty: int) -> None:
         #  PWM输出频率 = 2.25MHz / (X+1) / Y1
@@ -1315,18 +1389,18 @@ class AXP192(I2CInterface):
 
     def pwmEnable(self, channel) -> None:
         if channel == 0:
-            val = super().readRegister(_AXP192_GPIO1_CTL)[0] & 0xF8
+            val = super().readRegisterByte(_AXP192_GPIO1_CTL) & 0xF8
             super().writeRegister(_AXP192_GPIO1_CTL, val | 0x02)
         elif channel == 1:
-            val = super().readRegister(_AXP192_GPIO2_CTL)[0] & 0xF8
+            val = super().readRegisterByte(_AXP192_GPIO2_CTL) & 0xF8
             super().writeRegister(_AXP192_GPIO2_CTL, val | 0x02)
 
-    def getBatteryPercent(self) -> int:
-        if not self.isBatteryConnect():
+    def getBatteryPercent(self, maxAgeMs=None) -> int:
+        if not self.isBatteryConnect(maxAgeMs):
             return -1
         table = [3000, 3650, 3700, 3740, 3760, 3795,
                  3840, 3910, 3980, 4070, 4150]
-        voltage = self.getBattVoltage()
+        voltage = self.getBattVoltage(maxAgeMs)
         if voltage < table[0]:
             return 0
         for i in range(11):
@@ -1335,7 +1409,7 @@ class AXP192(I2CInterface):
         return 100
 
     def getChipID(self) -> int:
-        return super().readRegister(_AXP192_IC_TYPE)[0]
+        return super().readRegisterByte(_AXP192_IC_TYPE)
 
     # GPIO setting
 
@@ -1353,10 +1427,10 @@ class AXP192(I2CInterface):
             if mode == self.INPUT or mode == self.INPUT_PULLDOWN:
                 if self.gpio[pin].mode != self.INPUT:
                     self.gpio[pin].mode = self.INPUT
-                val = super().readRegister(_AXP192_GPIO0_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO0_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO0_CTL, val | 0x01)
                 # Set pull-down mode
-                val = super().readRegister(_AXP192_GPIO012_PULLDOWN)[0] & 0xFE
+                val = super().readRegisterByte(_AXP192_GPIO012_PULLDOWN) & 0xFE
                 if mode == self.INPUT_PULLDOWN:
                     super().writeRegister(_AXP192_GPIO012_PULLDOWN, val | 0x01)
                 else:
@@ -1375,10 +1449,10 @@ class AXP192(I2CInterface):
             if mode == self.INPUT or mode == self.INPUT_PULLDOWN:
                 if self.gpio[pin].mode != self.INPUT:
                     self.gpio[pin].mode = self.INPUT
-                val = super().readRegister(_AXP192_GPIO1_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO1_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO1_CTL, val | 0x01)
                 # Set pull-down mode
-                val = super().readRegister(_AXP192_GPIO012_PULLDOWN)[0] & 0xFD
+                val = super().readRegisterByte(_AXP192_GPIO012_PULLDOWN) & 0xFD
                 if mode == self.INPUT_PULLDOWN:
                     super().writeRegister(_AXP192_GPIO012_PULLDOWN, val | 0x02)
                 else:
@@ -1397,11 +1471,11 @@ class AXP192(I2CInterface):
             if mode == self.INPUT or mode == self.INPUT_PULLDOWN:
                 if self.gpio[pin].mode != self.INPUT:
                     self.gpio[pin].mode = self.INPUT
-                val = super().readRegister(_AXP192_GPIO2_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO2_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO2_CTL, val | 0x01)
 
                 # Set pull-down mode
-                val = super().readRegister(_AXP192_GPIO012_PULLDOWN)[0] & 0xFB
+                val = super().readRegisterByte(_AXP192_GPIO012_PULLDOWN) & 0xFB
                 if mode == self.INPUT_PULLDOWN:
                     super().writeRegister(_AXP192_GPIO012_PULLDOWN, val | 0x04)
                 else:
@@ -1416,7 +1490,7 @@ class AXP192(I2CInterface):
             if mode == self.INPUT:
                 if self.gpio[pin].mode != self.INPUT:
                     self.gpio[pin].mode = self.INPUT
-                val = super().readRegister(_AXP192_GPIO34_CTL)[0] & 0xFC
+                val = super().readRegisterByte(_AXP192_GPIO34_CTL) & 0xFC
                 super().writeRegister(_AXP192_GPIO34_CTL, val | 0x82)
 
         elif pin == self.PMU_GPIO4:
@@ -1429,7 +1503,7 @@ class AXP192(I2CInterface):
             if mode == self.INPUT:
                 if self.gpio[pin].mode != self.INPUT:
                     self.gpio[pin].mode = self.INPUT
-                val = super().readRegister(_AXP192_GPIO34_CTL)[0] & 0xF3
+                val = super().readRegisterByte(_AXP192_GPIO34_CTL) & 0xF3
                 super().writeRegister(_AXP192_GPIO34_CTL, val | 0x88)
 
         elif pin == self.PMU_GPIO5:
@@ -1437,7 +1511,7 @@ class AXP192(I2CInterface):
                 if self.gpio[pin].mode != self.INPUT:
                     self.gpio[pin].mode = self.INPUT
 
-                val = super().readRegister(_AXP192_GPIO5_CTL)[0] & 0xBF
+                val = super().readRegisterByte(_AXP192_GPIO5_CTL) & 0xBF
                 super().writeRegister(_AXP192_GPIO5_CTL, val | 0x40)
         else:
             print('gpio is invalid')
@@ -1463,7 +1537,7 @@ class AXP192(I2CInterface):
         if pin == self.PMU_GPIO0:
             if self.gpio[pin].mode != self.OUTPUT:
                 self.gpio[pin].mode = self.OUTPUT
-            reg = super().readRegister(_AXP192_GPIO0_CTL)[0] & 0xF8
+            reg = super().readRegisterByte(_AXP192_GPIO0_CTL) & 0xF8
             val = (reg, (reg | 0x05))[val]
             print(bin(val))
             super().writeRegister(_AXP192_GPIO0_CTL,  val)
@@ -1471,44 +1545,44 @@ class AXP192(I2CInterface):
         elif pin == self.PMU_GPIO1:
             if self.gpio[pin].mode != self.OUTPUT:
                 self.gpio[pin].mode = self.OUTPUT
-            reg = super().readRegister(_AXP192_GPIO1_CTL)[0] & 0xF8
+            reg = super().readRegisterByte(_AXP192_GPIO1_CTL) & 0xF8
             val = (reg, (reg | 0x05))[val]
             super().writeRegister(_AXP192_GPIO1_CTL,  val)
 
         elif pin == self.PMU_GPIO2:
             if self.gpio[pin].mode != self.OUTPUT:
                 self.gpio[pin].mode = self.OUTPUT
-            reg = super().readRegister(_AXP192_GPIO2_CTL)[0] & 0xF8
+            reg = super().readRegisterByte(_AXP192_GPIO2_CTL) & 0xF8
             val = (reg, (reg | 0x05))[val]
             super().writeRegister(_AXP192_GPIO2_CTL,  val)
 
         elif pin == self.PMU_GPIO3:
             if self.gpio[pin].mode != self.OUTPUT:
                 self.gpio[pin].mode = self.OUTPUT
-                reg = super().readRegister(_AXP192_GPIO34_CTL)[0] & 0xFC
+                reg = super().readRegisterByte(_AXP192_GPIO34_CTL) & 0xFC
                 super().writeRegister(_AXP192_GPIO34_CTL,   reg | 0x01)
 
-            reg = super().readRegister(_AXP192_GPIO34_SIGNAL)[0] & 0xF7
+            reg = super().readRegisterByte(_AXP192_GPIO34_SIGNAL) & 0xF7
             val = (reg, (reg | 0x01))[val]
             super().writeRegister(_AXP192_GPIO34_SIGNAL,   val)
 
         elif pin == self.PMU_GPIO4:
             if self.gpio[pin].mode != self.OUTPUT:
                 self.gpio[pin].mode = self.OUTPUT
-                reg = super().readRegister(_AXP192_GPIO34_CTL)[0] & 0xF3
+                reg = super().readRegisterByte(_AXP192_GPIO34_CTL) & 0xF3
                 super().writeRegister(_AXP192_GPIO34_CTL,  reg | 0x04)
 
-            reg = super().readRegister(_AXP192_GPIO34_SIGNAL)[0] & 0xEF
+            reg = super().readRegisterByte(_AXP192_GPIO34_SIGNAL) & 0xEF
             val = (reg, (reg | 0x01))[val]
             super().writeRegister(_AXP192_GPIO34_SIGNAL,   val)
 
         elif pin == self.PMU_GPIO5:
             if self.gpio[pin].mode != self.OUTPUT:
                 self.gpio[pin].mode = self.OUTPUT
-                reg = super().readRegister(_AXP192_GPIO5_CTL)[0] & 0xBF
+                reg = super().readRegisterByte(_AXP192_GPIO5_CTL) & 0xBF
                 super().writeRegister(_AXP192_GPIO5_CTL,  reg)
 
-            reg = super().readRegister(_AXP192_GPIO5_CTL)[0] & 0xDF
+            reg = super().readRegisterByte(_AXP192_GPIO5_CTL) & 0xDF
             val = (reg, (reg | 0x01))[val]
             super().writeRegister(_AXP192_GPIO5_CTL, val)
         else:
@@ -1519,11 +1593,11 @@ class AXP192(I2CInterface):
         if pin == self.PMU_GPIO0:
             if self.gpio[pin].mode != self.ANALOG:
                 #  Enable GPIO ADC Function
-                val = super().readRegister(_AXP192_GPIO0_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO0_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO0_CTL, val | 0x04)
 
                 # Enable ADC2 / GPIO0
-                #  val = super().readRegister(_AXP192_ADC_EN2)[0] | 0x08
+                #  val = super().readRegisterByte(_AXP192_ADC_EN2) | 0x08
                 #  super().writeRegister(_AXP192_ADC_EN2, val )
                 super().setRegisterBit(_AXP192_ADC_EN2, 3)
 
@@ -1536,11 +1610,11 @@ class AXP192(I2CInterface):
         elif pin == self.PMU_GPIO1:
             if self.gpio[pin].mode != self.ANALOG:
                 #  Enable GPIO ADC Function
-                val = super().readRegister(_AXP192_GPIO1_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO1_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO1_CTL, val | 0x04)
 
                 # Enable ADC2 / GPIO1
-                #  val = super().readRegister(_AXP192_ADC_EN2)[0] | 0x04
+                #  val = super().readRegisterByte(_AXP192_ADC_EN2) | 0x04
                 #  super().writeRegister(_AXP192_ADC_EN2, val )
                 super().setRegisterBit(_AXP192_ADC_EN2, 2)
 
@@ -1553,10 +1627,10 @@ class AXP192(I2CInterface):
         elif pin == self.PMU_GPIO2:
             if self.gpio[pin].mode != self.ANALOG:
                 #  Enable GPIO ADC Function
-                val = super().readRegister(_AXP192_GPIO1_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO1_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO1_CTL, val | 0x04)
                 # Enable ADC2 / GPIO1
-                #  val = super().readRegister(_AXP192_ADC_EN2)[0] | 0x02
+                #  val = super().readRegisterByte(_AXP192_ADC_EN2) | 0x02
                 #  super().writeRegister(_AXP192_ADC_EN2, val )
                 super().setRegisterBit(_AXP192_ADC_EN2, 1)
 
@@ -1569,7 +1643,7 @@ class AXP192(I2CInterface):
         elif pin == self.PMU_GPIO3:
             if self.gpio[pin].mode != self.ANALOG:
                 #  Enable GPIO ADC Function
-                val = super().readRegister(_AXP192_GPIO1_CTL)[0] & 0xF8
+                val = super().readRegisterByte(_AXP192_GPIO1_CTL) & 0xF8
                 super().writeRegister(_AXP192_GPIO1_CTL, val | 0x04)
 
                 # Enable ADC2 / GPIO1
@@ -1585,7 +1659,7 @@ class AXP192(I2CInterface):
             if self.gpio[pin].mode != self.ANALOG:
                 #  Enable TS PIN ADC Function
                 super().setRegisterBit(_AXP192_ADC_SPEED, 2)
-                #  val = super().readRegister(_AXP192_ADC_SPEED)[0] & 0xFB
+                #  val = super().readRegisterByte(_AXP192_ADC_SPEED) & 0xFB
                 #  super().writeRegister(_AXP192_ADC_SPEED, val | 0x04)
                 self.gpio[pin].mode = self.ANALOG
 
@@ -1604,31 +1678,31 @@ class AXP192(I2CInterface):
     # @brief Set the PEKEY power-on long press time.
     # @param opt: See xpowers_press_on_time_t enum for details.
     def setPowerKeyPressOnTime(self, opt: int) -> None:
-        val = super().readRegister(_AXP192_POK_SET)[0]
+        val = super().readRegisterByte(_AXP192_POK_SET)
         super().writeRegister(_AXP192_POK_SET, (val & 0x3F) | (opt << 6))
 
     # @brief Get the PEKEY power-on long press time.
     # @retval See xpowers_press_on_time_t enum for details.
 
     def getPowerKeyPressOnTime(self) -> int:
-        val = super().readRegister(_AXP192_POK_SET)[0]
+        val = super().readRegisterByte(_AXP192_POK_SET)
         return (val & 0xC0) >> 6
 
     # @brief Set the PEKEY power-off long press time.
     # @ param opt: See xpowers_press_off_time_t enum for details.
 
     def setPowerKeyPressOffTime(self, opt: int) -> None:
-        val = super().readRegister(_AXP192_POK_SET)[0]
+        val = super().readRegisterByte(_AXP192_POK_SET)
         super().writeRegister(_AXP192_POK_SET, (val & 0xFC) | opt)
 
     # @brief Get the PEKEY power-off long press time.
     # @retval See xpowers_press_off_time_t enum for details.
     def getPowerKeyPressOffTime(self) -> int:
-        val = super().readRegister(_AXP192_POK_SET)[0]
+        val = super().readRegisterByte(_AXP192_POK_SET)
         return (val & 0x03)
 
     def setPowerKeyLongPressOnTime(self, opt: int) -> None:
-        val = super().readRegister(_AXP192_POK_SET)[0]
+        val = super().readRegisterByte(_AXP192_POK_SET)
         super().writeRegister(_AXP192_POK_SET, (val & 0xCF) | (opt << 4))
 
     def enablePowerKeyLongPressPowerOff(self) -> None:
@@ -1640,45 +1714,17 @@ class AXP192(I2CInterface):
     # Interrupt control functions
     def _setInterruptImpl(self, opts: int, enable: bool) -> None:
         # log_d("%s %s - 0x%llx\n", __func__, enable ? "ENABLE": "DISABLE", opts)
-        if opts & 0xFF:
-            value = opts & 0xFF
-            data = super().readRegister(_AXP192_INTEN1)[0]
-            self.intRegister[0] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP192_INTEN1, self.intRegister[0])
-
-        if opts & 0xFF00:
-            value = opts >> 8
-            data = super().readRegister(_AXP192_INTEN2)[0]
-            self.intRegister[1] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP192_INTEN2, self.intRegister[1])
-
-        if opts & 0xFF0000:
-            value = opts >> 16
-            data = super().readRegister(_AXP192_INTEN3)[0]
-            self.intRegister[2] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP192_INTEN3, self.intRegister[2])
-
-        if opts & 0xFF000000:
-            value = opts >> 24
-            data = super().readRegister(_AXP192_INTEN4)[0]
-            self.intRegister[3] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP192_INTEN4, self.intRegister[3])
-
-        if opts & 0xFF00000000:
-            value = opts >> 32
-            data = super().readRegister(_AXP192_INTEN5)[0]
-            self.intRegister[4] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP192_INTEN5, self.intRegister[4])
+        super()._updateIrqEnable(opts, enable)
 
     # Signal Capture control functions
     def _setSignalCaptureImpl(self, opts: int,  enable: bool) -> None:
         if opts & 0xFF:
-            value = super().readRegister(_AXP192_ADC_EN1)[0]
+            value = super().readRegisterByte(_AXP192_ADC_EN1)
             value = ((value & (~opts)), (value | opts))[enable]
             super().writeRegister(_AXP192_ADC_EN1, value)
 
         if opts & 0xFF00:
             opts >>= 8
-            value = super().readRegister(_AXP192_ADC_EN2)[0]
+            value = super().readRegisterByte(_AXP192_ADC_EN2)
             value = ((value & (~opts)), (value | opts))[enable]
             super().writeRegister(_AXP192_ADC_EN2, value)
@@ -80,6 +80,7 @@ _AXP2101_INTSTS1 = const(0x48)
 _AXP2101_INTSTS2 = const(0x49)
 _AXP2101_INTSTS3 = const(0x4A)
 _AXP2101_INTSTS_CNT = const(3)
+_AXP2101_IRQ_CLEAR_ALL = b'\xff\xff\xff'
 _AXP2101_TS_PIN_CTRL = const(0x50)
 _AXP2101_TS_HYSL2H_SET = const(0x52)
 _AXP2101_TS_LYSL2H_SET = const(0x53)
@@ -123,6 +124,7 @@ _AXP2101_LDO_VOL7_CTRL = const(0x99)
 _AXP2101_LDO_VOL8_CTRL = const(0x9A)
 _AXP2101_BAT_PARAMS = const(0xA1)
 _AXP2101_FUEL_GAUGE_CTRL = const(0xA2)
+_AXP2101_GAUGE_DATA_SIZE = const(128)
 _AXP2101_BAT_PERCENT_DATA = const(0xA4)
 # DCDC 1~5
 _AXP2101_DCDC1_VOL_MIN = const(1500)
@@ -200,6 +202,28 @@ _AXP2101_DLDO2_VOL_STEPS = const(100)
 
 AXP2101_SLAVE_ADDRESS = const(0x34)
 XPOWERS_AXP2101_CHIP_ID = const(0x4A)
+_AXP2101_ADC_DATA_SIZE = const(10)
+
+
+class AXP2101Telemetry:
+    def __init__(self) -> None:
+        self.status1 = 0
+        self.status2 = 0
+        self.battVoltage = 0
+        self.vbusVoltage = 0
+        self.systemVoltage = 0
+        self.tsValue = 0
+        self.temperature = 0.0
+        self.batteryPercent = -1
+
+    def isBatteryConnect(self) -> bool:
+        return bool(self.status1 & 0x08)
+
+    def isVbusIn(self) -> bool:
+        return not (self.status2 & 0x08) and bool(self.status1 & 0x20)
+
+    def isCharging(self) -> bool:
+        return (self.status2 >> 5) == 0x01
 
 
 class AXP2101(I2CInterface):
@@ -444,6 +468,10 @@ class AXP2101(I2CInterface):
         XPOWERS_AXP2101_VBUS_CUR_LIM_2000MA,
     )
 
+    """DCDC2/3 DVM voltage ramp slope values"""
+    XPOWERS_AXP2101_DVM_RAMP_15_625US = const(0)
+    XPOWERS_AXP2101_DVM_RAMP_31_250US = const(1)
+
     """PMU interrupt control mask values"""
 
     #! IRQ1 REG 40H
@@ -501,10 +529,129 @@ class AXP2101(I2CInterface):
     XPOWERS_AXP2101_WDT_EXPIRE_IRQ = const(1 << 23)
     XPOWERS_AXP2101_ALL_IRQ = const(0xFFFFFFFF)
 
+    """Registers never served from the register shadow cache"""
+    _VOLATILE_REGISTERS = (
+        _AXP2101_STATUS1,
+        _AXP2101_STATUS2,
+        _AXP2101_COMMON_CONFIG,     # reset / shutdown bits self clear
+        _AXP2101_RESET_FUEL_GAUGE,
+        _AXP2101_WDT_CTRL,          # watchdog clear bit self clears
+        _AXP2101_PWRON_STATUS,
+        _AXP2101_PWROFF_STATUS,
+        _AXP2101_ADC_DATA_RELUST0,
+        _AXP2101_ADC_DATA_RELUST1,
+        _AXP2101_ADC_DATA_RELUST2,
+        _AXP2101_ADC_DATA_RELUST3,
+        _AXP2101_ADC_DATA_RELUST4,
+        _AXP2101_ADC_DATA_RELUST5,
+        _AXP2101_ADC_DATA_RELUST6,
+        _AXP2101_ADC_DATA_RELUST7,
+        _AXP2101_ADC_DATA_RELUST8,
+        _AXP2101_ADC_DATA_RELUST9,
+        _AXP2101_INTSTS1,
+        _AXP2101_INTSTS2,
+        _AXP2101_INTSTS3,
+        _AXP2101_BAT_PARAMS,
+        _AXP2101_BAT_PERCENT_DATA,
+    )
+
+    # Interrupt enable and status registers, byte n of an IRQ mask value
+    # maps to the n-th register of each, see IrqDispatcher.py
+    _IRQ_ENABLE_REGS = (_AXP2101_INTEN1, _AXP2101_INTEN2, _AXP2101_INTEN3)
+    _IRQ_STATUS_REGS = (_AXP2101_INTSTS1, _AXP2101_INTSTS2, _AXP2101_INTSTS3)
+
+    # Power key interrupts: (pressed edge, released edge, short press,
+    # long press), see PowerKey.py
+    _PKEY_IRQS = (XPOWERS_AXP2101_PKEY_NEGATIVE_IRQ, XPOWERS_AXP2101_PKEY_POSITIVE_IRQ, XPOWERS_AXP2101_PKEY_SHORT_IRQ, XPOWERS_AXP2101_PKEY_LONG_IRQ)
+
+    # Registers whose timestamped copies (see setMaxAge()) an interrupt
+    # makes stale: (IRQ mask, registers)
+    _IRQ_AFFECTS = (
+        (XPOWERS_AXP2101_VBUS_INSERT_IRQ | XPOWERS_AXP2101_VBUS_REMOVE_IRQ |
+         XPOWERS_AXP2101_BAT_INSERT_IRQ | XPOWERS_AXP2101_BAT_REMOVE_IRQ |
+         XPOWERS_AXP2101_BAT_CHG_START_IRQ | XPOWERS_AXP2101_BAT_CHG_DONE_IRQ |
+         XPOWERS_AXP2101_CHARGER_TIMER_IRQ | XPOWERS_AXP2101_BAT_OVER_VOL_IRQ |
+         XPOWERS_AXP2101_BATFET_OVER_CURR_IRQ | XPOWERS_AXP2101_DIE_OVER_TEMP_IRQ |
+         XPOWERS_AXP2101_BAT_CHG_UNDER_TEMP_IRQ | XPOWERS_AXP2101_BAT_CHG_OVER_TEMP_IRQ,
+         (_AXP2101_STATUS1, _AXP2101_STATUS2)),
+        (XPOWERS_AXP2101_VBUS_INSERT_IRQ | XPOWERS_AXP2101_VBUS_REMOVE_IRQ,
+         (_AXP2101_ADC_DATA_RELUST4, _AXP2101_ADC_DATA_RELUST5)),
+        (XPOWERS_AXP2101_BAT_INSERT_IRQ | XPOWERS_AXP2101_BAT_REMOVE_IRQ |
+         XPOWERS_AXP2101_GAUGE_NEW_SOC_IRQ | XPOWERS_AXP2101_WARNING_LEVEL1_IRQ |
+         XPOWERS_AXP2101_WARNING_LEVEL2_IRQ,
+         (_AXP2101_ADC_DATA_RELUST0, _AXP2101_ADC_DATA_RELUST1, _AXP2101_BAT_PERCENT_DATA)),
+    )
+
+    # Regulator outputs, see Rail.py.  name: (enable register, enable mask,
+    # enable value, voltage register, voltage mask, voltage shift, flags,
+    # ((min mV, max mV, step mV, first code), ...)), flags 1 keeps the
+    # register bits outside the voltage mask on writes, 2 marks the rails
+    # with hardware DVM
+    _RAILS = {
+        'DC1': (_AXP2101_DC_ONOFF_DVM_CTRL, 0x01, 0x01, _AXP2101_DC_VOL0_CTRL, 0x1F, 0, 0,
+                ((_AXP2101_DCDC1_VOL_MIN, _AXP2101_DCDC1_VOL_MAX, _AXP2101_DCDC1_VOL_STEPS, 0),)),
+        'DC2': (_AXP2101_DC_ONOFF_DVM_CTRL, 0x02, 0x02, _AXP2101_DC_VOL1_CTRL, 0x7F, 0, 3,
+                ((_AXP2101_DCDC2_VOL1_MIN, _AXP2101_DCDC2_VOL1_MAX, _AXP2101_DCDC2_VOL_STEPS1, _AXP2101_DCDC2_VOL_STEPS1_BASE),
+                 (_AXP2101_DCDC2_VOL2_MIN, _AXP2101_DCDC2_VOL2_MAX, _AXP2101_DCDC2_VOL_STEPS2, _AXP2101_DCDC2_VOL_STEPS2_BASE))),
+        'DC3': (_AXP2101_DC_ONOFF_DVM_CTRL, 0x04, 0x04, _AXP2101_DC_VOL2_CTRL, 0x7F, 0, 3,
+                ((_AXP2101_DCDC3_VOL1_MIN, _AXP2101_DCDC3_VOL1_MAX, _AXP2101_DCDC3_VOL_STEPS1, _AXP2101_DCDC3_VOL_STEPS1_BASE),
+                 (_AXP2101_DCDC3_VOL2_MIN, _AXP2101_DCDC3_VOL2_MAX, _AXP2101_DCDC3_VOL_STEPS2, _AXP2101_DCDC3_VOL_STEPS2_BASE),
+                 (_AXP2101_DCDC3_VOL3_MIN, _AXP2101_DCDC3_VOL3_MAX, _AXP2101_DCDC3_VOL_STEPS3, _AXP2101_DCDC3_VOL_STEPS3_BASE))),
+        'DC4': (_AXP2101_DC_ONOFF_DVM_CTRL, 0x08, 0x08, _AXP2101_DC_VOL3_CTRL, 0x7F, 0, 1,
+                ((_AXP2101_DCDC4_VOL1_MIN, _AXP2101_DCDC4_VOL1_MAX, _AXP2101_DCDC4_VOL_STEPS1, _AXP2101_DCDC4_VOL_STEPS1_BASE),
+                 (_AXP2101_DCDC4_VOL2_MIN, _AXP2101_DCDC4_VOL2_MAX, _AXP2101_DCDC4_VOL_STEPS2, _AXP2101_DCDC4_VOL_STEPS2_BASE))),
+        'DC5': (_AXP2101_DC_ONOFF_DVM_CTRL, 0x10, 0x10, _AXP2101_DC_VOL4_CTRL, 0x1F, 0, 1,
+                ((_AXP2101_DCDC5_VOL_MIN, _AXP2101_DCDC5_VOL_MAX, _AXP2101_DCDC5_VOL_STEPS, 0),
+                 (_AXP2101_DCDC5_VOL_1200MV, _AXP2101_DCDC5_VOL_1200MV, _AXP2101_DCDC5_VOL_STEPS, _AXP2101_DCDC5_VOL_VAL))),
+        'ALDO1': (_AXP2101_LDO_ONOFF_CTRL0, 0x01, 0x01, _AXP2101_LDO_VOL0_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_ALDO1_VOL_MIN, _AXP2101_ALDO1_VOL_MAX, _AXP2101_ALDO1_VOL_STEPS, 0),)),
+        'ALDO2': (_AXP2101_LDO_ONOFF_CTRL0, 0x02, 0x02, _AXP2101_LDO_VOL1_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_ALDO2_VOL_MIN, _AXP2101_ALDO2_VOL_MAX, _AXP2101_ALDO2_VOL_STEPS, 0),)),
+        'ALDO3': (_AXP2101_LDO_ONOFF_CTRL0, 0x04, 0x04, _AXP2101_LDO_VOL2_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_ALDO3_VOL_MIN, _AXP2101_ALDO3_VOL_MAX, _AXP2101_ALDO3_VOL_STEPS, 0),)),
+        'ALDO4': (_AXP2101_LDO_ONOFF_CTRL0, 0x08, 0x08, _AXP2101_LDO_VOL3_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_ALDO4_VOL_MIN, _AXP2101_ALDO4_VOL_MAX, _AXP2101_ALDO4_VOL_STEPS, 0),)),
+        'BLDO1': (_AXP2101_LDO_ONOFF_CTRL0, 0x10, 0x10, _AXP2101_LDO_VOL4_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_BLDO1_VOL_MIN, _AXP2101_BLDO1_VOL_MAX, _AXP2101_BLDO1_VOL_STEPS, 0),)),
+        'BLDO2': (_AXP2101_LDO_ONOFF_CTRL0, 0x20, 0x20, _AXP2101_LDO_VOL5_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_BLDO2_VOL_MIN, _AXP2101_BLDO2_VOL_MAX, _AXP2101_BLDO2_VOL_STEPS, 0),)),
+        'CPUSLDO': (_AXP2101_LDO_ONOFF_CTRL0, 0x40, 0x40, _AXP2101_LDO_VOL6_CTRL, 0x1F, 0, 1,
+                    ((_AXP2101_CPUSLDO_VOL_MIN, _AXP2101_CPUSLDO_VOL_MAX, _AXP2101_CPUSLDO_VOL_STEPS, 0),)),
+        'DLDO1': (_AXP2101_LDO_ONOFF_CTRL0, 0x80, 0x80, _AXP2101_LDO_VOL7_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_DLDO1_VOL_MIN, _AXP2101_DLDO1_VOL_MAX, _AXP2101_DLDO1_VOL_STEPS, 0),)),
+        'DLDO2': (_AXP2101_LDO_ONOFF_CTRL1, 0x01, 0x01, _AXP2101_LDO_VOL8_CTRL, 0x1F, 0, 1,
+                  ((_AXP2101_DLDO2_VOL_MIN, _AXP2101_DLDO2_VOL_MAX, _AXP2101_DLDO2_VOL_STEPS, 0),)),
+    }
+
+    # Values for readFields(), see ReadPlan.py.  name: (registers, kind,
+    # a, b), kind 0: (register & a) >> b, 3: 14 bit / 4: 13 bit reading
+    # times a plus b, 5: little endian mask, 7: every register & a[n]
+    # equals b[n]
+    _FIELDS = {
+        'status1': ((_AXP2101_STATUS1,), 0, 0xFF, 0),
+        'status2': ((_AXP2101_STATUS2,), 0, 0xFF, 0),
+        'vbusIn': ((_AXP2101_STATUS1, _AXP2101_STATUS2), 7, (0x20, 0x08), (0x20, 0x00)),
+        'batteryConnected': ((_AXP2101_STATUS1,), 0, 0x08, 3),
+        'charging': ((_AXP2101_STATUS2,), 7, (0xE0,), (0x20,)),
+        'chargerStatus': ((_AXP2101_STATUS2,), 0, 0x07, 0),
+        'battVoltage': ((_AXP2101_ADC_DATA_RELUST0, _AXP2101_ADC_DATA_RELUST1), 4, 1, 0),
+        'tsValue': ((_AXP2101_ADC_DATA_RELUST2, _AXP2101_ADC_DATA_RELUST3), 3, 1, 0),
+        'vbusVoltage': ((_AXP2101_ADC_DATA_RELUST4, _AXP2101_ADC_DATA_RELUST5), 3, 1, 0),
+        'systemVoltage': ((_AXP2101_ADC_DATA_RELUST6, _AXP2101_ADC_DATA_RELUST7), 3, 1, 0),
+        'temperature': ((_AXP2101_ADC_DATA_RELUST8, _AXP2101_ADC_DATA_RELUST9), 3, -0.05, 385.7),
+        'irqStatus': ((_AXP2101_INTSTS1, _AXP2101_INTSTS2, _AXP2101_INTSTS3), 5, 1, 0),
+        'batteryPercent': ((_AXP2101_BAT_PERCENT_DATA,), 0, 0xFF, 0),
+    }
+    _PORT_REGISTERS = (_AXP2101_BAT_PARAMS,)
+
+    # Fields of readTelemetry(), in the order it decodes them
+    _TELEMETRY_FIELDS = ('status1', 'status2', 'battVoltage', 'tsValue', 'vbusVoltage',
+                         'systemVoltage', 'temperature', 'batteryPercent')
+
     def __init__(self, i2c_bus: I2C, addr: int = AXP2101_SLAVE_ADDRESS) -> None:
         super().__init__(i2c_bus, addr)
         print('AXP2101 __init__')
-        self.statusRegister = [0] * _AXP2101_INTSTS_CNT
+        self.statusRegister = bytearray(_AXP2101_INTSTS_CNT)
         self.intRegister = [0] * _AXP2101_INTSTS_CNT
 
         if self.getChipID() != XPOWERS_AXP2101_CHIP_ID:
@@ -513,45 +660,45 @@ class AXP2101(I2CInterface):
             )
 
     #  PMU status functions
-    def isVbusGood(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS1, 5))
+    def isVbusGood(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_STATUS1, 5, maxAgeMs))
 
-    def getBatfetState(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS1, 4))
+    def getBatfetState(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_STATUS1, 4, maxAgeMs))
 
     # getBatPresentState
-    def isBatteryConnect(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS1, 3))
+    def isBatteryConnect(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_STATUS1, 3, maxAgeMs))
 
-    def isBatInActiveModeState(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS1, 2))
+    def isBatInActiveModeState(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_STATUS1, 2, maxAgeMs))
 
-    def getThermalRegulationStatus(self) -> bool:
-        return super().getRegisterBit(_AXP2101_STATUS1, 1)
+    def getThermalRegulationStatus(self, maxAgeMs=None) -> bool:
+        return super().getRegisterBit(_AXP2101_STATUS1, 1, maxAgeMs)
 
-    def getCurrentLimitStatus(self) -> bool:
-        return super().getRegisterBit(_AXP2101_STATUS1, 0)
+    def getCurrentLimitStatus(self, maxAgeMs=None) -> bool:
+        return super().getRegisterBit(_AXP2101_STATUS1, 0, maxAgeMs)
 
-    def isCharging(self) -> bool:
-        return (super().readRegister(_AXP2101_STATUS2)[0] >> 5) == 0x01
+    def isCharging(self, maxAgeMs=None) -> bool:
+        return (super().readRegisterByte(_AXP2101_STATUS2, maxAgeMs) >> 5) == 0x01
 
-    def isDischarge(self) -> bool:
-        return (super().readRegister(_AXP2101_STATUS2)[0] >> 5) == 0x02
+    def isDischarge(self, maxAgeMs=None) -> bool:
+        return (super().readRegisterByte(_AXP2101_STATUS2, maxAgeMs) >> 5) == 0x02
 
-    def isStandby(self) -> bool:
-        return (super().readRegister(_AXP2101_STATUS2)[0] >> 5) == 0x00
+    def isStandby(self, maxAgeMs=None) -> bool:
+        return (super().readRegisterByte(_AXP2101_STATUS2, maxAgeMs) >> 5) == 0x00
 
-    def isPowerOn(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS2, 4))
+    def isPowerOn(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_STATUS2, 4, maxAgeMs))
 
-    def isPowerOff(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS2, 4))
+    def isPowerOff(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_STATUS2, 4, maxAgeMs))
 
-    def isVbusIn(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_STATUS2, 3) == 0)
+    def isVbusIn(self, maxAgeMs=None) -> bool:
+        return super().getRegisterBit(_AXP2101_STATUS2, 3, maxAgeMs) == 0 and self.isVbusGood(maxAgeMs)
 
-    def getChargerStatus(self) -> None:
-        return super().readRegister(_AXP2101_STATUS2)[0] & 0x07
+    def getChargerStatus(self, maxAgeMs=None) -> None:
+        return super().readRegisterByte(_AXP2101_STATUS2, maxAgeMs) & 0x07
 
     # Data Buffer
     def writeDataBuffer(self, data: list,  size: int) -> None:
@@ -605,12 +752,12 @@ class AXP2101(I2CInterface):
     def setDieOverTempLevel1(self, opt: int) -> None:
         if not 0 <= opt <= 3:
             raise ValueError("level must be a value within 0-3!")
-        val = super().readRegister(_AXP2101_DIE_TEMP_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_DIE_TEMP_CTRL)
         val &= 0xF9
         super().writeRegister(_AXP2101_DIE_TEMP_CTRL, val | (opt << 1))
 
     def getDieOverTempLevel1(self) -> int:
-        return (super().readRegister(_AXP2101_DIE_TEMP_CTRL)[0] & 0x06)
+        return (super().readRegisterByte(_AXP2101_DIE_TEMP_CTRL) & 0x06)
 
     def enableDieOverTempDetect(self) -> None:
         super().setRegisterBit(_AXP2101_DIE_TEMP_CTRL, 0)
@@ -621,36 +768,36 @@ class AXP2101(I2CInterface):
     # Linear Charger Vsys voltage dpm
     def setLinearChargerVsysDpm(self, opt: int) -> None:
         # todo:
-        val = super().readRegister(_AXP2101_MIN_SYS_VOL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_MIN_SYS_VOL_CTRL)
         val &= 0x8F
         super().writeRegister(_AXP2101_MIN_SYS_VOL_CTRL, val | (opt << 4))
 
     def getLinearChargerVsysDpm(self) -> int:
-        val = super().readRegister(_AXP2101_MIN_SYS_VOL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_MIN_SYS_VOL_CTRL)
         val &= 0x70
         return (val & 0x70) >> 4
 
     # Set the minimum common working voltage of the PMU VBUS input,
     # below this value will turn off the PMU
     def setVbusVoltageLimit(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_INPUT_VOL_LIMIT_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_INPUT_VOL_LIMIT_CTRL)
         val &= 0xF0
         super().writeRegister(_AXP2101_INPUT_VOL_LIMIT_CTRL, val | (opt & 0x0F))
 
     def getVbusVoltageLimit(self) -> int:
-        return (super().readRegister(_AXP2101_INPUT_VOL_LIMIT_CTRL)[0] & 0x0F)
+        return (super().readRegisterByte(_AXP2101_INPUT_VOL_LIMIT_CTRL) & 0x0F)
 
     # @brief  Set VBUS Current Input Limit.
     # @param   opt: View the related chip type _axp2101_vbus_cur_limit_t enumeration parameters in "Params.hpp"
     def setVbusCurrentLimit(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_INPUT_CUR_LIMIT_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_INPUT_CUR_LIMIT_CTRL)
         val &= 0xF8
         super().writeRegister(_AXP2101_INPUT_CUR_LIMIT_CTRL, val | (opt & 0x07))
 
      # @brief  Get VBUS Current Input Limit.
      # @retval View the related chip type _axp2101_vbus_cur_limit_t enumeration parameters in "Params.hpp"
     def getVbusCurrentLimit(self) -> int:
-        return (super().readRegister(_AXP2101_INPUT_CUR_LIMIT_CTRL)[0] & 0x07)
+        return (super().readRegisterByte(_AXP2101_INPUT_CUR_LIMIT_CTRL) & 0x07)
 
     # @brief  Button Battery charge
     def enableButtonBatteryCharge(self) -> None:
@@ -673,13 +820,13 @@ class AXP2101(I2CInterface):
         elif (millivolt > _AXP2101_BTN_VOL_MAX):
             raise ValueError("Mistake ! The minimum charge termination voltage of the coin cell battery is %u mV" %
                              _AXP2101_BTN_VOL_MAX)
-        val = super().readRegister(_AXP2101_BTN_BAT_CHG_VOL_SET)[0]
+        val = super().readRegisterByte(_AXP2101_BTN_BAT_CHG_VOL_SET)
         val &= 0xF8
         val |= (int)((millivolt - _AXP2101_BTN_VOL_MIN) /  _AXP2101_BTN_VOL_STEPS)
         super().writeRegister(_AXP2101_BTN_BAT_CHG_VOL_SET, val)
 
     def getButtonBatteryVoltage(self) -> int:
-        val = super().readRegister(_AXP2101_BTN_BAT_CHG_VOL_SET)[0]
+        val = super().readRegisterByte(_AXP2101_BTN_BAT_CHG_VOL_SET)
         return (val & 0x07) * _AXP2101_BTN_VOL_STEPS + _AXP2101_BTN_VOL_MIN
 
     # @brief Cell Battery charge
@@ -704,12 +851,12 @@ class AXP2101(I2CInterface):
         if not 0 <= opt <= 3:
             raise ValueError(
                 "Watchdog Config optrion must be a value within 0-3!")
-        val = super().readRegister(_AXP2101_WDT_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_WDT_CTRL)
         val &= 0xCF
         super().writeRegister(_AXP2101_WDT_CTRL, val | (opt << 4))
 
     def getWatchConfig(self) -> int:
-        return (super().readRegister(_AXP2101_WDT_CTRL)[0] & 0x30) >> 4
+        return (super().readRegisterByte(_AXP2101_WDT_CTRL) & 0x30) >> 4
 
     def clrWatchdog(self) -> None:
         super().setRegisterBit(_AXP2101_WDT_CTRL, 3)
@@ -718,98 +865,98 @@ class AXP2101(I2CInterface):
         if not 0 < opt <= 7:
             raise ValueError(
                 "Watchdog timeout must be a value within 0-7!")
-        val = super().readRegister(_AXP2101_WDT_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_WDT_CTRL)
         val &= 0xF8
         super().writeRegister(_AXP2101_WDT_CTRL, val | opt)
 
     def getWatchdogTimerout(self) -> int:
-        return super().readRegister(_AXP2101_WDT_CTRL)[0] & 0x07
+        return super().readRegisterByte(_AXP2101_WDT_CTRL) & 0x07
 
     # @brief Low battery warning threshold 5-20%, 1% per step
     def setLowBatWarnThreshold(self, opt: int) -> None:
         if opt < 5 or opt > 20:
             return
-        val = super().readRegister(_AXP2101_LOW_BAT_WARN_SET)[0]
+        val = super().readRegisterByte(_AXP2101_LOW_BAT_WARN_SET)
         val &= 0x0F
         super().writeRegister(_AXP2101_LOW_BAT_WARN_SET, val | ((opt - 5) << 4))
 
     def getLowBatWarnThreshold(self) -> int:
-        return ((super().readRegister(_AXP2101_LOW_BAT_WARN_SET)[0] & 0xF0) >> 4) + 5
+        return ((super().readRegisterByte(_AXP2101_LOW_BAT_WARN_SET) & 0xF0) >> 4) + 5
 
     # @brief Low battery shutdown threshold 0-15%, 1% per step
     def setLowBatShutdownThreshold(self, opt: int) -> None:
         if opt > 15:
             opt = 15
-        val = super().readRegister(_AXP2101_LOW_BAT_WARN_SET)[0]
+        val = super().readRegisterByte(_AXP2101_LOW_BAT_WARN_SET)
         val &= 0xF0
         super().writeRegister(_AXP2101_LOW_BAT_WARN_SET, val | opt)
 
     def getLowBatShutdownThreshold(self) -> int:
-        return (super().readRegister(_AXP2101_LOW_BAT_WARN_SET)[0] & 0x0F)
+        return (super().readRegisterByte(_AXP2101_LOW_BAT_WARN_SET) & 0x0F)
 
     #!  PWRON statu  20
     # POWERON always high when EN Mode as POWERON Source
-    def isPoweronAlwaysHighSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 5))
+    def isPoweronAlwaysHighSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 5, maxAgeMs))
 
     # Battery Insert and Good as POWERON Source
-    def isBattInsertOnSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 4))
+    def isBattInsertOnSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 4, maxAgeMs))
 
     # Battery Voltage > 3.3V when Charged as Source
-    def isBattNormalOnSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 3))
+    def isBattNormalOnSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 3, maxAgeMs))
 
     # Vbus Insert and Good as POWERON Source
-    def isVbusInsertOnSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 2))
+    def isVbusInsertOnSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 2, maxAgeMs))
 
     # IRQ PIN Pull-down as POWERON Source
-    def isIrqLowOnSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 1))
+    def isIrqLowOnSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 1, maxAgeMs))
 
     # POWERON low for on level when POWERON Mode as POWERON Source
-    def isPwronLowOnSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 0))
+    def isPwronLowOnSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWRON_STATUS, 0, maxAgeMs))
 
-    def getPowerOnSource(self) -> int:
-        return super().readRegister(_AXP2101_PWRON_STATUS)[0]
+    def getPowerOnSource(self, maxAgeMs=None) -> int:
+        return super().readRegisterByte(_AXP2101_PWRON_STATUS, maxAgeMs)
 
     #!  PWROFF status  21
     # Die Over Temperature as POWEROFF Source
-    def isOverTemperatureOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 7))
+    def isOverTemperatureOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 7, maxAgeMs))
 
     # DCDC Over Voltage as POWEROFF Source
-    def isDcOverVoltageOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 6))
+    def isDcOverVoltageOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 6, maxAgeMs))
 
     # DCDC Under Voltage as POWEROFF Source
-    def isDcUnderVoltageOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 5))
+    def isDcUnderVoltageOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 5, maxAgeMs))
 
     # VBUS Over Voltage as POWEROFF Source
-    def isVbusOverVoltageOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 4))
+    def isVbusOverVoltageOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 4, maxAgeMs))
 
     # Vsys Under Voltage as POWEROFF Source
-    def isVsysUnderVoltageOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 3))
+    def isVsysUnderVoltageOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 3, maxAgeMs))
 
     # POWERON always low when EN Mode as POWEROFF Source
-    def isPwronAlwaysLowOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 2))
+    def isPwronAlwaysLowOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 2, maxAgeMs))
 
     # Software configuration as POWEROFF Source
-    def isSwConfigOffSource(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 1))
+    def isSwConfigOffSource(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 1, maxAgeMs))
 
     # POWERON Pull down for off level when POWERON Mode as POWEROFF Source
-    def isPwrSourcePullDown(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 0))
+    def isPwrSourcePullDown(self, maxAgeMs=None) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_PWROFF_STATUS, 0, maxAgeMs))
 
-    def getPowerOffSource(self) -> int:
-        return super().readRegister(_AXP2101_PWROFF_STATUS)[0]
+    def getPowerOffSource(self, maxAgeMs=None) -> int:
+        return super().readRegisterByte(_AXP2101_PWROFF_STATUS, maxAgeMs)
 
     #!REG 22H
     def enableOverTemperatureLevel2PowerOff(self) -> None:
@@ -886,13 +1033,13 @@ class AXP2101(I2CInterface):
             raise ValueError("Mistake ! The maximum settable voltage of VSYS is %u mV" %
                              _AXP2101_VSYS_VOL_THRESHOLD_MAX)
 
-        val = super().readRegister(_AXP2101_VOFF_SET)[0]
+        val = super().readRegisterByte(_AXP2101_VOFF_SET)
         val &= 0xF8
         super().writeRegister(_AXP2101_VOFF_SET, val | (int)((millivolt -
                                                               _AXP2101_VSYS_VOL_THRESHOLD_MIN) / _AXP2101_VSYS_VOL_THRESHOLD_STEPS))
 
     def getSysPowerDownVoltage(self) -> int:
-        val = super().readRegister(_AXP2101_VOFF_SET)[0]
+        val = super().readRegisterByte(_AXP2101_VOFF_SET)
         return (val & 0x07) * _AXP2101_VSYS_VOL_THRESHOLD_STEPS + _AXP2101_VSYS_VOL_THRESHOLD_MIN
 
     # PWROK setting and PWROFF sequence control 25.
@@ -921,16 +1068,16 @@ class AXP2101(I2CInterface):
 
     # Delay of PWROK after all power output good
     def setPwrOkDelay(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_PWROK_SEQU_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_PWROK_SEQU_CTRL)
         val &= 0xFC
         super().writeRegister(_AXP2101_PWROK_SEQU_CTRL, val | opt)
 
     def getPwrOkDelay(self) -> int:
-        return (super().readRegister(_AXP2101_PWROK_SEQU_CTRL)[0] & 0x03)
+        return (super().readRegisterByte(_AXP2101_PWROK_SEQU_CTRL) & 0x03)
 
     #  Sleep and 26
     def wakeupControl(self, opt: int, enable: bool) -> None:
-        val = super().readRegister(_AXP2101_SLEEP_WAKEUP_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_SLEEP_WAKEUP_CTRL)
         if enable:
             val |= opt
         else:
@@ -955,7 +1102,7 @@ class AXP2101(I2CInterface):
     def setIrqLevel(self, opt: int) -> None:
         if not 0 <= opt <= 3:
             raise ValueError('IRQ level must be a value within 0-3!')
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         val &= 0xFC
         super().writeRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL, val | (opt << 4))
 
@@ -964,7 +1111,7 @@ class AXP2101(I2CInterface):
     def setOffLevel(self, opt: int) -> None:
         if not 0 <= opt <= 3:
             raise ValueError('OFF level must be a value within 0-3!')
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         super().writeRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL, val | (opt << 2))
 
     # @brief  ONLEVEL configuration
@@ -972,157 +1119,157 @@ class AXP2101(I2CInterface):
     def setOnLevel(self, opt: int) -> None:
         if not 0 <= opt <= 3:
             raise ValueError('ON level must be a value within 0-3!')
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         super().writeRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL, val | opt)
 
     # Fast pwron setting 0  28
     # Fast Power On Start Sequence
     def setDc4FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
         super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | ((opt & 0x3) << 6))
 
     def setDc3FastStartSequence(self,  opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
         super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | ((opt & 0x3) << 4))
 
     def setDc2FastStartSequence(self,  opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
         super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | ((opt & 0x3) << 2))
 
     def setDc1FastStartSequence(self,  opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
         super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | (opt & 0x3))
 
     #  Fast pwron setting 1  29
     def setAldo3FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
         super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | ((opt & 0x3) << 6))
 
     def setAldo2FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
         super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | ((opt & 0x3) << 4))
 
     def setAldo1FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
         super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | ((opt & 0x3) << 2))
 
     def setDc5FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
         super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | (opt & 0x3))
 
     #  Fast pwron setting 2  2A
     def setCpuldoFastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
         super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | ((opt & 0x3) << 6))
 
     def setBldo2FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
         super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | ((opt & 0x3) << 4))
 
     def setBldo1FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
         super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | ((opt & 0x3) << 2))
 
     def setAldo4FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
         super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | (opt & 0x3))
 
     #  Fast pwron setting 3  2B
     def setDldo2FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_CTRL)
         super().writeRegister(_AXP2101_FAST_PWRON_CTRL, val | ((opt & 0x3) << 2))
 
     def setDldo1FastStartSequence(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_FAST_PWRON_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_FAST_PWRON_CTRL)
         super().writeRegister(_AXP2101_FAST_PWRON_CTRL, val | (opt & 0x3))
 
     # @brief   Setting Fast Power On Start Sequence
     def setFastPowerOnLevel(self, opt, seq_level) -> None:
         if opt == self.XPOWERSAXP2101_FAST_DCDC1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | seq_level)
         elif opt == self.XPOWERSAXP2101_FAST_DCDC2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | (seq_level << 2))
         elif opt == self.XPOWERSAXP2101_FAST_DCDC3:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | (seq_level << 4))
         elif opt == self.XPOWERSAXP2101_FAST_DCDC4:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val | (seq_level << 6))
         elif opt == self.XPOWERSAXP2101_FAST_DCDC5:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | seq_level)
         elif opt == self.XPOWERSAXP2101_FAST_ALDO1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | (seq_level << 2))
         elif opt == self.XPOWERSAXP2101_FAST_ALDO2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | (seq_level << 4))
         elif opt == self.XPOWERSAXP2101_FAST_ALDO3:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val | (seq_level << 6))
         elif opt == self.XPOWERSAXP2101_FAST_ALDO4:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | seq_level)
         elif opt == self.XPOWERSAXP2101_FAST_BLDO1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | (seq_level << 2))
         elif opt == self.XPOWERSAXP2101_FAST_BLDO2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | (seq_level << 4))
         elif opt == self.XPOWERSAXP2101_FAST_CPUSLDO:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val | (seq_level << 6))
         elif opt == self.XPOWERSAXP2101_FAST_DLDO1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_CTRL)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_CTRL)
             super().writeRegister(_AXP2101_FAST_PWRON_CTRL, val | seq_level)
         elif opt == self.XPOWERSAXP2101_FAST_DLDO2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_CTRL)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_CTRL)
             super().writeRegister(_AXP2101_FAST_PWRON_CTRL, val | (seq_level << 2))
 
     def disableFastPowerOn(self, opt: int) -> None:
         if opt == self.XPOWERSAXP2101_FAST_DCDC1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val & 0xFC)
         elif opt == self.XPOWERSAXP2101_FAST_DCDC2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val & 0xF3)
         elif opt == self.XPOWERSAXP2101_FAST_DCDC3:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val & 0xCF)
         elif opt == self.XPOWERSAXP2101_FAST_DCDC4:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET0)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET0)
             super().writeRegister(_AXP2101_FAST_PWRON_SET0, val & 0x3F)
         elif opt == self.XPOWERSAXP2101_FAST_DCDC5:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val & 0xFC)
         elif opt == self.XPOWERSAXP2101_FAST_ALDO1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val & 0xF3)
         elif opt == self.XPOWERSAXP2101_FAST_ALDO2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val & 0xCF)
         elif opt == self.XPOWERSAXP2101_FAST_ALDO3:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET1)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET1)
             super().writeRegister(_AXP2101_FAST_PWRON_SET1, val & 0x3F)
         elif opt == self.XPOWERSAXP2101_FAST_ALDO4:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val & 0xFC)
         elif opt == self.XPOWERSAXP2101_FAST_BLDO1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val & 0xF3)
         elif opt == self.XPOWERSAXP2101_FAST_BLDO2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val & 0xCF)
         elif opt == self.XPOWERSAXP2101_FAST_CPUSLDO:
-            val = super().readRegister(_AXP2101_FAST_PWRON_SET2)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_SET2)
             super().writeRegister(_AXP2101_FAST_PWRON_SET2, val & 0x3F)
         elif opt == self.XPOWERSAXP2101_FAST_DLDO1:
-            val = super().readRegister(_AXP2101_FAST_PWRON_CTRL)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_CTRL)
             super().writeRegister(_AXP2101_FAST_PWRON_CTRL, val & 0xFC)
         elif opt == self.XPOWERSAXP2101_FAST_DLDO2:
-            val = super().readRegister(_AXP2101_FAST_PWRON_CTRL)[0]
+            val = super().readRegisterByte(_AXP2101_FAST_PWRON_CTRL)
             super().writeRegister(_AXP2101_FAST_PWRON_CTRL, val & 0xF3)
 
     def enableFastPowerOnCtrl(self) -> None:
@@ -1149,7 +1296,7 @@ class AXP2101(I2CInterface):
 
     # DCDCS force PWM control
     def setDcUVPDebounceTime(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_DC_FORCE_PWM_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_DC_FORCE_PWM_CTRL)
         val &= 0xFC
         super().writeRegister(_AXP2101_DC_FORCE_PWM_CTRL, val | opt)
 
@@ -1195,29 +1342,19 @@ class AXP2101(I2CInterface):
 
     # Power control DCDC1 functions
     def isEnableDC1(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 0))
+        return self.rail('DC1').isEnabled()
 
     def enableDC1(self) -> None:
-        super().setRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 0)
+        self.rail('DC1').enable()
 
     def disableDC1(self) -> None:
-        super().clrRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 0)
+        self.rail('DC1').disable()
 
     def setDC1Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_DCDC1_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_DCDC1_VOL_STEPS)
-        if (millivolt < _AXP2101_DCDC1_VOL_MIN):
-            raise ValueError("Mistake ! DC1 minimum voltage is %u mV" %
-                             _AXP2101_DCDC1_VOL_MIN)
-        elif (millivolt > _AXP2101_DCDC1_VOL_MAX):
-            raise ValueError("Mistake ! DC1 maximum voltage is %u mV" %
-                             _AXP2101_DCDC1_VOL_MAX)
-        super().writeRegister(_AXP2101_DC_VOL0_CTRL, (int)((millivolt -
-                                                            _AXP2101_DCDC1_VOL_MIN) / _AXP2101_DCDC1_VOL_STEPS))
+        self.rail('DC1').setVoltage(millivolt)
 
     def getDC1Voltage(self) -> int:
-        return (super().readRegister(_AXP2101_DC_VOL0_CTRL)[0] & 0x1F) * _AXP2101_DCDC1_VOL_STEPS + _AXP2101_DCDC1_VOL_MIN
+        return self.rail('DC1').getVoltage()
 
     # DCDC1 85% low voltage turn off PMIC function
     def setDC1LowVoltagePowerDown(self, en):
@@ -1231,37 +1368,19 @@ class AXP2101(I2CInterface):
 
     # Power control DCDC2 functions
     def isEnableDC2(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 1))
+        return self.rail('DC2').isEnabled()
 
     def enableDC2(self) -> None:
-        super().setRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 1)
+        self.rail('DC2').enable()
 
     def disableDC2(self) -> None:
-        super().clrRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 1)
+        self.rail('DC2').disable()
 
     def setDC2Voltage(self, millivolt: int) -> None:
-        val = super().readRegister(_AXP2101_DC_VOL1_CTRL)[0]
-        val &= 0x80
-        if (millivolt >= _AXP2101_DCDC2_VOL1_MIN and millivolt <= _AXP2101_DCDC2_VOL1_MAX):
-            if (millivolt % _AXP2101_DCDC2_VOL_STEPS1):
-                raise ValueError("Mistake !  The steps is must %umV" %
-                                 _AXP2101_DCDC2_VOL_STEPS1)
-            super().writeRegister(_AXP2101_DC_VOL1_CTRL, val | (int)((millivolt -
-                                                                      _AXP2101_DCDC2_VOL1_MIN) / _AXP2101_DCDC2_VOL_STEPS1))
-        elif (millivolt >= _AXP2101_DCDC2_VOL2_MIN and millivolt <= _AXP2101_DCDC2_VOL2_MAX):
-            if (millivolt % _AXP2101_DCDC2_VOL_STEPS2):
-                raise ValueError("Mistake !  The steps is must %umV" %
-                                 _AXP2101_DCDC2_VOL_STEPS2)
-            val |= (int)((((millivolt - _AXP2101_DCDC2_VOL2_MIN) /
-                          _AXP2101_DCDC2_VOL_STEPS2) + _AXP2101_DCDC2_VOL_STEPS2_BASE))
-            super().writeRegister(_AXP2101_DC_VOL1_CTRL, val)
+        self.rail('DC2').setVoltage(millivolt)
 
     def getDC2Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_DC_VOL1_CTRL)[0]
-        val &= 0x7F
-        if (val < _AXP2101_DCDC2_VOL_STEPS2_BASE):
-            return (val * _AXP2101_DCDC2_VOL_STEPS1) + _AXP2101_DCDC2_VOL1_MIN
-        return (val * _AXP2101_DCDC2_VOL_STEPS2) - 200
+        return self.rail('DC2').getVoltage()
 
     def getDC2WorkMode(self) -> int:
         return super().getRegisterBit(_AXP2101_DCDC2_VOL_STEPS2, 7)
@@ -1277,48 +1396,22 @@ class AXP2101(I2CInterface):
 
     # Power control DCDC3 functions
     def isEnableDC3(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 2))
+        return self.rail('DC3').isEnabled()
 
     def enableDC3(self) -> None:
-        super().setRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 2)
+        self.rail('DC3').enable()
 
     def disableDC3(self) -> None:
-        super().clrRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 2)
+        self.rail('DC3').disable()
 
     # 0.5~1.2V,10mV/step,71steps
     # 1.22~1.54V,20mV/step,17steps
     # 1.6~3.4V,100mV/step,19steps
     def setDC3Voltage(self, millivolt: int) -> None:
-        val = super().readRegister(_AXP2101_DC_VOL2_CTRL)[0]
-        val &= 0x80
-        if (millivolt >= _AXP2101_DCDC3_VOL1_MIN and millivolt <= _AXP2101_DCDC3_VOL1_MAX):
-            if (millivolt % _AXP2101_DCDC3_VOL_STEPS1):
-                raise ValueError("Mistake ! The steps is must %umV" %
-                                 _AXP2101_DCDC3_VOL_STEPS1)
-            super().writeRegister(_AXP2101_DC_VOL2_CTRL, val | (int)((millivolt -
-                                                                      _AXP2101_DCDC3_VOL_MIN) / _AXP2101_DCDC3_VOL_STEPS1))
-        elif (millivolt >= _AXP2101_DCDC3_VOL2_MIN and millivolt <= _AXP2101_DCDC3_VOL2_MAX):
-            if (millivolt % _AXP2101_DCDC3_VOL_STEPS2):
-                raise ValueError("Mistake ! The steps is must %umV" %
-                                 _AXP2101_DCDC3_VOL_STEPS2)
-            val |= (int)(((millivolt - _AXP2101_DCDC3_VOL2_MIN) /
-                          _AXP2101_DCDC3_VOL_STEPS2) + _AXP2101_DCDC3_VOL_STEPS2_BASE)
-            super().writeRegister(_AXP2101_DC_VOL2_CTRL, val)
-        elif (millivolt >= _AXP2101_DCDC3_VOL3_MIN and millivolt <= _AXP2101_DCDC3_VOL3_MAX):
-            if (millivolt % _AXP2101_DCDC3_VOL_STEPS3):
-                raise ValueError("Mistake ! The steps is must %umV" %
-                                 _AXP2101_DCDC3_VOL_STEPS3)
-            val |= (int)(((millivolt - _AXP2101_DCDC3_VOL3_MIN) /
-                          _AXP2101_DCDC3_VOL_STEPS3) + _AXP2101_DCDC3_VOL_STEPS3_BASE)
-            super().writeRegister(_AXP2101_DC_VOL2_CTRL, val)
+        self.rail('DC3').setVoltage(millivolt)
 
     def getDC3Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_DC_VOL2_CTRL)[0] & 0x7F
-        if (val < _AXP2101_DCDC3_VOL_STEPS2_BASE):
-            return (val * _AXP2101_DCDC3_VOL_STEPS1) + _AXP2101_DCDC3_VOL_MIN
-        elif (val >= _AXP2101_DCDC3_VOL_STEPS2_BASE and val < _AXP2101_DCDC3_VOL_STEPS3_BASE):
-            return (val * _AXP2101_DCDC3_VOL_STEPS2) - 200
-        return (val * _AXP2101_DCDC3_VOL_STEPS3) - 7200
+        return self.rail('DC3').getVoltage()
 
     def getDC3WorkMode(self) -> None:
         return super().getRegisterBit(_AXP2101_DC_VOL2_CTRL, 7)
@@ -1333,41 +1426,64 @@ class AXP2101(I2CInterface):
     def getDC3LowVoltagePowerDownEn(self) -> bool:
         return bool(super().getRegisterBit(_AXP2101_DC_OVP_UVP_CTRL, 2))
 
+    # DCDC2/3 DVM functions
+    # With DVM enabled the DCDC moves to a new voltage one step per
+    # 15.625us or 31.25us instead of jumping to it
+    def setDVMRampSlope(self, opt: int) -> None:
+        if opt:
+            super().setRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 5)
+        else:
+            super().clrRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 5)
+
+    def getDVMRampSlope(self) -> int:
+        return (super().readRegisterByte(_AXP2101_DC_ONOFF_DVM_CTRL) >> 5) & 0x01
+
+    def enableDC2DVM(self) -> None:
+        super().setRegisterBit(_AXP2101_DC_VOL1_CTRL, 7)
+
+    def disableDC2DVM(self) -> None:
+        super().clrRegisterBit(_AXP2101_DC_VOL1_CTRL, 7)
+
+    def isEnableDC2DVM(self) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_DC_VOL1_CTRL, 7))
+
+    def enableDC3DVM(self) -> None:
+        super().setRegisterBit(_AXP2101_DC_VOL2_CTRL, 7)
+
+    def disableDC3DVM(self) -> None:
+        super().clrRegisterBit(_AXP2101_DC_VOL2_CTRL, 7)
+
+    def isEnableDC3DVM(self) -> bool:
+        return bool(super().getRegisterBit(_AXP2101_DC_VOL2_CTRL, 7))
+
+    # @brief  Ramp DC2 to millivolt, at most step mV per register write and
+    #         slew mV/us when given, see Rail.rampVoltage.  Each step is a
+    #         single write that keeps the DVM bit, enable the register cache
+    #         to skip the initial read as well.
+    # @retval number of register writes
+    def rampDC2Voltage(self, millivolt: int, slew: float = 0, step: int = 0) -> int:
+        return self.rail('DC2').rampVoltage(millivolt, slew, step)
+
+    def rampDC3Voltage(self, millivolt: int, slew: float = 0, step: int = 0) -> int:
+        return self.rail('DC3').rampVoltage(millivolt, slew, step)
+
     # Power control DCDC4 functions
     # 0.5~1.2V,10mV/step,71steps
     # 1.22~1.84V,20mV/step,32steps
     def isEnableDC4(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 3))
+        return self.rail('DC4').isEnabled()
 
     def enableDC4(self) -> None:
-        super().setRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 3)
+        self.rail('DC4').enable()
 
     def disableDC4(self) -> None:
-        super().clrRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 3)
+        self.rail('DC4').disable()
 
     def setDC4Voltage(self, millivolt: int) -> None:
-        val = super().readRegister(_AXP2101_DC_VOL3_CTRL)[0]
-        val &= 0x80
-        if (millivolt >= _AXP2101_DCDC4_VOL1_MIN and millivolt <= _AXP2101_DCDC4_VOL1_MAX):
-            if (millivolt % _AXP2101_DCDC4_VOL_STEPS1):
-                raise ValueError("Mistake ! The steps is must %umV" %
-                                 _AXP2101_DCDC4_VOL_STEPS1)
-            super().writeRegister(_AXP2101_DC_VOL3_CTRL, val | (int)((millivolt -
-                                                                      _AXP2101_DCDC4_VOL1_MIN) / _AXP2101_DCDC4_VOL_STEPS1))
-        elif (millivolt >= _AXP2101_DCDC4_VOL2_MIN and millivolt <= _AXP2101_DCDC4_VOL2_MAX):
-            if (millivolt % _AXP2101_DCDC4_VOL_STEPS2):
-                raise ValueError("Mistake ! The steps is must %umV" %
-                                 _AXP2101_DCDC4_VOL_STEPS2)
-            val |= (int)(((millivolt - _AXP2101_DCDC4_VOL2_MIN) /
-                          _AXP2101_DCDC4_VOL_STEPS2) + _AXP2101_DCDC4_VOL_STEPS2_BASE)
-            super().writeRegister(_AXP2101_DC_VOL3_CTRL, val)
+        self.rail('DC4').setVoltage(millivolt)
 
     def getDC4Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_DC_VOL3_CTRL)[0]
-        val &= 0x7F
-        if (val < _AXP2101_DCDC4_VOL_STEPS2_BASE):
-            return (val * _AXP2101_DCDC4_VOL_STEPS1) + _AXP2101_DCDC4_VOL1_MIN
-        return (val * _AXP2101_DCDC4_VOL_STEPS2) - 200
+        return self.rail('DC4').getVoltage()
 
     # DCDC4 85% low voltage turn off PMIC function
     def setDC4LowVoltagePowerDown(self, en: bool) -> None:
@@ -1381,40 +1497,19 @@ class AXP2101(I2CInterface):
 
     # Power control DCDC5 functions,Output to gpio pin
     def isEnableDC5(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 4))
+        return self.rail('DC5').isEnabled()
 
     def enableDC5(self) -> None:
-        super().setRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 4)
+        self.rail('DC5').enable()
 
     def disableDC5(self) -> None:
-        super().clrRegisterBit(_AXP2101_DC_ONOFF_DVM_CTRL, 4)
+        self.rail('DC5').disable()
 
     def setDC5Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_DCDC5_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_DCDC5_VOL_STEPS)
-        if (millivolt != _AXP2101_DCDC5_VOL_1200MV and millivolt < _AXP2101_DCDC5_VOL_MIN):
-            raise ValueError("Mistake ! DC5 minimum voltage is %umV ,%umV" %
-                             (_AXP2101_DCDC5_VOL_1200MV, _AXP2101_DCDC5_VOL_MIN))
-        elif (millivolt > _AXP2101_DCDC5_VOL_MAX):
-            raise ValueError("Mistake ! DC5 maximum voltage is %umV" %
-                             _AXP2101_DCDC5_VOL_MAX)
-
-        val = super().readRegister(_AXP2101_DC_VOL4_CTRL)[0]
-        val &= 0xE0
-        if (millivolt == _AXP2101_DCDC5_VOL_1200MV):
-            super().writeRegister(_AXP2101_DC_VOL4_CTRL,
-                                  val | _AXP2101_DCDC5_VOL_VAL)
-        val |= (int)((millivolt - _AXP2101_DCDC5_VOL_MIN) /
-                     _AXP2101_DCDC5_VOL_STEPS)
-        super().writeRegister(_AXP2101_DC_VOL4_CTRL, val)
+        self.rail('DC5').setVoltage(millivolt)
 
     def getDC5Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_DC_VOL4_CTRL)[0]
-        val &= 0x1F
-        if (val == _AXP2101_DCDC5_VOL_VAL):
-            return _AXP2101_DCDC5_VOL_1200MV
-        return (val * _AXP2101_DCDC5_VOL_STEPS) + _AXP2101_DCDC5_VOL_MIN
+        return self.rail('DC5').getVoltage()
 
     def isDC5FreqCompensationEn(self) -> bool:
         return bool(super().getRegisterBit(_AXP2101_DC_VOL4_CTRL, 5))
@@ -1437,308 +1532,182 @@ class AXP2101(I2CInterface):
 
     # Power control ALDO1 functions
     def isEnableALDO1(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 0))
+        return self.rail('ALDO1').isEnabled()
 
     def enableALDO1(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 0)
+        self.rail('ALDO1').enable()
 
     def disableALDO1(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 0)
+        self.rail('ALDO1').disable()
 
     def setALDO1Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_ALDO1_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_ALDO1_VOL_STEPS)
-        if (millivolt < _AXP2101_ALDO1_VOL_MIN):
-            raise ValueError("Mistake ! ALDO1 minimum output voltage is  %umV" %
-                             _AXP2101_ALDO1_VOL_MIN)
-        elif (millivolt > _AXP2101_ALDO1_VOL_MAX):
-            raise ValueError("Mistake ! ALDO1 maximum output voltage is  %umV" %
-                             _AXP2101_ALDO1_VOL_MAX)
-
-        val = super().readRegister(_AXP2101_LDO_VOL0_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_ALDO1_VOL_MIN) /
-                     _AXP2101_ALDO1_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL0_CTRL, val)
+        self.rail('ALDO1').setVoltage(millivolt)
 
     def getALDO1Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL0_CTRL)[0] & 0x1F
-        return val * _AXP2101_ALDO1_VOL_STEPS + _AXP2101_ALDO1_VOL_MIN
+        return self.rail('ALDO1').getVoltage()
 
     # Power control ALDO2 functions
     def isEnableALDO2(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 1))
+        return self.rail('ALDO2').isEnabled()
 
     def enableALDO2(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 1)
+        self.rail('ALDO2').enable()
 
     def disableALDO2(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 1)
+        self.rail('ALDO2').disable()
 
     def setALDO2Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_ALDO2_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_ALDO2_VOL_STEPS)
-        if (millivolt < _AXP2101_ALDO2_VOL_MIN):
-            raise ValueError("Mistake ! ALDO2 minimum output voltage is  %umV" %
-                             _AXP2101_ALDO2_VOL_MIN)
-        elif (millivolt > _AXP2101_ALDO2_VOL_MAX):
-            raise ValueError("Mistake ! ALDO2 maximum output voltage is  %umV" %
-                             _AXP2101_ALDO2_VOL_MAX)
-
-        val = super().readRegister(_AXP2101_LDO_VOL1_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_ALDO2_VOL_MIN) /
-                     _AXP2101_ALDO2_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL1_CTRL, val)
+        self.rail('ALDO2').setVoltage(millivolt)
 
     def getALDO2Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL1_CTRL)[0] & 0x1F
-        return val * _AXP2101_ALDO2_VOL_STEPS + _AXP2101_ALDO2_VOL_MIN
+        return self.rail('ALDO2').getVoltage()
 
     # Power control ALDO3 functions
     def isEnableALDO3(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 2))
+        return self.rail('ALDO3').isEnabled()
 
     def enableALDO3(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 2)
+        self.rail('ALDO3').enable()
 
     def disableALDO3(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 2)
+        self.rail('ALDO3').disable()
 
     def setALDO3Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_ALDO3_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_ALDO3_VOL_STEPS)
-        if (millivolt < _AXP2101_ALDO3_VOL_MIN):
-            raise ValueError("Mistake ! ALDO3 minimum output voltage is  %umV" %
-                             _AXP2101_ALDO3_VOL_MIN)
-        elif (millivolt > _AXP2101_ALDO3_VOL_MAX):
-            raise ValueError("Mistake ! ALDO3 maximum output voltage is  %umV" %
-                             _AXP2101_ALDO3_VOL_MAX)
-
-        val = super().readRegister(_AXP2101_LDO_VOL2_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_ALDO3_VOL_MIN) /
-                     _AXP2101_ALDO3_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL2_CTRL, val)
+        self.rail('ALDO3').setVoltage(millivolt)
 
     def getALDO3Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL2_CTRL)[0] & 0x1F
-        return val * _AXP2101_ALDO3_VOL_STEPS + _AXP2101_ALDO3_VOL_MIN
+        return self.rail('ALDO3').getVoltage()
 
     # Power control ALDO4 functions
     def isEnableALDO4(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 3))
+        return self.rail('ALDO4').isEnabled()
 
     def enableALDO4(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 3)
+        self.rail('ALDO4').enable()
 
     def disableALDO4(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 3)
+        self.rail('ALDO4').disable()
 
     def setALDO4Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_ALDO4_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_ALDO4_VOL_STEPS)
-        if (millivolt < _AXP2101_ALDO4_VOL_MIN):
-            raise ValueError("Mistake ! ALDO4 minimum output voltage is  %umV" %
-                             _AXP2101_ALDO4_VOL_MIN)
-        elif (millivolt > _AXP2101_ALDO4_VOL_MAX):
-            raise ValueError("Mistake ! ALDO4 maximum output voltage is  %umV" %
-                             _AXP2101_ALDO4_VOL_MAX)
-        val = super().readRegister(_AXP2101_LDO_VOL3_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_ALDO4_VOL_MIN) /
-                     _AXP2101_ALDO4_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL3_CTRL, val)
+        self.rail('ALDO4').setVoltage(millivolt)
 
     def getALDO4Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL3_CTRL)[0] & 0x1F
-        return val * _AXP2101_ALDO4_VOL_STEPS + _AXP2101_ALDO4_VOL_MIN
+        return self.rail('ALDO4').getVoltage()
 
     # Power control BLDO1 functions
     def isEnableBLDO1(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 4))
+        return self.rail('BLDO1').isEnabled()
 
     def enableBLDO1(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 4)
+        self.rail('BLDO1').enable()
 
     def disableBLDO1(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 4)
+        self.rail('BLDO1').disable()
 
     def setBLDO1Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_BLDO1_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_BLDO1_VOL_STEPS)
-        if (millivolt < _AXP2101_BLDO1_VOL_MIN):
-            raise ValueError("Mistake ! BLDO1 minimum output voltage is  %umV" %
-                             _AXP2101_BLDO1_VOL_MIN)
-        elif (millivolt > _AXP2101_BLDO1_VOL_MAX):
-            raise ValueError("Mistake ! BLDO1 maximum output voltage is  %umV" %
-                             _AXP2101_BLDO1_VOL_MAX)
-        val = super().readRegister(_AXP2101_LDO_VOL4_CTRL)[0]
-        val &= 0xE0
-        val |= (int)((millivolt - _AXP2101_BLDO1_VOL_MIN) /
-                     _AXP2101_BLDO1_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL4_CTRL, val)
+        self.rail('BLDO1').setVoltage(millivolt)
 
     def getBLDO1Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL4_CTRL)[0]
-        val &= 0x1F
-        return val * _AXP2101_BLDO1_VOL_STEPS + _AXP2101_BLDO1_VOL_MIN
+        return self.rail('BLDO1').getVoltage()
 
     # Power control BLDO2 functions
     def isEnableBLDO2(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 5))
+        return self.rail('BLDO2').isEnabled()
 
     def enableBLDO2(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 5)
+        self.rail('BLDO2').enable()
 
     def disableBLDO2(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 5)
+        self.rail('BLDO2').disable()
 
     def setBLDO2Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_BLDO2_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_BLDO2_VOL_STEPS)
-        if (millivolt < _AXP2101_BLDO2_VOL_MIN):
-            raise ValueError("Mistake ! BLDO2 minimum output voltage is  %umV" %
-                             _AXP2101_BLDO2_VOL_MIN)
-        elif (millivolt > _AXP2101_BLDO2_VOL_MAX):
-            raise ValueError("Mistake ! BLDO2 maximum output voltage is  %umV" %
-                             _AXP2101_BLDO2_VOL_MAX)
-        val = super().readRegister(_AXP2101_LDO_VOL5_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_BLDO2_VOL_MIN) /
-                     _AXP2101_BLDO2_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL5_CTRL, val)
+        self.rail('BLDO2').setVoltage(millivolt)
 
     def getBLDO2Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL5_CTRL)[0]
-        val &= 0x1F
-        return val * _AXP2101_BLDO2_VOL_STEPS + _AXP2101_BLDO2_VOL_MIN
+        return self.rail('BLDO2').getVoltage()
 
     # Power control CPUSLDO functions
     def isEnableCPUSLDO(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 6))
+        return self.rail('CPUSLDO').isEnabled()
 
     def enableCPUSLDO(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 6)
+        self.rail('CPUSLDO').enable()
 
     def disableCPUSLDO(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 6)
+        self.rail('CPUSLDO').disable()
 
     def setCPUSLDOVoltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_CPUSLDO_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_CPUSLDO_VOL_STEPS)
-        if (millivolt < _AXP2101_CPUSLDO_VOL_MIN):
-            raise ValueError("Mistake ! CPULDO minimum output voltage is  %umV" %
-                             _AXP2101_CPUSLDO_VOL_MIN)
-        elif (millivolt > _AXP2101_CPUSLDO_VOL_MAX):
-            raise ValueError("Mistake ! CPULDO maximum output voltage is  %umV" %
-                             _AXP2101_CPUSLDO_VOL_MAX)
-        val = super().readRegister(_AXP2101_LDO_VOL6_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_CPUSLDO_VOL_MIN) /
-                     _AXP2101_CPUSLDO_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL6_CTRL, val)
+        self.rail('CPUSLDO').setVoltage(millivolt)
 
     def getCPUSLDOVoltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL6_CTRL)[0]
-        val &= 0x1F
-        return val * _AXP2101_CPUSLDO_VOL_STEPS + _AXP2101_CPUSLDO_VOL_MIN
+        return self.rail('CPUSLDO').getVoltage()
 
     # Power control DLDO1 functions
     def isEnableDLDO1(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 7))
+        return self.rail('DLDO1').isEnabled()
 
     def enableDLDO1(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 7)
+        self.rail('DLDO1').enable()
 
     def disableDLDO1(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL0, 7)
+        self.rail('DLDO1').disable()
 
     def setDLDO1Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_DLDO1_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_DLDO1_VOL_STEPS)
-        if (millivolt < _AXP2101_DLDO1_VOL_MIN):
-            raise ValueError("Mistake ! DLDO1 minimum output voltage is  %umV" %
-                             _AXP2101_DLDO1_VOL_MIN)
-        elif (millivolt > _AXP2101_DLDO1_VOL_MAX):
-            raise ValueError("Mistake ! DLDO1 maximum output voltage is  %umV" %
-                             _AXP2101_DLDO1_VOL_MAX)
-        val = super().readRegister(_AXP2101_LDO_VOL7_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_DLDO1_VOL_MIN) /
-                     _AXP2101_DLDO1_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL7_CTRL, val)
+        self.rail('DLDO1').setVoltage(millivolt)
 
     def getDLDO1Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL7_CTRL)[0]
-        val &= 0x1F
-        return val * _AXP2101_DLDO1_VOL_STEPS + _AXP2101_DLDO1_VOL_MIN
+        return self.rail('DLDO1').getVoltage()
 
     # Power control DLDO2 functions
     def isEnableDLDO2(self) -> bool:
-        return bool(super().getRegisterBit(_AXP2101_LDO_ONOFF_CTRL1, 0))
+        return self.rail('DLDO2').isEnabled()
 
     def enableDLDO2(self) -> None:
-        super().setRegisterBit(_AXP2101_LDO_ONOFF_CTRL1, 0)
+        self.rail('DLDO2').enable()
 
     def disableDLDO2(self) -> None:
-        super().clrRegisterBit(_AXP2101_LDO_ONOFF_CTRL1, 0)
+        self.rail('DLDO2').disable()
 
     def setDLDO2Voltage(self, millivolt: int) -> None:
-        if (millivolt % _AXP2101_DLDO2_VOL_STEPS):
-            raise ValueError("Mistake ! The steps is must %u mV" %
-                             _AXP2101_DLDO2_VOL_STEPS)
-        if (millivolt < _AXP2101_DLDO2_VOL_MIN):
-            raise ValueError("Mistake ! DLDO2 minimum output voltage is  %umV" %
-                             _AXP2101_DLDO2_VOL_MIN)
-        elif (millivolt > _AXP2101_DLDO2_VOL_MAX):
-            raise ValueError("Mistake ! DLDO2 maximum output voltage is  %umV" %
-                             _AXP2101_DLDO2_VOL_MAX)
-        val = super().readRegister(_AXP2101_LDO_VOL8_CTRL)[0] & 0xE0
-        val |= (int)((millivolt - _AXP2101_DLDO2_VOL_MIN) /
-                     _AXP2101_DLDO2_VOL_STEPS)
-        super().writeRegister(_AXP2101_LDO_VOL8_CTRL, val)
+        self.rail('DLDO2').setVoltage(millivolt)
 
     def getDLDO2Voltage(self) -> int:
-        val = super().readRegister(_AXP2101_LDO_VOL8_CTRL)[0]
-        val &= 0x1F
-        return val * _AXP2101_DLDO2_VOL_STEPS + _AXP2101_DLDO2_VOL_MIN
+        return self.rail('DLDO2').getVoltage()
 
     #  Power ON OFF IRQ TIMMING Control method
     def setIrqLevelTime(self, opt: int):
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         val &= 0xCF
         super().writeRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL, val | (opt << 4))
 
     def getIrqLevelTime(self) -> int:
-        return ((super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0] & 0x30) >> 4)
+        return ((super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL) & 0x30) >> 4)
 
     # @brief Set the PEKEY power-on long press time.
     # @param  opt: See _press_on_time_t enum for details.
     def setPowerKeyPressOnTime(self, opt: int):
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         val &= 0xFC
         super().writeRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL, val | opt)
 
     # @brief Get the PEKEY power-on long press time.
     # @retval See _press_on_time_t enum for details.
     def getPowerKeyPressOnTime(self) -> int:
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         return (val & 0x03)
 
     # @brief Set the PEKEY power-off long press time.
     # @param  opt: See _press_off_time_t enum for details.
     # @retval
     def setPowerKeyPressOffTime(self, opt: int):
-        val = super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)
         val &= 0xF3
         super().writeRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL, val | (opt << 2))
 
     # @brief Get the PEKEY power-off long press time.
     # @retval See _press_off_time_t enum for details.
     def getPowerKeyPressOffTime(self) -> int:
-        return ((super().readRegister(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL)[0] & 0x0C) >> 2)
+        return ((super().readRegisterByte(_AXP2101_IRQ_OFF_ON_LEVEL_CTRL) & 0x0C) >> 2)
 
     #  ADC Control method
     def enableGeneralAdcChannel(self) -> None:
@@ -1753,8 +1722,8 @@ class AXP2101(I2CInterface):
     def disableTemperatureMeasure(self) -> None:
         super().clrRegisterBit(_AXP2101_ADC_CHANNEL_CTRL, 4)
 
-    def getTemperature(self) -> float:
-        raw = super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST8, _AXP2101_ADC_DATA_RELUST9)
+    def getTemperature(self, maxAgeMs=None) -> float:
+        raw = super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST8, _AXP2101_ADC_DATA_RELUST9, maxAgeMs)
         return (22.0 + (7274 - raw) / 20.0)
 
     def enableSystemVoltageMeasure(self) -> None:
@@ -1763,8 +1732,8 @@ class AXP2101(I2CInterface):
     def disableSystemVoltageMeasure(self) -> None:
         super().clrRegisterBit(_AXP2101_ADC_CHANNEL_CTRL, 3)
 
-    def getSystemVoltage(self) -> int:
-        return super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST6, _AXP2101_ADC_DATA_RELUST7)
+    def getSystemVoltage(self, maxAgeMs=None) -> int:
+        return super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST6, _AXP2101_ADC_DATA_RELUST7, maxAgeMs)
 
     def enableVbusVoltageMeasure(self) -> None:
         super().setRegisterBit(_AXP2101_ADC_CHANNEL_CTRL, 2)
@@ -1772,8 +1741,8 @@ class AXP2101(I2CInterface):
     def disableVbusVoltageMeasure(self) -> None:
         super().clrRegisterBit(_AXP2101_ADC_CHANNEL_CTRL, 2)
 
-    def getVbusVoltage(self) -> int:
-        return super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST4, _AXP2101_ADC_DATA_RELUST5)
+    def getVbusVoltage(self, maxAgeMs=None) -> int:
+        return super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST4, _AXP2101_ADC_DATA_RELUST5, maxAgeMs)
 
     def enableTSPinMeasure(self) -> None:
         super().setRegisterBit(_AXP2101_ADC_CHANNEL_CTRL, 1)
@@ -1787,8 +1756,8 @@ class AXP2101(I2CInterface):
     def disableTSPinLowFreqSample(self) -> None:
         super().clrRegisterBit(_AXP2101_ADC_DATA_RELUST2, 7)
 
-    def getTsTemperature(self) -> int:
-        return super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST2, _AXP2101_ADC_DATA_RELUST3)
+    def getTsTemperature(self, maxAgeMs=None) -> int:
+        return super().readRegisterH6L8(_AXP2101_ADC_DATA_RELUST2, _AXP2101_ADC_DATA_RELUST3, maxAgeMs)
 
     def enableBattVoltageMeasure(self) -> None:
         super().setRegisterBit(_AXP2101_ADC_CHANNEL_CTRL, 0)
@@ -1802,15 +1771,39 @@ class AXP2101(I2CInterface):
     def disableBattDetection(self) -> None:
         super().clrRegisterBit(_AXP2101_BAT_DET_CTRL, 0)
 
-    def getBattVoltage(self) -> int:
-        if not self.isBatteryConnect():
+    def getBattVoltage(self, maxAgeMs=None) -> int:
+        if not self.isBatteryConnect(maxAgeMs):
             return 0
-        return super().readRegisterH5L8(_AXP2101_ADC_DATA_RELUST0, _AXP2101_ADC_DATA_RELUST1)
+        return super().readRegisterH5L8(_AXP2101_ADC_DATA_RELUST0, _AXP2101_ADC_DATA_RELUST1, maxAgeMs)
 
-    def getBatteryPercent(self) -> int:
-        if not self.isBatteryConnect():
+    def getBatteryPercent(self, maxAgeMs=None) -> int:
+        if not self.isBatteryConnect(maxAgeMs):
             return -1
-        return super().readRegister(_AXP2101_BAT_PERCENT_DATA)[0]
+        return super().readRegisterByte(_AXP2101_BAT_PERCENT_DATA, maxAgeMs)
+
+    # @brief  Read status, ADC results and battery percent as one snapshot.
+    #         STATUS1/2, the ADC block 34H~3DH and A4H are fetched with the
+    #         three burst reads of a cached read plan.
+    # @param  out: optional AXP2101Telemetry instance to fill in place
+    # @retval AXP2101Telemetry
+    def readTelemetry(self, out=None):
+        if out is None:
+            out = AXP2101Telemetry()
+        plan = super().getReadPlan(self._TELEMETRY_FIELDS)
+        plan.read(self)
+        out.status1 = plan.value(0)
+        out.status2 = plan.value(1)
+        out.tsValue = plan.value(3)
+        out.vbusVoltage = plan.value(4)
+        out.systemVoltage = plan.value(5)
+        out.temperature = plan.value(6)
+        if out.isBatteryConnect():
+            out.battVoltage = plan.value(2)
+            out.batteryPercent = plan.value(7)
+        else:
+            out.battVoltage = 0
+            out.batteryPercent = -1
+        return out
 
     # CHG LED setting and control
     # @brief Set charging led mode.
@@ -1818,18 +1811,18 @@ class AXP2101(I2CInterface):
         range = [self.XPOWERS_CHG_LED_OFF, self.XPOWERS_CHG_LED_BLINK_1HZ,
                  self.XPOWERS_CHG_LED_BLINK_4HZ, self.XPOWERS_CHG_LED_ON]
         if mode in range:
-            val = super().readRegister(_AXP2101_CHGLED_SET_CTRL)[0]
+            val = super().readRegisterByte(_AXP2101_CHGLED_SET_CTRL)
             val &= 0xC8
             val |= 0x05  # use manual ctrl
             val |= (mode << 4)
             super().writeRegister(_AXP2101_CHGLED_SET_CTRL, val)
         else:
-            val = super().readRegister(_AXP2101_CHGLED_SET_CTRL)[0]
+            val = super().readRegisterByte(_AXP2101_CHGLED_SET_CTRL)
             val &= 0xF9
             super().writeRegister(_AXP2101_CHGLED_SET_CTRL, val | 0x01)  # use type A mode
 
     def getChargingLedMode(self) -> int:
-        val = super().readRegister(_AXP2101_CHGLED_SET_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_CHGLED_SET_CTRL)
         val >>= 1
         if (val & 0x02) == 0x02:
             val >>= 4
@@ -1841,12 +1834,12 @@ class AXP2101(I2CInterface):
     # @param   opt: 25  opt
     # # @retval None
     def setPrechargeCurr(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_IPRECHG_SET)[0]
+        val = super().readRegisterByte(_AXP2101_IPRECHG_SET)
         val &= 0xF0
         super().writeRegister(_AXP2101_IPRECHG_SET, val | opt)
 
     def getPrechargeCurr(self) -> None:
-        return (super().readRegister(_AXP2101_IPRECHG_SET)[0] & 0x0F)
+        return (super().readRegisterByte(_AXP2101_IPRECHG_SET) & 0x0F)
 
      # @brief Set charge current.
      # @param   opt: See _axp2101_chg_curr_t enum for details.
@@ -1855,7 +1848,7 @@ class AXP2101(I2CInterface):
         if not 4 <= opt <= 16:
             raise ValueError(
                 "Charger Constant Current must be a value within 4-16!")
-        val = super().readRegister(_AXP2101_ICC_CHG_SET)[0]
+        val = super().readRegisterByte(_AXP2101_ICC_CHG_SET)
         val &= 0xE0
         super().writeRegister(_AXP2101_ICC_CHG_SET, val | opt)
 
@@ -1863,25 +1856,25 @@ class AXP2101(I2CInterface):
     # @retval See _axp2101_chg_curr_t enum for details.
 
     def getChargerConstantCurr(self) -> int:
-        return (super().readRegister(_AXP2101_ICC_CHG_SET)[0] & 0x1F)
+        return (super().readRegisterByte(_AXP2101_ICC_CHG_SET) & 0x1F)
 
     # @brief  充电终止电流限制
     # @note   Charging termination of current limit
 
     def setChargerTerminationCurr(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_ITERM_CHG_SET_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_ITERM_CHG_SET_CTRL)
         val &= 0xF0
         super().writeRegister(_AXP2101_ITERM_CHG_SET_CTRL, val | opt)
 
     def getChargerTerminationCurr(self) -> int:
-        return (super().readRegister(_AXP2101_ITERM_CHG_SET_CTRL)[0] & 0x0F)
+        return (super().readRegisterByte(_AXP2101_ITERM_CHG_SET_CTRL) & 0x0F)
 
     def enableChargerTerminationLimit(self) -> None:
-        val = super().readRegister(_AXP2101_ITERM_CHG_SET_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_ITERM_CHG_SET_CTRL)
         super().writeRegister(_AXP2101_ITERM_CHG_SET_CTRL, val | 0x10)
 
     def disableChargerTerminationLimit(self) -> None:
-        val = super().readRegister(_AXP2101_ITERM_CHG_SET_CTRL)[0]
+        val = super().readRegisterByte(_AXP2101_ITERM_CHG_SET_CTRL)
         super().writeRegister(_AXP2101_ITERM_CHG_SET_CTRL, val & 0xEF)
 
     def isChargerTerminationLimit(self) -> bool:
@@ -1894,7 +1887,7 @@ class AXP2101(I2CInterface):
         if not 1 <= opt <= 5:
             raise ValueError(
                 "Charger target voltage must be a value within 0-3!")
-        val = super().readRegister(_AXP2101_CV_CHG_VOL_SET)[0]
+        val = super().readRegisterByte(_AXP2101_CV_CHG_VOL_SET)
         val &= 0xFC
         super().writeRegister(_AXP2101_CV_CHG_VOL_SET, val | opt)
 
@@ -1902,31 +1895,33 @@ class AXP2101(I2CInterface):
     # @retval See _axp2101_chg_vol_t enum for details.
 
     def getChargeTargetVoltage(self) -> int:
-        return (super().readRegister(_AXP2101_CV_CHG_VOL_SET)[0] & 0x03)
+        return (super().readRegisterByte(_AXP2101_CV_CHG_VOL_SET) & 0x03)
 
     # @brief  设定热阈值
     # @note   Thermal regulation threshold setting
     def setThermaThreshold(self, opt: int) -> None:
-        val = super().readRegister(_AXP2101_THE_REGU_THRES_SET)[0]
+        val = super().readRegisterByte(_AXP2101_THE_REGU_THRES_SET)
         val &= 0xFC
         super().writeRegister(_AXP2101_THE_REGU_THRES_SET, val | opt)
 
     def getThermaThreshold(self) -> int:
-        return (super().readRegister(_AXP2101_THE_REGU_THRES_SET)[0] & 0x03)
+        return (super().readRegisterByte(_AXP2101_THE_REGU_THRES_SET) & 0x03)
 
     #  Interrupt status/control functions
     # @brief  Get the interrupt controller mask value.
     # @retval   Mask value corresponds to _axp2101_irq_t ,
 
     def getIrqStatus(self) -> int:
-        self.statusRegister = super().readRegister(_AXP2101_INTSTS1, 3)
+        super().readRegisters(_AXP2101_INTSTS1, _AXP2101_INTSTS_CNT, self.statusRegister)
+        super()._recordIrqStatus()
         return (self.statusRegister[0] << 16) | (self.statusRegister[1] << 8) | (self.statusRegister[2])
 
     # @brief  Clear interrupt controller state.
     def clearIrqStatus(self) -> None:
+        super().writeRegisters(_AXP2101_INTSTS1, _AXP2101_IRQ_CLEAR_ALL)
         for i in range(0, _AXP2101_INTSTS_CNT):
-            super().writeRegister(_AXP2101_INTSTS1 + i, 0xFF)
             self.statusRegister[i] = 0
+            super()._forgetIrqStatus(i, 0xFF)
 
     # @brief  Enable PMU interrupt control mask .
     # @param   opt: View the related chip type _axp2101_irq_t enumeration parameters in "Params.hpp"
@@ -2110,7 +2105,7 @@ class AXP2101(I2CInterface):
             return False
 
     def getChipID(self) -> int:
-        return super().readRegister(_AXP2101_IC_TYPE)[0]
+        return super().readRegisterByte(_AXP2101_IC_TYPE)
 
     def __to_bin(self, value, num) -> str:
         bin_chars = ""
@@ -2127,59 +2122,74 @@ class AXP2101(I2CInterface):
             print(': HEX:{:#08X}'.format(opts), end='')
             print(' BIN:', end='')
             print(self.__to_bin(opts, 64))
-        if (opts & 0x0000FF):
-            value = opts & 0xFF
-            if debug:
-                print('write in ints0 0b{0}'.format(self.__to_bin(value, 8)))
-            data = super().readRegister(_AXP2101_INTEN1)[0]
-            self.intRegister[0] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP2101_INTEN1, self.intRegister[0])
-        if (opts & 0x00FF00):
-            value = opts >> 8
-            if debug:
-                print('write in ints1 0b{0}'.format(self.__to_bin(value, 8)))
-            data = super().readRegister(_AXP2101_INTEN2)[0]
-            self.intRegister[1] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP2101_INTEN2, self.intRegister[1])
-        if (opts & 0xFF0000):
-            value = opts >> 16
-            if debug:
-                print('write in ints2 0b{0}'.format(self.__to_bin(value, 8)))
-            data = super().readRegister(_AXP2101_INTEN3)[0]
-            self.intRegister[2] = ((data & (~value)), (data | value))[enable]
-            super().writeRegister(_AXP2101_INTEN3, self.intRegister[2])
+            for i in range(_AXP2101_INTSTS_CNT):
+                if opts & (0xFF << (i * 8)):
+                    print('write in ints{0} 0b{1}'.format(i, self.__to_bin((opts >> (i * 8)) & 0xFF, 8)))
+        super()._updateIrqEnable(opts, enable)
 
     def printIntRegister(self) -> None:
         for i in range(0, _AXP2101_INTSTS_CNT):
-            val = super().readRegister(_AXP2101_INTEN1+i)[0]
+            val = super().readRegisterByte(_AXP2101_INTEN1+i)
             print('[{0}]HEX={1} BIN={2}'.format(
                 i, hex(val), self.__to_bin(val, 8)))
 
+    # @brief  Write the 128 byte battery model to the fuel gauge and
+    #         verify it with compareGaugeData().  One byte per access on
+    #         the BAT_PARAMS port, the datasheet does not say whether a
+    #         burst stays on the port.
     def writeGaugeData(self, data: bytearray) -> bool:
-        if len(data) != 128 or data is None:
+        if data is None or len(data) != _AXP2101_GAUGE_DATA_SIZE:
             return False
-        super().setRegisterBit(_AXP2101_RESET_FUEL_GAUGE, 2)
-        super().clrRegisterBit(_AXP2101_RESET_FUEL_GAUGE, 2)
-        super().clrRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-        super().setRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-        for i in range(128):
-            super().writeRegister(_AXP2101_BAT_PARAMS, data[i])
-        super().clrRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-        super().setRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-
-        return self.compareGaugeData(data, len(data))
-
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        # Reset the gauge, then enable the ROM port.  The control registers
+        # are read once and the bit sequences written from that value.
+        with super().session():
+            self._resetGauge()
+            ctrl = super().readRegisterByte(_AXP2101_FUEL_GAUGE_CTRL)
+            super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl & 0xFE)
+            super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl | 0x01)
+            view = memoryview(data)
+            for i in range(_AXP2101_GAUGE_DATA_SIZE):
+                super().writePort(_AXP2101_BAT_PARAMS, view[i:i + 1])
+            super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl & 0xFE)
+            super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl | 0x01)
+
+            return self.compareGaugeData(data, len(data))
+
+    # @brief  Read the battery model back and compare its CRC32 with the
+    #         CRC32 of data.  The gauge is reset afterwards to load the
+    #         model, like at the end of writeGaugeData().
     def compareGaugeData(self, data: bytearray, length: int) -> bool:
-        if length != 128 or data is None:
+        if length != _AXP2101_GAUGE_DATA_SIZE or data is None:
             return False
-        buffer = bytearray(128)
-        super().clrRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-        super().setRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-        for i in range(128):
-            buffer[i] = super().readRegister(_AXP2101_BAT_PARAMS)
-        super().clrRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 0)
-        super().setRegisterBit(_AXP2101_FUEL_GAUGE_CTRL, 4)
-        super().setRegisterBit(_AXP2101_RESET_FUEL_GAUGE, 2)
-        super().clrRegisterBit(_AXP2101_RESET_FUEL_GAUGE, 2)
-        return data == buffer
+        from binascii import crc32
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        return crc32(data) == self._readGaugeDigest()
+
+    # CRC32 of the battery model stored in the fuel gauge, read back one
+    # byte at a time without a 128 byte buffer.  Leaves the ROM port
+    # disabled, the data interface selected and the gauge reset.
+    def _readGaugeDigest(self) -> int:
+        from binascii import crc32
+        byte = memoryview(bytearray(1))
+        crc = 0
+        ctrl = super().readRegisterByte(_AXP2101_FUEL_GAUGE_CTRL)
+        super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl & 0xFE)
+        super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl | 0x01)
+        for i in range(_AXP2101_GAUGE_DATA_SIZE):
+            super().readPort(_AXP2101_BAT_PARAMS, byte)
+            crc = crc32(byte, crc)
+        # Disable the ROM port, select the data interface, reset the gauge
+        # to load the model
+        super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, ctrl & 0xFE)
+        super().writeRegister(_AXP2101_FUEL_GAUGE_CTRL, (ctrl & 0xFE) | 0x10)
+        self._resetGauge()
+        return crc
+
+    def _resetGauge(self) -> None:
+        val = super().readRegisterByte(_AXP2101_RESET_FUEL_GAUGE)
+        super().writeRegister(_AXP2101_RESET_FUEL_GAUGE, val | 0x04)
+        super().writeRegister(_AXP2101_RESET_FUEL_GAUGE, val & 0xFB)
     
\ No newline at end of file
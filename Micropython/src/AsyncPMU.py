@@ -0,0 +1,192 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      AsyncPMU.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+
+class AsyncPMU:
+
+    # @brief  asyncio layer over an AXP2101 / AXP192 driver, for MicroPython
+    #         asyncio (uasyncio) and CPython asyncio.
+    #         A background task, start() / stop(), dispatches the PMU
+    #         interrupts: on MicroPython the IRQ pin sets an asyncio
+    #         ThreadSafeFlag from its hard IRQ handler, elsewhere the task
+    #         polls the pin (or the status registers when there is no pin)
+    #         every pollMs.  Other tasks wait on interrupts with waitIrq(),
+    #         iterate them with events() and read telemetry with
+    #         telemetry(), without blocking the event loop in time.sleep.
+    # @param  pmu: AXP2101 or AXP192 driver
+    # @param  pin: PMU IRQ pin, machine.Pin or digitalio.DigitalInOut
+    # @param  pollMs: poll period when the pin cannot interrupt
+    # @param  queueSize: events kept for events(), the oldest are dropped
+    def __init__(self, pmu, pin=None, pollMs: int = 100, queueSize: int = 16) -> None:
+        self.pmu = pmu
+        self._pin = pin
+        self._pollMs = pollMs
+        self._queueSize = queueSize
+        self._queue = []
+        self._queued = asyncio.Event()
+        self._waiters = []
+        self._task = None
+        self._names = None
+        self._dispatcher = pmu.getIrqDispatcher()
+        self._mask = (1 << (8 * len(pmu._IRQ_STATUS_REGS))) - 1
+
+    def start(self):
+        if self._task is None:
+            self._dispatcher.on(self._mask, self._onIrq)
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._dispatcher.off(self._mask, self._onIrq)
+        self._dispatcher.detach()
+
+    async def _run(self) -> None:
+        dispatcher = self._dispatcher
+        flag = None
+        if self._pin is not None and hasattr(self._pin, 'irq') and hasattr(asyncio, 'ThreadSafeFlag'):
+            flag = asyncio.ThreadSafeFlag()
+        if self._pin is not None:
+            dispatcher.attach(self._pin, flag=flag)
+        # The line may already be low, its falling edge is gone
+        dispatcher.poll()
+        if flag is not None:
+            while True:
+                await flag.wait()
+                dispatcher.dispatch(True)
+        while True:
+            await asyncio.sleep(self._pollMs / 1000)
+            dispatcher.poll()
+
+    # Dispatcher handler, called once per pending interrupt bit
+    def _onIrq(self, irq: int) -> None:
+        for waiter in self._waiters:
+            if waiter[0] & irq:
+                waiter[2] |= irq
+                waiter[1].set()
+        if len(self._queue) >= self._queueSize:
+            self._queue.pop(0)
+        self._queue.append(irq)
+        self._queued.set()
+
+    # @brief  Wait for any interrupt in mask.
+    # @param  timeoutMs: raise asyncio.TimeoutError after this long
+    # @retval the interrupts in mask that occurred
+    async def waitIrq(self, mask: int, timeoutMs: int = None) -> int:
+        waiter = [mask, asyncio.Event(), 0]
+        self._waiters.append(waiter)
+        try:
+            if timeoutMs is None:
+                await waiter[1].wait()
+            else:
+                await asyncio.wait_for(waiter[1].wait(), timeoutMs / 1000)
+        finally:
+            self._waiters.remove(waiter)
+        return waiter[2]
+
+    # @brief  Async iterator over the interrupts, oldest first:
+    #         async for irq, name in apmu.events(): ...
+    #         name is the driver constant without the chip prefix, e.g.
+    #         'PKEY_SHORT_IRQ'.  Meant for a single consumer.
+    def events(self):
+        return _IrqEvents(self)
+
+    # @brief  Async iterator reading telemetry every intervalMs, the first
+    #         sample is read at once.
+    # @param  getters: None for the driver readTelemetry(), its result
+    #         object is reused for every sample; or a tuple of driver
+    #         getter names, each sample is a {name: value} dict.
+    #         A driver without readTelemetry() defaults to battery, VBUS
+    #         and system voltage and the die temperature.
+    def telemetry(self, intervalMs: int, getters=None):
+        if getters is None and not hasattr(self.pmu, 'readTelemetry'):
+            getters = ('getBattVoltage', 'getVbusVoltage', 'getSystemVoltage', 'getTemperature')
+        return _Telemetry(self.pmu, intervalMs, getters)
+
+    # @brief  Name of a single interrupt bit, e.g. 'VBUS_INSERT_IRQ'.
+    def irqName(self, irq: int) -> str:
+        if self._names is None:
+            self._names = {}
+            cls = type(self.pmu)
+            for name in dir(cls):
+                if name.startswith('XPOWERS_') and name.endswith('_IRQ'):
+                    value = getattr(cls, name)
+                    if value and not value & (value - 1):
+                        self._names[value] = name.split('_', 2)[2]
+        return self._names.get(irq, hex(irq))
+
+
+class _IrqEvents:
+
+    def __init__(self, apmu) -> None:
+        self._apmu = apmu
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        apmu = self._apmu
+        while not apmu._queue:
+            apmu._queued.clear()
+            await apmu._queued.wait()
+        irq = apmu._queue.pop(0)
+        return (irq, apmu.irqName(irq))
+
+
+class _Telemetry:
+
+    def __init__(self, pmu, intervalMs: int, getters) -> None:
+        self._pmu = pmu
+        self._intervalMs = intervalMs
+        self._getters = getters
+        self._sample = None
+        self._first = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._first:
+            await asyncio.sleep(self._intervalMs / 1000)
+        self._first = False
+        pmu = self._pmu
+        if self._getters is None:
+            self._sample = pmu.readTelemetry(self._sample)
+            return self._sample
+        sample = {}
+        for name in self._getters:
+            sample[name] = getattr(pmu, name)()
+        return sample
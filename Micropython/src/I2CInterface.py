@@ -33,17 +33,610 @@ if implementation.name == 'micropython':
     from machine import Pin, I2C
 if implementation.name == 'circuitpython':
     from adafruit_bus_device import i2c_device
+if implementation.name == 'cpython':
+    from LinuxI2C import I2C
+
+try:
+    const
+except NameError:
+    # CPython has no const(), the drivers only need the value
+    def const(x):
+        return x
+
+# Register shadow cache flags
+_REG_CACHED = const(0x01)
+_REG_VOLATILE = const(0x02)
+
+# ticks_ms / ticks_diff / ticks_add, with a fallback for CPython.  The
+# other modules import them from here.
+try:
+    from time import ticks_ms, ticks_diff, ticks_add
+except ImportError:
+    from time import monotonic
+
+    def ticks_ms() -> int:
+        return int(monotonic() * 1000) & 0x3FFFFFFF
+
+    def ticks_diff(a: int, b: int) -> int:
+        return ((a - b + 0x20000000) & 0x3FFFFFFF) - 0x20000000
+
+    def ticks_add(a: int, b: int) -> int:
+        return (a + b) & 0x3FFFFFFF
+
+
+# Bus backends.  A backend provides readInto(reg, buf), reading len(buf)
+# registers starting at reg, and write(reg, buf), writing buf starting at
+# reg.  I2CInterface picks one in __init__ and binds its methods.
+# On CPython, LinuxI2C.I2C (/dev/i2c-N) and MemoryI2C (register file in
+# memory) provide the machine.I2C methods and use MicroPythonBus.
+class MicroPythonBus:
+
+    # @brief  machine.I2C backend, register access is a single
+    #         writeto_mem / readfrom_mem_into call.
+    def __init__(self, i2c_bus, addr: int) -> None:
+        self._i2c = i2c_bus
+        self._address = addr
+
+    def readInto(self, reg: int, buf) -> None:
+        self._i2c.readfrom_mem_into(self._address, reg, buf)
+
+    def write(self, reg: int, buf) -> None:
+        self._i2c.writeto_mem(self._address, reg, buf)
+
+    # machine.I2C has no bus lock, a session has nothing to hold
+    def begin(self) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+class CircuitPythonBus:
+
+    # @brief  busio.I2C backend through adafruit_bus_device, the register
+    #         address is sent in the same write as the payload and reads
+    #         are one write_then_readinto (repeated start) transfer.
+    #         Every access locks and configures the bus, unless it is held
+    #         by begin() / end() (see I2CInterface.session()).
+    def __init__(self, i2c_bus, addr: int) -> None:
+        self._device = i2c_device.I2CDevice(i2c_bus, addr)
+        self._regBuf = bytearray(1)
+        self._wbuf = bytearray(2)
+        self._depth = 0
+
+    def begin(self) -> None:
+        if not self._depth:
+            self._device.__enter__()
+        self._depth += 1
+
+    def end(self) -> None:
+        self._depth -= 1
+        if not self._depth:
+            self._device.__exit__(None, None, None)
+
+    def readInto(self, reg: int, buf) -> None:
+        self._regBuf[0] = reg
+        if self._depth:
+            self._device.write_then_readinto(self._regBuf, buf)
+            return
+        with self._device as i2c:
+            i2c.write_then_readinto(self._regBuf, buf)
+
+    def write(self, reg: int, buf) -> None:
+        if len(buf) == 1:
+            out = self._wbuf
+            out[1] = buf[0]
+        else:
+            out = bytearray(len(buf) + 1)
+            out[1:] = buf
+        out[0] = reg
+        if self._depth:
+            self._device.write(out)
+            return
+        with self._device as i2c:
+            i2c.write(out)
+
+
+class _Session:
+
+    # Context manager returned by I2CInterface.session(), one per driver
+    # instance, nesting is counted by the backend
+    def __init__(self, bus) -> None:
+        self._bus = bus
+
+    def __enter__(self):
+        self._bus.begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._bus.end()
+
+
+class _Batch:
+
+    # Context manager returned by I2CInterface.batch(), one per driver
+    # instance.  Batches nest, the writes are flushed when the outermost
+    # one exits, also when it exits with an exception.
+    def __init__(self, pmu) -> None:
+        self._pmu = pmu
+        self._depth = 0
+
+    def __enter__(self):
+        pmu = self._pmu
+        pmu._bus.begin()
+        if self._depth == 0:
+            pmu._pending = {}
+            pmu._original = {}
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pmu = self._pmu
+        self._depth -= 1
+        try:
+            if self._depth == 0:
+                pmu._flushBatch()
+        finally:
+            pmu._bus.end()
 
 
 class I2CInterface:
+
+    # Registers whose content is changed by the chip itself (status, ADC,
+    # IRQ flags, self-clearing control bits).  The drivers override this,
+    # these registers are never served from the shadow cache.
+    _VOLATILE_REGISTERS = ()
+
+    # Regulator outputs, name: Rail descriptor (see Rail.py).  The drivers
+    # override this.
+    _RAILS = {}
+
+    # Interrupt enable and status registers, one per byte of an IRQ mask
+    # value (see IrqDispatcher.py).  The drivers override these.
+    _IRQ_ENABLE_REGS = ()
+    _IRQ_STATUS_REGS = ()
+
+    # Power key interrupts (pressed edge, released edge, short press, long
+    # press), 0 where the chip has none (see PowerKey.py)
+    _PKEY_IRQS = (0, 0, 0, 0)
+
+    # Readable values, name: field descriptor (see ReadPlan.py), and the
+    # data port registers no burst read may cross.  The drivers override
+    # these.
+    _FIELDS = {}
+    _PORT_REGISTERS = ()
+
+    # ((IRQ mask, registers), ...): the registers whose content an
+    # interrupt in mask reports a change of, their timestamped copies are
+    # dropped when the interrupt status shows it.  The drivers override
+    # this.
+    _IRQ_AFFECTS = ()
+
     def __init__(self, i2c_bus: I2C, addr: int) -> None:
-        if implementation.name == 'micropython':
-            print('micropython')
-            self._bus = i2c_bus
-        if implementation.name == 'circuitpython':
-            print('circuitpython')
-            self._bus = i2c_device.I2CDevice(i2c_bus, addr)
+        print(implementation.name)
+        # Anything with the machine.I2C register methods (machine.I2C,
+        # LinuxI2C.I2C, MemoryI2C) goes through MicroPythonBus
+        if hasattr(i2c_bus, 'readfrom_mem_into'):
+            self._bus = MicroPythonBus(i2c_bus, addr)
+        else:
+            self._bus = CircuitPythonBus(i2c_bus, addr)
         self._address = addr
+        # Bind the backend once, the register access methods below call
+        # these directly instead of checking the implementation each time
+        self._busRead = self._bus.readInto
+        self._busWrite = self._bus.write
+        self._session = _Session(self._bus)
+        self._batch = _Batch(self)
+        self._pending = None
+        self._original = None
+        self._byte = bytearray(1)
+        self._wbuf = bytearray(1)
+        self._pair = bytearray(2)
+        self._pairHigh = memoryview(self._pair)[0:1]
+        self._pairLow = memoryview(self._pair)[1:2]
+        self._cacheEnabled = False
+        self._shadow = None
+        self._regFlags = None
+        self._rails = {}
+        self._irqDispatcher = None
+        self._irqEnableValid = False
+        self._irqQueue = None
+        self._readPlans = {}
+        self._maxAge = 0
+        self._stampValid = None
+        self._stampValue = None
+        self._stampTime = None
+
+    # @brief  Hold the bus for a sequence of register accesses:
+    #         with pmu.session():
+    #             ...
+    #         On CircuitPython the I2CDevice is locked and configured once
+    #         for the whole block instead of for every access.  Sessions
+    #         nest; on MicroPython and CPython there is no bus lock and a
+    #         session costs nothing.
+    def session(self):
+        return self._session
+
+    # @brief  Defer register writes to the end of a block:
+    #         with pmu.batch():
+    #             pmu.enableDC3()
+    #             pmu.setDC3Voltage(3300)
+    #             pmu.disableALDO1()
+    #         Inside the block writes only update a pending value per
+    #         register and reads return it, so each read-modify-write is
+    #         done in memory and every register is read from the bus at
+    #         most once.  On exit the registers whose value changed are
+    #         written in register order, adjacent ones in one burst, and
+    #         end up with the value the sequential calls would have left.
+    #         Volatile registers (status flags, self-clearing bits) are
+    #         written at once.  Do not batch steps that must reach the
+    #         chip in order, e.g. a power up sequence with delays, use
+    #         applyPowerPlan() for that.  The bus is held for the whole
+    #         block like in session(), batches nest.
+    def batch(self):
+        return self._batch
+
+    def isBatching(self) -> bool:
+        return self._pending is not None
+
+    def _isVolatile(self, reg: int) -> bool:
+        if self._cacheEnabled:
+            return bool(self._regFlags[reg] & _REG_VOLATILE)
+        return reg in self._VOLATILE_REGISTERS
+
+    # Write the pending batch values that differ from the register content,
+    # one transaction per run of adjacent changed registers.  Registers
+    # that were only read are never written, the chip may have changed them
+    # since.
+    def _flushBatch(self) -> None:
+        pending = self._pending
+        known = self._original
+        self._pending = None
+        self._original = None
+        regs = sorted([r for r in pending if known.get(r, -1) != pending[r]])
+        known.update(pending)
+        i = 0
+        while i < len(regs):
+            j = i
+            while j + 1 < len(regs) and regs[j + 1] == regs[j] + 1:
+                j += 1
+            if i == j:
+                self.writeRegister(regs[i], pending[regs[i]])
+            else:
+                self.writeRegisters(regs[i], bytes([pending[r] for r in regs[i:j + 1]]))
+            i = j + 1
+
+    # Write the pending batch values now and keep batching, for accesses
+    # that cannot be queued
+    def _flushPending(self) -> None:
+        if self._pending is not None:
+            known = self._original
+            self._flushBatch()
+            self._pending = {}
+            self._original = known
+
+    # @brief  Enable the register shadow cache.
+    #         Control registers are read from the bus once and then served
+    #         from memory, every write updates the cached copy.
+    # @param  volatile: registers that must always be read from the bus,
+    #         None uses the chip default list
+    def enableRegisterCache(self, volatile=None) -> None:
+        if self._shadow is None:
+            self._shadow = bytearray(256)
+            self._regFlags = bytearray(256)
+        else:
+            self.invalidateRegisterCache()
+            for i in range(256):
+                self._regFlags[i] = 0
+        if volatile is None:
+            volatile = self._VOLATILE_REGISTERS
+        for reg in volatile:
+            self._regFlags[reg & 0xFF] = _REG_VOLATILE
+        self._cacheEnabled = True
+
+    def disableRegisterCache(self) -> None:
+        self._cacheEnabled = False
+        self.invalidateRegisterCache()
+
+    def isEnableRegisterCache(self) -> bool:
+        return self._cacheEnabled
+
+    # @brief  Drop the cached copy of one register, or of all registers
+    #         when reg is None, so the next read goes to the bus.
+    def invalidateRegisterCache(self, reg=None) -> None:
+        self._dropStamps(reg)
+        flags = self._regFlags
+        if flags is None:
+            return
+        if reg is None:
+            for i in range(256):
+                flags[i] &= ~_REG_CACHED
+        else:
+            flags[reg & 0xFF] &= ~_REG_CACHED
+
+    # @brief  Default staleness budget of the getters.  A register read
+    #         from the bus at most maxAgeMs ago is served from its
+    #         timestamped copy instead of being read again; writes and the
+    #         interrupts in the driver _IRQ_AFFECTS table refresh or drop
+    #         the copies.  Getters taking a maxAgeMs argument override the
+    #         default for one call.  0 (the default) always reads the bus.
+    def setMaxAge(self, maxAgeMs: int) -> None:
+        self._maxAge = maxAgeMs
+        if maxAgeMs > 0 and self._stampValid is None:
+            self._allocStamps()
+
+    def getMaxAge(self) -> int:
+        return self._maxAge
+
+    # Timestamped register copies, allocated on the first nonzero budget
+    def _allocStamps(self) -> None:
+        from array import array
+        self._stampValue = bytearray(256)
+        self._stampTime = array('L', [0]) * 256
+        self._stampValid = bytearray(256)
+
+    # Drop the timestamped copy of one register, or of all of them
+    def _dropStamps(self, reg=None) -> None:
+        valid = self._stampValid
+        if valid is None:
+            return
+        if reg is None:
+            for i in range(256):
+                valid[i] = 0
+        else:
+            valid[reg & 0xFF] = 0
+
+    # Record data as the content of the registers from reg on, read or
+    # written now.  Volatile registers are only recorded when read.
+    def _stamp(self, reg: int, data, written: bool) -> None:
+        now = ticks_ms()
+        valid = self._stampValid
+        for i in range(len(data)):
+            r = (reg + i) & 0xFF
+            if written and self._isVolatile(r):
+                valid[r] = 0
+            else:
+                self._stampValue[r] = data[i]
+                self._stampTime[r] = now
+                valid[r] = 1
+
+    # Serve a read from the timestamped copies when all are younger
+    # than maxAgeMs
+    def _readStamped(self, reg: int, buf, maxAgeMs: int) -> bool:
+        valid = self._stampValid
+        if valid is None:
+            self._allocStamps()
+            return False
+        now = ticks_ms()
+        for i in range(len(buf)):
+            r = (reg + i) & 0xFF
+            if not valid[r] or ticks_diff(now, self._stampTime[r]) > maxAgeMs:
+                return False
+        for i in range(len(buf)):
+            buf[i] = self._stampValue[(reg + i) & 0xFF]
+        return True
+
+    # @brief  Mark a register as volatile (always read from the bus) or as a
+    #         cacheable control register.
+    def setRegisterVolatile(self, reg: int, volatile: bool = True) -> None:
+        if self._regFlags is None:
+            raise RuntimeError("Register cache is not enabled!")
+        reg &= 0xFF
+        self._regFlags[reg] = (0, _REG_VOLATILE)[volatile]
+
+    def _updateShadow(self, reg: int, data) -> None:
+        flags = self._regFlags
+        for i in range(len(data)):
+            r = (reg + i) & 0xFF
+            if not flags[r] & _REG_VOLATILE:
+                self._shadow[r] = data[i]
+                flags[r] |= _REG_CACHED
+
+    def _isCached(self, reg: int, length: int) -> bool:
+        flags = self._regFlags
+        for i in range(length):
+            if flags[(reg + i) & 0xFF] != _REG_CACHED:
+                return False
+        return True
+
+    # @brief  Get a regulator output by name, e.g. pmu.rail('DC3').
+    # @retval Rail
+    def rail(self, name: str):
+        r = self._rails.get(name)
+        if r is None:
+            key = name.upper()
+            desc = self._RAILS.get(key)
+            if desc is None:
+                raise ValueError("Mistake ! Unknown power rail %s" % name)
+            from Rail import Rail
+            r = Rail(self, key, desc)
+            self._rails[name] = r
+        return r
+
+    # @brief  Apply a whole power plan, coalescing the bit changes of each
+    #         step into one write per register, e.g.
+    #         pmu.applyPowerPlan((('DC1', 3300), ('DC3', 3300), 5,
+    #                             ('ALDO1', 1800), ('BLDO1', False)))
+    #         See Rail.applyPowerPlan for the plan format.
+    # @retval {rail name: (enabled, millivolt)}
+    def applyPowerPlan(self, plan) -> dict:
+        from Rail import applyPowerPlan
+        with self._session:
+            return applyPowerPlan(self, plan)
+
+    # @brief  Enable state and voltage of every regulator output, read
+    #         with a few burst reads instead of two reads per rail.
+    # @retval {rail name: (enabled, millivolt)}
+    def getAllRailStates(self) -> dict:
+        from Rail import readRailRegisters, railStates
+        rails = [self.rail(name) for name in self._RAILS]
+        with self._session:
+            regs = readRailRegisters(self, rails)
+        return railStates(rails, regs)
+
+    # @brief  Set the enable state of every interrupt at once, bit n of
+    #         mask enables the interrupt of bit n (the XPOWERS_*_IRQ
+    #         values).  The enable registers are written with one burst
+    #         per run of adjacent registers and nothing is read.
+    def setIrqMask(self, mask: int) -> None:
+        for i in range(len(self._IRQ_ENABLE_REGS)):
+            self.intRegister[i] = (mask >> (i * 8)) & 0xFF
+        self._irqEnableValid = True
+        self._writeRegisterRuns(self._IRQ_ENABLE_REGS, self.intRegister)
+
+    # @brief  Enable state of every interrupt as one mask value.  The
+    #         registers are read once, later calls use the state cached
+    #         by setIrqMask() / enableIRQ() / disableIRQ().
+    # @param  refresh: read the registers again
+    def getIrqMask(self, refresh: bool = False) -> int:
+        if refresh or not self._irqEnableValid:
+            self._readIrqEnable()
+        mask = 0
+        for i in range(len(self._IRQ_ENABLE_REGS)):
+            mask |= self.intRegister[i] << (i * 8)
+        return mask
+
+    # Load intRegister from the enable registers, one burst when they are
+    # adjacent
+    def _readIrqEnable(self) -> None:
+        regs = self._IRQ_ENABLE_REGS
+        buf = self.readRegisters(regs[0], regs[-1] - regs[0] + 1)
+        for i in range(len(regs)):
+            self.intRegister[i] = buf[regs[i] - regs[0]]
+        self._irqEnableValid = True
+
+    # Enable (or disable) the interrupts in opts on top of the cached
+    # enable state, only the registers that change are written
+    def _updateIrqEnable(self, opts: int, enable: bool) -> None:
+        with self._session:
+            if not self._irqEnableValid:
+                self._readIrqEnable()
+            changed = 0
+            for i in range(len(self._IRQ_ENABLE_REGS)):
+                value = (opts >> (i * 8)) & 0xFF
+                old = self.intRegister[i]
+                new = (old & ~value & 0xFF, old | value)[enable]
+                if new != old:
+                    self.intRegister[i] = new
+                    changed |= 1 << i
+            if changed:
+                self._writeRegisterRuns(self._IRQ_ENABLE_REGS, self.intRegister, changed)
+
+    # Write values[i] to regs[i] for every i set in only, with one burst
+    # per run of adjacent registers.  Registers inside a run that are not
+    # in only get values[i] again.
+    def _writeRegisterRuns(self, regs: tuple, values, only: int = -1) -> None:
+        with self._session:
+            i = 0
+            while i < len(regs):
+                j = i
+                while j + 1 < len(regs) and regs[j + 1] == regs[j] + 1:
+                    j += 1
+                first = i
+                while first <= j and not (only >> first) & 1:
+                    first += 1
+                last = j
+                while last > first and not (only >> last) & 1:
+                    last -= 1
+                if first == last:
+                    self.writeRegister(regs[first], values[first])
+                elif first < last:
+                    self.writeRegisters(regs[first], bytes(values[first:last + 1]))
+                i = j + 1
+
+    # @brief  Keep a queue of timestamped interrupt events, fed by every
+    #         interrupt status read, see IrqEventQueue.py.
+    # @retval IrqEventQueue
+    def enableIrqEventQueue(self, capacity: int = 32, windowMs: int = 0):
+        from IrqEventQueue import IrqEventQueue
+        self._irqQueue = IrqEventQueue(capacity, windowMs, len(self._IRQ_STATUS_REGS))
+        return self._irqQueue
+
+    def disableIrqEventQueue(self) -> None:
+        self._irqQueue = None
+
+    # @retval IrqEventQueue or None
+    def getIrqEventQueue(self):
+        return self._irqQueue
+
+    # Feed the event queue after statusRegister has been read
+    def _recordIrqStatus(self) -> None:
+        if self._irqQueue is not None:
+            self._irqQueue.observe(self.statusRegister, self.intRegister)
+        if self._stampValid is not None and self._IRQ_AFFECTS:
+            status = 0
+            for i in range(len(self._IRQ_STATUS_REGS)):
+                status |= self.statusRegister[i] << (i * 8)
+            if status:
+                for mask, regs in self._IRQ_AFFECTS:
+                    if status & mask:
+                        for reg in regs:
+                            self._stampValid[reg] = 0
+
+    # Tell the event queue which status bits were cleared
+    def _forgetIrqStatus(self, i: int, bits: int) -> None:
+        if self._irqQueue is not None:
+            self._irqQueue.forget(i, bits)
+
+    # @brief  The interrupt dispatcher of this PMU, see IrqDispatcher.py.
+    def getIrqDispatcher(self):
+        if self._irqDispatcher is None:
+            from IrqDispatcher import IrqDispatcher
+            self._irqDispatcher = IrqDispatcher(self)
+        return self._irqDispatcher
+
+    # @brief  Bind the PMU IRQ pin to the interrupt dispatcher, handlers
+    #         registered with getIrqDispatcher().on() then run shortly
+    #         after the pin falls, see IrqDispatcher.attach().
+    # @retval IrqDispatcher
+    def attachIrq(self, pin, hard: bool = True, flag=None):
+        dispatcher = self.getIrqDispatcher()
+        dispatcher.attach(pin, hard, flag)
+        return dispatcher
+
+    def detachIrq(self) -> None:
+        if self._irqDispatcher is not None:
+            self._irqDispatcher.detach()
+
+    # @brief  Read schedule for a set of fields, e.g.
+    #         pmu.getReadPlan(('battVoltage', 'vbusVoltage', 'irqStatus')).
+    #         The registers of the fields are covered with the fewest burst
+    #         reads, small gaps are read along.  The plan is built on the
+    #         first call and cached for the same names.
+    # @retval ReadPlan
+    def getReadPlan(self, names):
+        key = tuple(names)
+        plan = self._readPlans.get(key)
+        if plan is None:
+            from ReadPlan import ReadPlan
+            descs = []
+            for name in key:
+                desc = self._FIELDS.get(name)
+                if desc is None:
+                    raise ValueError("Mistake ! Unknown field %s" % name)
+                descs.append(desc)
+            plan = ReadPlan(key, descs, self._PORT_REGISTERS)
+            self._readPlans[key] = plan
+        return plan
+
+    # @brief  Read a set of fields with their cached read plan.  The
+    #         values are the plain register readings, the presence checks
+    #         of the getters (0 without battery ...) are not applied.
+    # @param  out: optional dict to fill in place
+    # @param  maxAgeMs: staleness budget, see setMaxAge()
+    # @retval {name: value}
+    def readFields(self, names, out=None, maxAgeMs=None) -> dict:
+        plan = self.getReadPlan(names)
+        plan.read(self, maxAgeMs)
+        return plan.values(out)
+
+    # @brief  Names of all fields readFields() knows for the chip.
+    def getFieldNames(self) -> list:
+        return sorted(self._FIELDS)
+
+    # @brief  Names of all regulator outputs of the chip.
+    def getRailNames(self) -> list:
+        return sorted(self._RAILS)
 
     def _BV(self, bit) -> int:
         return (1 << bit)
@@ -52,59 +645,167 @@ class I2CInterface:
         return bool((((val) & (mask)) == (mask)))
 
     def writeRegister(self, reg: int, val: int) -> None:
-        if implementation.name == 'micropython':
-            buf = bytearray(1)
-            buf[0] = val
-            self._bus.writeto_mem(
-                self._address, (reg & 0xFF), buf)
-        elif implementation.name == 'circuitpython':
-            buf = bytearray(2)
-            buf[0] = reg & 0xFF
-            buf[1] = val & 0xFF
-            with self._bus as i2c:
-                i2c.write(buf, start=0, end=2)
+        reg &= 0xFF
+        if self._pending is not None and not self._isVolatile(reg):
+            self._pending[reg] = val & 0xFF
+            return
+        self._wbuf[0] = val & 0xFF
+        self._busWrite(reg, self._wbuf)
+        if self._stampValid is not None:
+            self._stamp(reg, self._wbuf, True)
+        if self._cacheEnabled:
+            if not self._regFlags[reg] & _REG_VOLATILE:
+                self._shadow[reg] = val & 0xFF
+                self._regFlags[reg] |= _REG_CACHED
+
+    # @brief  Write consecutive registers starting at start in a single
+    #         auto-increment burst transaction.
+    def writeRegisters(self, start: int, data) -> None:
+        start &= 0xFF
+        pending = self._pending
+        if pending is not None:
+            volatile = False
+            for i in range(len(data)):
+                if self._isVolatile((start + i) & 0xFF):
+                    volatile = True
+            if not volatile:
+                for i in range(len(data)):
+                    pending[(start + i) & 0xFF] = data[i]
+                return
+            # Written at once, earlier pending values would overwrite it
+            for i in range(len(data)):
+                pending.pop((start + i) & 0xFF, None)
+                self._original.pop((start + i) & 0xFF, None)
+        self._busWrite(start, data)
+        if self._stampValid is not None:
+            self._stamp(start, data, True)
+        if self._cacheEnabled:
+            for i in range(len(data)):
+                reg = (start + i) & 0xFF
+                if not self._regFlags[reg] & _REG_VOLATILE:
+                    self._shadow[reg] = data[i]
+                    self._regFlags[reg] |= _REG_CACHED
+
+    # The read path below only touches the preallocated per-instance
+    # buffers, single and two byte reads do not allocate on the heap.
+    # maxAgeMs: staleness budget, None for the default of setMaxAge()
+    def _readInto(self, reg: int, buf, maxAgeMs=None) -> None:
+        reg &= 0xFF
+        if self._pending is not None:
+            self._readBatch(reg, buf)
+            return
+        if self._cacheEnabled and self._isCached(reg, len(buf)):
+            for i in range(len(buf)):
+                buf[i] = self._shadow[(reg + i) & 0xFF]
+            return
+        if maxAgeMs is None:
+            maxAgeMs = self._maxAge
+        if maxAgeMs > 0 and self._readStamped(reg, buf, maxAgeMs):
+            return
+        self._busRead(reg, buf)
+        if self._stampValid is not None:
+            self._stamp(reg, buf, False)
+        if self._cacheEnabled:
+            self._updateShadow(reg, buf)
+
+    # Read inside a batch: pending values take the place of the register
+    # content, the bus is only read when a register has none
+    def _readBatch(self, reg: int, buf) -> None:
+        pending = self._pending
+        original = self._original
+        n = len(buf)
+        for i in range(n):
+            if (reg + i) & 0xFF not in pending:
+                break
+        else:
+            for i in range(n):
+                buf[i] = pending[(reg + i) & 0xFF]
+            return
+        self._pending = None
+        try:
+            self._readInto(reg, buf)
+        finally:
+            self._pending = pending
+        for i in range(n):
+            r = (reg + i) & 0xFF
+            if r not in original and not self._isVolatile(r):
+                original[r] = buf[i]
+            if r in pending:
+                buf[i] = pending[r]
+
+    # @brief  Read a single register and return its value as int.
+    # @param  maxAgeMs: staleness budget, see setMaxAge()
+    def readRegisterByte(self, reg: int, maxAgeMs=None) -> int:
+        self._readInto(reg, self._byte, maxAgeMs)
+        return self._byte[0]
 
     def readRegister(self, reg: int, length: int = 1) -> list:
-        if implementation.name == 'micropython':
+        buf = bytearray(length)
+        self._readInto(reg, buf)
+        return list(buf)
+
+    # @brief  Read length consecutive registers starting at start in a
+    #         single auto-increment burst transaction.
+    # @param  buf: optional preallocated buffer, the data is written to
+    #         its first length bytes and buf is returned
+    def readRegisters(self, start: int, length: int, buf=None, maxAgeMs=None):
+        if buf is None:
             buf = bytearray(length)
-            self._bus.readfrom_mem_into(
-                self._address, (reg & 0xFF), buf)
-            return list(buf)
-        elif implementation.name == 'circuitpython':
-            with self._bus as i2c:
-                i2c.write(bytes([reg & 0xFF]))
-                result = bytearray(length)
-                i2c.readinto(result)
-                return result
-
-    def getRegisterBit(self, reg, bit) -> bool:
-        val = self.readRegister(reg)[0]
+        if len(buf) == length:
+            self._readInto(start, buf, maxAgeMs)
+        else:
+            self._readInto(start, memoryview(buf)[0:length], maxAgeMs)
+        return buf
+
+    # @brief  Stream len(buf) bytes from a data port register (a register
+    #         that steps through an internal buffer on every access) in one
+    #         transaction.  The shadow cache is bypassed.  Inside batch()
+    #         the writes queued so far are flushed first, the port content
+    #         usually depends on them.
+    def readPort(self, reg: int, buf) -> None:
+        self._flushPending()
+        self._busRead(reg & 0xFF, buf)
+
+    # @brief  Stream data to a data port register in one transaction.
+    #         Flushes the writes queued by batch() first, like readPort().
+    def writePort(self, reg: int, data) -> None:
+        self._flushPending()
+        self._busWrite(reg & 0xFF, data)
+        self._dropStamps(reg)
+
+    # Read a high/low register pair into self._pair, using one burst
+    # transaction when the registers are adjacent
+    def _readPair(self, highReg: int, lowReg: int, maxAgeMs=None) -> None:
+        if lowReg == highReg + 1:
+            self._readInto(highReg, self._pair, maxAgeMs)
+        else:
+            self._readInto(highReg, self._pairHigh, maxAgeMs)
+            self._readInto(lowReg, self._pairLow, maxAgeMs)
+
+    def getRegisterBit(self, reg, bit, maxAgeMs=None) -> bool:
+        val = self.readRegisterByte(reg, maxAgeMs)
         return val & self._BV(bit)
 
     def setRegisterBit(self, reg: int, bit: int):
-        val = self.readRegister(reg)[0]
+        val = self.readRegisterByte(reg)
         self.writeRegister(reg, (val | (self._BV(bit))))
 
     def clrRegisterBit(self, reg: int, bit: int):
-        val = self.readRegister(reg)[0]
+        val = self.readRegisterByte(reg)
         self.writeRegister(reg, (val & (~self._BV(bit))))
 
-    def readRegisterH8L4(self, highReg, lowReg) -> int:
-        h8 = self.readRegister(highReg)[0]
-        l4 = self.readRegister(lowReg)[0]
-        return (h8 << 4) | (l4 & 0x0F)
-
-    def readRegisterH8L5(self, highReg, lowReg) -> int:
-        h8 = self.readRegister(highReg)[0]
-        l5 = self.readRegister(lowReg)[0]
-        return (h8 << 5) | (l5 & 0x1F)
-
-    def readRegisterH6L8(self, highReg, lowReg) -> int:
-        h6 = self.readRegister(highReg)[0]
-        l8 = self.readRegister(lowReg)[0]
-        return ((h6 & 0x3F) << 8) | l8
-
-    def readRegisterH5L8(self, highReg, lowReg) -> int:
-        h5 = self.readRegister(highReg)[0]
-        l8 = self.readRegister(lowReg)[0]
-        return ((h5 & 0x1F) << 8) | l8
+    def readRegisterH8L4(self, highReg, lowReg, maxAgeMs=None) -> int:
+        self._readPair(highReg, lowReg, maxAgeMs)
+        return (self._pair[0] << 4) | (self._pair[1] & 0x0F)
+
+    def readRegisterH8L5(self, highReg, lowReg, maxAgeMs=None) -> int:
+        self._readPair(highReg, lowReg, maxAgeMs)
+        return (self._pair[0] << 5) | (self._pair[1] & 0x1F)
+
+    def readRegisterH6L8(self, highReg, lowReg, maxAgeMs=None) -> int:
+        self._readPair(highReg, lowReg, maxAgeMs)
+        return ((self._pair[0] & 0x3F) << 8) | self._pair[1]
+
+    def readRegisterH5L8(self, highReg, lowReg, maxAgeMs=None) -> int:
+        self._readPair(highReg, lowReg, maxAgeMs)
+        return ((self._pair[0] & 0x1F) << 8) | self._pair[1]
@@ -0,0 +1,208 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      IrqDispatcher.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+try:
+    from micropython import schedule, alloc_emergency_exception_buf
+except ImportError:
+    schedule = None
+
+
+class IrqDispatcher:
+
+    # @brief  Calls registered handlers for the pending PMU interrupts.
+    #         dispatch() reads all status registers in one burst, masks
+    #         them with the enable state cached by the driver (intRegister),
+    #         walks the set bits only and clears the handled bits with one
+    #         write per run of adjacent status registers.
+    #         Pending bits without a handler are left latched, so the
+    #         driver is*Irq() methods keep working for them after
+    #         getIrqStatus().
+    # @param  pmu: AXP2101 or AXP192 driver
+    def __init__(self, pmu) -> None:
+        self._pmu = pmu
+        self._handlers = {}
+        status = pmu._IRQ_STATUS_REGS
+        self._start = status[0]
+        # One burst covers all status registers, including any gap between
+        # them (5 registers on the AXP192)
+        self._buf = bytearray(status[-1] - status[0] + 1)
+        self._clear = bytearray(len(status))
+        # IRQ pin binding, see attach().  The bound methods are created
+        # here, creating them in the pin handler would allocate.
+        self._pin = None
+        self._flag = None
+        self._pending = False
+        self._isrRef = self._isr
+        self._runRef = self._run
+        # Load the enable state cached by the driver if it has not been
+        # read or set yet
+        pmu.getIrqMask()
+
+    # @brief  Register handler for every interrupt in mask, e.g.
+    #         on(pmu.XPOWERS_AXP2101_PKEY_SHORT_IRQ, onShortPress).
+    #         handler(irq) gets the single bit mask value of the interrupt.
+    def on(self, mask: int, handler) -> None:
+        bit = 1
+        while bit <= mask:
+            if mask & bit:
+                handlers = self._handlers.get(bit, ())
+                if handler not in handlers:
+                    self._handlers[bit] = handlers + (handler,)
+            bit <<= 1
+
+    # @brief  Remove handler, or all handlers when None, from the
+    #         interrupts in mask.
+    def off(self, mask: int, handler=None) -> None:
+        bit = 1
+        while bit <= mask:
+            if mask & bit and bit in self._handlers:
+                handlers = ()
+                if handler is not None:
+                    handlers = tuple(h for h in self._handlers[bit] if h != handler)
+                if handlers:
+                    self._handlers[bit] = handlers
+                else:
+                    del self._handlers[bit]
+            bit <<= 1
+
+    # @brief  Mask of the interrupts that have a handler.
+    def getHandledMask(self) -> int:
+        mask = 0
+        for bit in self._handlers:
+            mask |= bit
+        return mask
+
+    # @brief  Read the interrupt status, call the handlers of the pending
+    #         enabled interrupts and clear the handled ones.
+    # @param  clearAll: clear the pending interrupts without a handler too
+    # @retval mask of the interrupts that were handled
+    def dispatch(self, clearAll: bool = False) -> int:
+        with self._pmu.session():
+            return self._dispatch(clearAll)
+
+    def _dispatch(self, clearAll: bool) -> int:
+        pmu = self._pmu
+        status = pmu._IRQ_STATUS_REGS
+        enabled = pmu.intRegister
+        latched = pmu.statusRegister
+        buf = self._buf
+        clear = self._clear
+        handlers = self._handlers
+        pmu.readRegisters(self._start, len(buf), buf)
+        for i in range(len(status)):
+            latched[i] = buf[status[i] - self._start]
+        pmu._recordIrqStatus()
+        handled = 0
+        for i in range(len(status)):
+            bits = latched[i] & enabled[i]
+            done = 0
+            while bits:
+                low = bits & -bits
+                bits ^= low
+                irq = low << (i * 8)
+                called = handlers.get(irq)
+                if called:
+                    for handler in called:
+                        handler(irq)
+                    done |= low
+            clear[i] = latched[i] & enabled[i] if clearAll else done
+            handled |= done << (i * 8)
+        if handled or clearAll:
+            self._clearStatus()
+        return handled
+
+    # @brief  Bind the PMU IRQ pin (active low, open drain).
+    #         MicroPython: the pin handler runs in hard IRQ context and only
+    #         sets a flag; it does not allocate and does not touch the bus.
+    #         Without flag, dispatch() then runs through
+    #         micropython.schedule() right after the interrupted bytecode.
+    #         With an asyncio ThreadSafeFlag, the handler sets it and the
+    #         task waiting on it calls dispatch().
+    #         Other ports have no pin interrupts, call poll() from the
+    #         main loop instead.
+    #         The dispatch clears the unhandled pending interrupts as well:
+    #         the IRQ line stays low while any enabled status bit is set,
+    #         and a falling edge would never come again.
+    def attach(self, pin, hard: bool = True, flag=None) -> None:
+        self.detach()
+        self._pin = pin
+        self._flag = flag
+        self._pending = False
+        if schedule is not None and hasattr(pin, 'irq'):
+            alloc_emergency_exception_buf(100)
+            pin.irq(trigger=pin.IRQ_FALLING, handler=self._isrRef, hard=hard)
+
+    def detach(self) -> None:
+        if self._pin is not None and schedule is not None and hasattr(self._pin, 'irq'):
+            self._pin.irq(handler=None)
+        self._pin = None
+        self._flag = None
+
+    # @brief  Dispatch when the IRQ pin is asserted, or unconditionally
+    #         when no pin is attached.  For ports without pin interrupts
+    #         and as a fallback if the schedule queue was full.
+    # @retval mask of the interrupts that were handled
+    def poll(self) -> int:
+        pin = self._pin
+        if pin is not None:
+            level = pin.value
+            if callable(level):
+                level = level()
+            if level:
+                return 0
+        return self.dispatch(True)
+
+    # Pin handler, hard IRQ context: no allocation, no bus access
+    def _isr(self, pin) -> None:
+        if self._flag is not None:
+            self._flag.set()
+        elif not self._pending:
+            self._pending = True
+            try:
+                schedule(self._runRef, 0)
+            except RuntimeError:
+                # Schedule queue full, poll() picks the interrupt up
+                self._pending = False
+
+    def _run(self, arg) -> None:
+        self._pending = False
+        self.dispatch(True)
+
+    # Write-1-to-clear the bits in self._clear with one write per run of
+    # adjacent status registers, writing 0 to a status bit has no effect
+    def _clearStatus(self) -> None:
+        pmu = self._pmu
+        clear = self._clear
+        only = 0
+        for i in range(len(clear)):
+            if clear[i]:
+                only |= 1 << i
+                pmu.statusRegister[i] &= ~clear[i] & 0xFF
+                pmu._forgetIrqStatus(i, clear[i])
+        pmu._writeRegisterRuns(pmu._IRQ_STATUS_REGS, clear, only)
@@ -0,0 +1,130 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      IrqEventQueue.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+from array import array
+from I2CInterface import ticks_ms, ticks_diff
+
+
+class IrqEventQueue:
+
+    # @brief  Fixed capacity ring buffer of timestamped interrupt events.
+    #         The driver feeds it from every interrupt status read
+    #         (getIrqStatus(), IrqDispatcher.dispatch()): each enabled
+    #         status bit that became set since the previous read is one
+    #         event.  An event repeating the newest one in the queue
+    #         within windowMs of its last occurrence is merged into it and
+    #         counted instead of taking a new slot, so the queue keeps the
+    #         order the events happened in.  When the queue is full the
+    #         oldest event is dropped and counted in overflow.
+    #         All storage is allocated here, recording does not allocate.
+    # @param  capacity: number of events kept
+    # @param  windowMs: coalescing window, 0 disables coalescing
+    def __init__(self, capacity: int = 32, windowMs: int = 0, registers: int = 5) -> None:
+        self._irq = bytearray(capacity)      # bit number of the interrupt
+        self._first = array('L', [0]) * capacity
+        self._last = array('L', [0]) * capacity
+        self._count = array('H', [0]) * capacity
+        self._seen = bytearray(registers)
+        self._head = 0
+        self._len = 0
+        self.windowMs = windowMs
+        self.overflow = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def clear(self) -> None:
+        self._head = 0
+        self._len = 0
+        self.overflow = 0
+
+    # @brief  Record the events of a status read.
+    # @param  status: status register values, byte n of the IRQ mask
+    # @param  enabled: enable register values, same layout
+    def observe(self, status, enabled) -> None:
+        now = ticks_ms()
+        seen = self._seen
+        for i in range(len(status)):
+            latched = status[i] & enabled[i]
+            new = latched & ~seen[i]
+            seen[i] = latched
+            bit = i * 8
+            while new:
+                if new & 1:
+                    self.push(bit, now)
+                new >>= 1
+                bit += 1
+
+    # @brief  Forget that bits of status register i were latched, called
+    #         when they are cleared so that the next latch is a new event.
+    def forget(self, i: int, bits: int) -> None:
+        self._seen[i] &= ~bits & 0xFF
+
+    # @brief  Add one event for interrupt bit number bit.
+    def push(self, bit: int, now: int = None) -> None:
+        if now is None:
+            now = ticks_ms()
+        cap = len(self._irq)
+        if self.windowMs and self._len:
+            # Only the newest event may absorb it, merging into an older
+            # one would reorder it before the events that came in between
+            j = (self._head + self._len - 1) % cap
+            if self._irq[j] == bit and ticks_diff(now, self._last[j]) <= self.windowMs:
+                self._last[j] = now
+                if self._count[j] < 0xFFFF:
+                    self._count[j] += 1
+                return
+        if self._len == cap:
+            self._head = (self._head + 1) % cap
+            self._len -= 1
+            self.overflow += 1
+        j = (self._head + self._len) % cap
+        self._irq[j] = bit
+        self._first[j] = now
+        self._last[j] = now
+        self._count[j] = 1
+        self._len += 1
+
+    # @brief  Take the oldest event.
+    # @retval (irq mask value, first ticks_ms, last ticks_ms, count) or
+    #         None when empty
+    def pop(self):
+        if not self._len:
+            return None
+        j = self._head
+        self._head = (j + 1) % len(self._irq)
+        self._len -= 1
+        return (1 << self._irq[j], self._first[j], self._last[j], self._count[j])
+
+    # @brief  Look at the oldest event without taking it, see pop().
+    def peek(self):
+        if not self._len:
+            return None
+        j = self._head
+        return (1 << self._irq[j], self._first[j], self._last[j], self._count[j])
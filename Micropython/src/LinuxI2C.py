@@ -0,0 +1,130 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      LinuxI2C.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+import ctypes
+import os
+
+_I2C_RDWR = 0x0707
+_I2C_M_RD = 0x0001
+
+
+class _I2cMsg(ctypes.Structure):
+    _fields_ = [('addr', ctypes.c_uint16),
+                ('flags', ctypes.c_uint16),
+                ('len', ctypes.c_uint16),
+                ('buf', ctypes.POINTER(ctypes.c_uint8))]
+
+
+class _I2cRdwrData(ctypes.Structure):
+    _fields_ = [('msgs', ctypes.POINTER(_I2cMsg)),
+                ('nmsgs', ctypes.c_uint32)]
+
+
+class I2C:
+
+    # @brief  CPython bus on a Linux i2c-dev adapter, with the same register
+    #         access methods as machine.I2C so the drivers can use it as is.
+    #         Register reads are a single I2C_RDWR combined transaction
+    #         (write register address, repeated start, read).
+    # @param  bus: adapter number N of /dev/i2c-N, or a device path
+    def __init__(self, bus=1) -> None:
+        import fcntl
+        self._ioctl = fcntl.ioctl
+        if isinstance(bus, int):
+            bus = '/dev/i2c-%d' % bus
+        self._fd = os.open(bus, os.O_RDWR)
+        self._reg = (ctypes.c_uint8 * 1)()
+        self._msgs = (_I2cMsg * 2)()
+        self._rdwr = _I2cRdwrData(self._msgs, 2)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _transfer(self, nmsgs: int) -> None:
+        self._rdwr.nmsgs = nmsgs
+        self._ioctl(self._fd, _I2C_RDWR, self._rdwr)
+
+    def readfrom_mem_into(self, addr: int, memaddr: int, buf) -> None:
+        n = len(buf)
+        data = (ctypes.c_uint8 * n)()
+        self._reg[0] = memaddr & 0xFF
+        msgs = self._msgs
+        msgs[0].addr = addr
+        msgs[0].flags = 0
+        msgs[0].len = 1
+        msgs[0].buf = self._reg
+        msgs[1].addr = addr
+        msgs[1].flags = _I2C_M_RD
+        msgs[1].len = n
+        msgs[1].buf = data
+        self._transfer(2)
+        buf[:] = bytes(data)
+
+    def readfrom_mem(self, addr: int, memaddr: int, nbytes: int) -> bytes:
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf)
+        return bytes(buf)
+
+    def writeto_mem(self, addr: int, memaddr: int, buf) -> None:
+        n = len(buf)
+        data = (ctypes.c_uint8 * (n + 1))()
+        data[0] = memaddr & 0xFF
+        for i in range(n):
+            data[i + 1] = buf[i]
+        msg = self._msgs[0]
+        msg.addr = addr
+        msg.flags = 0
+        msg.len = n + 1
+        msg.buf = data
+        self._transfer(1)
+
+    # @brief  Return the 7-bit addresses that acknowledge a one byte read.
+    def scan(self) -> list:
+        found = []
+        for addr in range(0x08, 0x78):
+            data = (ctypes.c_uint8 * 1)()
+            msg = self._msgs[0]
+            msg.addr = addr
+            msg.flags = _I2C_M_RD
+            msg.len = 1
+            msg.buf = data
+            try:
+                self._transfer(1)
+            except OSError:
+                continue
+            found.append(addr)
+        return found
@@ -0,0 +1,110 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      MemoryI2C.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+
+class MemoryI2C:
+
+    # @brief  In-memory I2C bus with a 256 byte register file per device.
+    #         It has the machine.I2C register access methods, so it can be
+    #         passed to the drivers on any port to run them without hardware.
+    #         Every transaction and every byte on the wire is counted.
+    # @param  devices: optional {address: initial register contents}
+    def __init__(self, devices=None) -> None:
+        self._devices = {}
+        self.transactions = 0
+        self.reads = 0
+        self.writes = 0
+        self.bytesRead = 0
+        self.bytesWritten = 0
+        if devices:
+            for addr in devices:
+                self.addDevice(addr, devices[addr])
+
+    # @brief  Attach a device, returns its register file.
+    def addDevice(self, addr: int, regs=None) -> bytearray:
+        mem = bytearray(256)
+        if regs:
+            mem[0:len(regs)] = regs
+        self._devices[addr] = mem
+        return mem
+
+    def removeDevice(self, addr: int) -> None:
+        del self._devices[addr]
+
+    # @brief  Direct access to a device register file, no bus traffic.
+    def registers(self, addr: int) -> bytearray:
+        return self._device(addr)
+
+    def resetCounters(self) -> None:
+        self.transactions = 0
+        self.reads = 0
+        self.writes = 0
+        self.bytesRead = 0
+        self.bytesWritten = 0
+
+    def _device(self, addr: int) -> bytearray:
+        mem = self._devices.get(addr)
+        if mem is None:
+            raise OSError(19)   # ENODEV, what machine.I2C raises on NACK
+        return mem
+
+    # Device side of a transaction.  Subclasses override these two to give
+    # registers a behavior other than plain memory.
+    def _readRegisters(self, addr: int, reg: int, buf) -> None:
+        mem = self._device(addr)
+        for i in range(len(buf)):
+            buf[i] = mem[(reg + i) & 0xFF]
+
+    def _writeRegisters(self, addr: int, reg: int, buf) -> None:
+        mem = self._device(addr)
+        for i in range(len(buf)):
+            mem[(reg + i) & 0xFF] = buf[i]
+
+    def readfrom_mem_into(self, addr: int, memaddr: int, buf) -> None:
+        self._device(addr)
+        self.transactions += 1
+        self.reads += 1
+        self.bytesWritten += 1
+        self.bytesRead += len(buf)
+        self._readRegisters(addr, memaddr & 0xFF, buf)
+
+    def readfrom_mem(self, addr: int, memaddr: int, nbytes: int) -> bytes:
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf)
+        return bytes(buf)
+
+    def writeto_mem(self, addr: int, memaddr: int, buf) -> None:
+        self._device(addr)
+        self.transactions += 1
+        self.writes += 1
+        self.bytesWritten += 1 + len(buf)
+        self._writeRegisters(addr, memaddr & 0xFF, buf)
+
+    def scan(self) -> list:
+        return sorted(self._devices)
@@ -0,0 +1,417 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      PMUSimulator.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+from MemoryI2C import MemoryI2C
+
+# Register behavior flags
+_REG_READ_ONLY = 0x01
+_REG_W1C = 0x02
+
+# ADC result layouts, see readRegisterH8L4() and friends in I2CInterface
+_H8L4 = 0
+_H8L5 = 1
+_H6L8 = 2
+_H5L8 = 3
+
+_CHARGE_STATES = ('standby', 'charging', 'done', 'discharge')
+
+
+class PMUSimulator(MemoryI2C):
+
+    # @brief  Register level model of an XPowers PMU on an in-memory bus.
+    #         Pass the simulator as i2c_bus to the driver.  The model keeps
+    #         the chip ID, status registers, ADC results and IRQ flags
+    #         consistent with each other:
+    #         - IRQ status registers are write-1-to-clear and only latch
+    #           events whose enable bit is set, like clearIrqStatus() expects
+    #         - status and ADC registers ignore writes
+    #         - ADC channels follow a scripted waveform, advanced by step()
+    #         - charger state changes update the status registers and raise
+    #           the matching IRQs, immediately or at a scheduled tick
+    #         The transaction and byte counters come from MemoryI2C.
+    # @param  addr: device address, None uses the chip default
+    _ADDRESS = 0x34
+    _CHIP_ID = 0
+    _CHIP_ID_REG = 0x03
+    _INTEN = ()
+    _INTSTS = ()
+    _READ_ONLY = ()
+    # name: (high register, layout, scale, offset)
+    # raw = (value + offset) / scale
+    _CHANNELS = {}
+    # Power-on register defaults, (register, value)
+    _DEFAULTS = ()
+    # Battery percent register, None if the chip has no fuel gauge
+    _PERCENT_REG = None
+
+    def __init__(self, addr=None) -> None:
+        super().__init__()
+        self.address = self._ADDRESS if addr is None else addr
+        self.regs = self.addDevice(self.address)
+        self._flags = bytearray(256)
+        for reg in self._READ_ONLY:
+            self._flags[reg] = _REG_READ_ONLY
+        for reg in self._INTSTS:
+            self._flags[reg] = _REG_W1C
+        for reg, val in self._DEFAULTS:
+            self.regs[reg] = val
+        self.regs[self._CHIP_ID_REG] = self._CHIP_ID
+        self.tick = 0
+        self.irqCount = 0
+        # Called with the simulator when the IRQ line becomes active
+        self.onIrq = None
+        self._waveforms = {}
+        self._events = []
+        self._state = {'vbus': False, 'acin': False,
+                       'battery': False, 'charge': 'standby'}
+        self._applyState(self._state)
+
+    # Device side: status, ADC and ID registers are read only, IRQ status
+    # bits are cleared by writing 1
+    def _writeRegisters(self, addr: int, reg: int, buf) -> None:
+        mem = self._device(addr)
+        flags = self._flags
+        active = self.irqActive()
+        for i in range(len(buf)):
+            r = (reg + i) & 0xFF
+            if flags[r] & _REG_READ_ONLY:
+                continue
+            if flags[r] & _REG_W1C:
+                mem[r] &= ~buf[i] & 0xFF
+            else:
+                mem[r] = buf[i]
+        # Enabling an IRQ whose status is latched raises the line
+        self._checkIrqLine(active)
+
+    # @brief  Level of the (active low) IRQ pin as a bool, True when any
+    #         enabled IRQ status bit is set.
+    def irqActive(self) -> bool:
+        regs = self.regs
+        for i in range(len(self._INTSTS)):
+            if regs[self._INTSTS[i]] & regs[self._INTEN[i]]:
+                return True
+        return False
+
+    def _checkIrqLine(self, wasActive: bool) -> None:
+        if not wasActive and self.irqActive():
+            self.irqCount += 1
+            if self.onIrq:
+                self.onIrq(self)
+
+    # @brief  Latch IRQ status bits.  mask uses the driver IRQ constants
+    #         (byte n of the mask is status register n), only enabled
+    #         bits are latched.
+    def raiseIrq(self, mask: int) -> None:
+        regs = self.regs
+        active = self.irqActive()
+        for i in range(len(self._INTSTS)):
+            bits = (mask >> (8 * i)) & 0xFF
+            regs[self._INTSTS[i]] |= bits & regs[self._INTEN[i]]
+        self._checkIrqLine(active)
+
+    # @brief  IRQ status bits currently latched, in driver mask order.
+    def pendingIrq(self) -> int:
+        mask = 0
+        for i in range(len(self._INTSTS)):
+            mask |= self.regs[self._INTSTS[i]] << (8 * i)
+        return mask
+
+    # @brief  Set an ADC channel to a value in engineering units
+    #         (mV, mA or degree Celsius, see _CHANNELS of the chip).
+    def setAdc(self, name: str, value) -> None:
+        if name == 'percent' and self._PERCENT_REG is not None:
+            self.regs[self._PERCENT_REG] = int(value) & 0xFF
+            return
+        reg, layout, scale, offset = self._CHANNELS[name]
+        raw = int(round((value + offset) / scale))
+        regs = self.regs
+        if layout == _H8L4:
+            raw = min(max(raw, 0), 0xFFF)
+            regs[reg] = raw >> 4
+            regs[reg + 1] = raw & 0x0F
+        elif layout == _H8L5:
+            raw = min(max(raw, 0), 0x1FFF)
+            regs[reg] = raw >> 5
+            regs[reg + 1] = raw & 0x1F
+        elif layout == _H6L8:
+            raw = min(max(raw, 0), 0x3FFF)
+            regs[reg] = raw >> 8
+            regs[reg + 1] = raw & 0xFF
+        else:
+            raw = min(max(raw, 0), 0x1FFF)
+            regs[reg] = raw >> 8
+            regs[reg + 1] = raw & 0xFF
+
+    # @brief  Script an ADC channel.
+    # @param  samples: a list of values, one per tick, or a function
+    #         called with the tick number that returns the value
+    # @param  repeat: loop the list, otherwise hold its last value
+    def setWaveform(self, name: str, samples, repeat: bool = True) -> None:
+        if name not in self._CHANNELS and (name != 'percent' or self._PERCENT_REG is None):
+            raise ValueError("Mistake ! Unknown ADC channel %s" % name)
+        self._waveforms[name] = (samples, repeat)
+        self._sampleWaveform(name)
+
+    def clearWaveform(self, name=None) -> None:
+        if name is None:
+            self._waveforms = {}
+        elif name in self._waveforms:
+            del self._waveforms[name]
+
+    def _sampleWaveform(self, name: str) -> None:
+        samples, repeat = self._waveforms[name]
+        if callable(samples):
+            value = samples(self.tick)
+        elif repeat:
+            value = samples[self.tick % len(samples)]
+        else:
+            value = samples[min(self.tick, len(samples) - 1)]
+        self.setAdc(name, value)
+
+    # @brief  Change the power path / charger state now.
+    #         vbus, acin, battery: bool, charge: 'standby', 'charging',
+    #         'done' or 'discharge'.  The status registers are updated and
+    #         the insert/remove/charge start/charge done IRQs are raised.
+    # @param  irq: extra IRQ mask to raise with the change
+    def setState(self, irq: int = 0, **changes) -> None:
+        state = self._state
+        raised = irq
+        for key in changes:
+            if key not in state:
+                raise ValueError("Mistake ! Unknown state %s" % key)
+            if key == 'charge' and changes[key] not in _CHARGE_STATES:
+                raise ValueError("Mistake ! Unknown charge state %s" % changes[key])
+            if changes[key] != state[key]:
+                raised |= self._transitionIrq(key, changes[key])
+                state[key] = changes[key]
+        self._applyState(state)
+        if raised:
+            self.raiseIrq(raised)
+
+    def getState(self) -> dict:
+        return dict(self._state)
+
+    # @brief  Apply setState(**changes) when the simulation reaches tick at.
+    def schedule(self, at: int, irq: int = 0, **changes) -> None:
+        self._events.append((at, irq, changes))
+        self._events.sort(key=lambda e: e[0])
+
+    # @brief  Advance the simulation by n ticks: run the scheduled state
+    #         changes that are due and sample every ADC waveform.
+    def step(self, n: int = 1) -> None:
+        for _ in range(n):
+            self.tick += 1
+            while self._events and self._events[0][0] <= self.tick:
+                at, irq, changes = self._events.pop(0)
+                self.setState(irq, **changes)
+            for name in self._waveforms:
+                self._sampleWaveform(name)
+
+    def _applyState(self, state: dict) -> None:
+        pass
+
+    def _transitionIrq(self, key: str, value) -> int:
+        return 0
+
+
+class AXP2101Simulator(PMUSimulator):
+
+    # @brief  AXP2101 register model.  ADC channels: vbat, vbus, vsys (mV),
+    #         ts (raw), temp (degree Celsius) and percent.
+    _CHIP_ID = 0x4A
+    _INTEN = (0x40, 0x41, 0x42)
+    _INTSTS = (0x48, 0x49, 0x4A)
+    _READ_ONLY = (0x00, 0x01, 0x03, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39,
+                  0x3A, 0x3B, 0x3C, 0x3D, 0xA4)
+    _PERCENT_REG = 0xA4
+    _CHANNELS = {
+        'vbat': (0x34, _H5L8, 1, 0),
+        'ts': (0x36, _H6L8, 1, 0),
+        'vbus': (0x38, _H6L8, 1, 0),
+        'vsys': (0x3A, _H6L8, 1, 0),
+        # getTemperature(): 22 + (7274 - raw) / 20
+        'temp': (0x3C, _H6L8, -0.05, -385.7),
+    }
+    _DEFAULTS = (
+        (0x30, 0x03),   # ADC channel enable, TS and battery voltage
+        (0x40, 0xFF),   # IRQ enable 0
+        (0x41, 0xFC),   # IRQ enable 1
+        (0x42, 0x5F),   # IRQ enable 2
+        (0x80, 0x01),   # DC1 on, the other outputs depend on the EFUSE
+        (0x82, 0x12),   # DC1 3300mV
+    )
+
+    # Driver IRQ mask bits
+    _VBUS_INSERT = 1 << 15
+    _VBUS_REMOVE = 1 << 14
+    _BAT_INSERT = 1 << 13
+    _BAT_REMOVE = 1 << 12
+    _CHG_START = 1 << 19
+    _CHG_DONE = 1 << 20
+
+    # Fuel gauge battery model port, every single byte access steps
+    # through the 128 byte ROM.  Setting bit0 of the control register
+    # rewinds the port.  What a burst on the port does is not
+    # documented, the model refuses it.
+    _GAUGE_PORT = 0xA1
+    _GAUGE_CTRL = 0xA2
+    _GAUGE_SIZE = 128
+
+    # STATUS2 battery current direction and charger status per state
+    _CHARGE_STATUS = {
+        'standby': (0, 5),
+        'charging': (1, 3),
+        'done': (0, 4),
+        'discharge': (2, 5),
+    }
+
+    def __init__(self, addr=None) -> None:
+        self.gaugeRom = bytearray(self._GAUGE_SIZE)
+        self._gaugePtr = 0
+        super().__init__(addr)
+
+    def _readRegisters(self, addr: int, reg: int, buf) -> None:
+        if reg != self._GAUGE_PORT:
+            super()._readRegisters(addr, reg, buf)
+            return
+        self._checkGaugeAccess(buf)
+        enabled = self.regs[self._GAUGE_CTRL] & 0x01
+        buf[0] = self.gaugeRom[self._gaugePtr % self._GAUGE_SIZE] if enabled else 0
+        self._gaugePtr += 1
+
+    def _writeRegisters(self, addr: int, reg: int, buf) -> None:
+        if reg == self._GAUGE_PORT:
+            self._checkGaugeAccess(buf)
+            if self.regs[self._GAUGE_CTRL] & 0x01:
+                self.gaugeRom[self._gaugePtr % self._GAUGE_SIZE] = buf[0]
+                self._gaugePtr += 1
+            return
+        before = self.regs[self._GAUGE_CTRL]
+        super()._writeRegisters(addr, reg, buf)
+        if not before & 0x01 and self.regs[self._GAUGE_CTRL] & 0x01:
+            self._gaugePtr = 0
+
+    def _checkGaugeAccess(self, buf) -> None:
+        if len(buf) != 1:
+            raise ValueError("Mistake ! Burst access to the gauge port is not modeled")
+
+    def _applyState(self, state: dict) -> None:
+        status1 = self.regs[0x00] & ~0x28 & 0xFF
+        if state['vbus']:
+            status1 |= 0x20
+        if state['battery']:
+            status1 |= 0x08
+        direction, charger = self._CHARGE_STATUS[state['charge']]
+        status2 = (direction << 5) | charger
+        if not state['vbus']:
+            status2 |= 0x08
+        self.regs[0x00] = status1
+        self.regs[0x01] = status2
+
+    def _transitionIrq(self, key: str, value) -> int:
+        if key == 'vbus':
+            return self._VBUS_INSERT if value else self._VBUS_REMOVE
+        if key == 'battery':
+            return self._BAT_INSERT if value else self._BAT_REMOVE
+        if key == 'charge':
+            if value == 'charging':
+                return self._CHG_START
+            if value == 'done':
+                return self._CHG_DONE
+        return 0
+
+
+class AXP192Simulator(PMUSimulator):
+
+    # @brief  AXP192 register model.  ADC channels: vbat, vbus, acin,
+    #         vsys (mV), ichg, idischg (mA) and temp (degree Celsius).
+    _CHIP_ID = 0x03
+    _INTEN = (0x40, 0x41, 0x42, 0x43, 0x4A)
+    _INTSTS = (0x44, 0x45, 0x46, 0x47, 0x4D)
+    _READ_ONLY = (0x00, 0x01, 0x02, 0x03) + tuple(range(0x56, 0x80))
+    _CHANNELS = {
+        'acin': (0x56, _H8L4, 1.7, 0),
+        'vbus': (0x5A, _H8L4, 1.7, 0),
+        'temp': (0x5E, _H8L4, 0.1, 144.7),
+        'vbat': (0x78, _H8L4, 1.1, 0),
+        'ichg': (0x7A, _H8L5, 0.5, 0),
+        'idischg': (0x7C, _H8L5, 0.5, 0),
+        'vsys': (0x7E, _H8L4, 1.4, 0),
+    }
+    _DEFAULTS = (
+        (0x12, 0x01),   # DC1 on
+        (0x26, 0x68),   # DC1 3300mV
+        (0x40, 0xD8),   # IRQ enable 1
+        (0x41, 0xFF),   # IRQ enable 2
+        (0x42, 0x3B),   # IRQ enable 3
+        (0x43, 0xC1),   # IRQ enable 4
+        (0x82, 0x83),   # ADC enable 1
+    )
+
+    _ACIN_CONNECT = 1 << 6
+    _ACIN_REMOVE = 1 << 5
+    _VBUS_INSERT = 1 << 3
+    _VBUS_REMOVE = 1 << 2
+    _BAT_INSERT = 1 << 15
+    _BAT_REMOVE = 1 << 14
+    _CHG_START = 1 << 11
+    _CHG_DONE = 1 << 10
+
+    def _applyState(self, state: dict) -> None:
+        status = 0
+        if state['acin']:
+            status |= 0xC0
+        if state['vbus']:
+            status |= 0x30
+        if state['acin'] or state['vbus']:
+            status |= 0x01
+        charging = state['charge'] == 'charging'
+        if charging:
+            status |= 0x04
+        mode = 0
+        if charging:
+            mode |= 0x40
+        if state['battery']:
+            mode |= 0x20
+        self.regs[0x00] = status
+        self.regs[0x01] = mode
+
+    def _transitionIrq(self, key: str, value) -> int:
+        if key == 'acin':
+            return self._ACIN_CONNECT if value else self._ACIN_REMOVE
+        if key == 'vbus':
+            return self._VBUS_INSERT if value else self._VBUS_REMOVE
+        if key == 'battery':
+            return self._BAT_INSERT if value else self._BAT_REMOVE
+        if key == 'charge':
+            if value == 'charging':
+                return self._CHG_START
+            if value == 'done':
+                return self._CHG_DONE
+        return 0
@@ -0,0 +1,321 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      PollScheduler.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+from array import array
+from I2CInterface import ticks_ms, ticks_diff, ticks_add
+
+try:
+    from micropython import schedule
+except ImportError:
+    schedule = None
+
+
+def _gcd(a: int, b: int) -> int:
+    while b:
+        a, b = b, a % b
+    return a
+
+
+class PollScheduler:
+
+    # Fields not polled: reading the interrupt status here would bypass
+    # the IRQ event queue and IrqDispatcher, use those instead
+    _EXCLUDED = ('irqStatus',)
+
+    # @brief  Polls PMU values, each at its own rate, e.g.
+    #         sched = PollScheduler(pmu)
+    #         sched.add('vbusIn', 50, onVbus)
+    #         sched.add('battVoltage', 1000)
+    #         sched.add('temperature', 10000)
+    #         The values are the driver readFields() fields.  poll() reads
+    #         all values that are due with one cached read plan (see
+    #         ReadPlan.py), adjacent registers share a burst read.  A value
+    #         due within slackMs is read along with the others instead of
+    #         on its own a little later.  Results go to the per value
+    #         callback, handler(name, value), and to a ring buffer read
+    #         with pop() when capacity is not 0.
+    #         Run it with start() as an asyncio task, with attachTimer()
+    #         from a machine.Timer, or call poll() from a main loop.
+    # @param  pmu: AXP2101 or AXP192 driver
+    # @param  capacity: samples kept for pop(), the oldest are dropped
+    # @param  slackMs: how early a value may be read, None for a quarter
+    #         of the shortest period
+    def __init__(self, pmu, capacity: int = 0, slackMs: int = None) -> None:
+        self._pmu = pmu
+        self._names = []
+        self._periods = []
+        self._due = []
+        self._handlers = []
+        self._changesOnly = []
+        self._last = []
+        self._slackMs = slackMs
+        self._slack = 0
+        # Ring buffer of (value index, ticks, value)
+        self._capacity = capacity
+        self._ringIndex = bytearray(capacity)
+        self._ringTime = array('L', [0]) * capacity
+        self._ringValue = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self.overflow = 0
+        # Timer / task binding.  The bound methods are created here,
+        # creating them in the timer handler would allocate.
+        self._timer = None
+        self._tickMs = 0
+        self._task = None
+        self._pending = False
+        self._tickRef = self._tick
+        self._runRef = self._run
+
+    # @brief  Poll a value every periodMs, or change the period and the
+    #         handler of a value already polled.  It is first read on the
+    #         next poll().
+    # @param  name: field name, see pmu.getFieldNames(), except
+    #         irqStatus
+    # @param  handler: called with (name, value) after each read
+    # @param  changesOnly: only call the handler and record a sample when
+    #         the value differs from the previous read
+    def add(self, name: str, periodMs: int, handler=None, changesOnly: bool = False) -> None:
+        if name not in self._pmu._FIELDS:
+            raise ValueError("Mistake ! Unknown field %s" % name)
+        if name in self._EXCLUDED:
+            raise ValueError("Mistake ! %s can not be polled, use IrqDispatcher" % name)
+        if periodMs <= 0:
+            raise ValueError("Mistake ! The poll period must be greater than 0")
+        if name in self._names:
+            i = self._names.index(name)
+            self._periods[i] = periodMs
+            self._handlers[i] = handler
+            self._changesOnly[i] = changesOnly
+        else:
+            if len(self._names) >= 255:
+                raise ValueError("Mistake ! Too many polled values")
+            self._names.append(name)
+            self._periods.append(periodMs)
+            self._due.append(ticks_ms())
+            self._handlers.append(handler)
+            self._changesOnly.append(changesOnly)
+            self._last.append(None)
+        self._update()
+
+    # @brief  Change the rate of a polled value, e.g. poll the battery
+    #         faster while charging.  The next read is moved up when the
+    #         new period ends before it.
+    def setPeriod(self, name: str, periodMs: int) -> None:
+        if periodMs <= 0:
+            raise ValueError("Mistake ! The poll period must be greater than 0")
+        i = self._index(name)
+        now = ticks_ms()
+        due = ticks_add(now, periodMs)
+        if ticks_diff(self._due[i], due) > 0:
+            self._due[i] = due
+        self._periods[i] = periodMs
+        self._update()
+
+    def getPeriod(self, name: str) -> int:
+        return self._periods[self._index(name)]
+
+    def remove(self, name: str) -> None:
+        i = self._index(name)
+        for values in (self._names, self._periods, self._due, self._handlers,
+                       self._changesOnly, self._last):
+            values.pop(i)
+        # Samples of the removed value and the ones after it would change
+        # meaning, drop the ring buffer
+        self.clear()
+        self._update()
+
+    def getNames(self) -> list:
+        return list(self._names)
+
+    # @brief  Last value read, None before the first read.
+    def getValue(self, name: str):
+        return self._last[self._index(name)]
+
+    def _index(self, name: str) -> int:
+        if name not in self._names:
+            raise ValueError("Mistake ! %s is not polled" % name)
+        return self._names.index(name)
+
+    # Recompute the slack and the timer tick after the periods changed
+    def _update(self) -> None:
+        if self._slackMs is not None:
+            self._slack = self._slackMs
+        elif self._periods:
+            self._slack = min(self._periods) // 4
+        if self._timer is not None and self._periods and self._timerTick() != self._tickMs:
+            self.attachTimer(self._timer)
+
+    # @brief  Read the values that are due, with the fewest burst reads.
+    # @retval number of values read
+    def poll(self) -> int:
+        now = ticks_ms()
+        due = []
+        for i in range(len(self._names)):
+            if ticks_diff(self._due[i], now) <= self._slack:
+                due.append(i)
+        if not due:
+            return 0
+        pmu = self._pmu
+        plan = pmu.getReadPlan([self._names[i] for i in due])
+        # Always the chip content, a staleness budget would hand back the
+        # copy this poll refreshed last time
+        plan.read(pmu, 0)
+        for k in range(len(due)):
+            i = due[k]
+            nxt = ticks_add(self._due[i], self._periods[i])
+            if ticks_diff(nxt, now) <= 0:
+                # Fell behind, skip the missed reads instead of catching up
+                nxt = ticks_add(now, self._periods[i])
+            self._due[i] = nxt
+            value = plan.value(k)
+            if self._changesOnly[i] and value == self._last[i]:
+                continue
+            self._last[i] = value
+            if self._capacity:
+                self._push(i, now, value)
+            handler = self._handlers[i]
+            if handler is not None:
+                handler(self._names[i], value)
+        return len(due)
+
+    # @brief  Milliseconds until the next value is due, 0 when one is due.
+    #         -1 when nothing is polled.
+    def nextDueMs(self) -> int:
+        if not self._names:
+            return -1
+        now = ticks_ms()
+        wait = ticks_diff(self._due[0], now)
+        for i in range(1, len(self._names)):
+            d = ticks_diff(self._due[i], now)
+            if d < wait:
+                wait = d
+        return max(0, wait - self._slack)
+
+    def _push(self, i: int, now: int, value) -> None:
+        if self._count == self._capacity:
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+            self.overflow += 1
+        slot = (self._head + self._count) % self._capacity
+        self._ringIndex[slot] = i
+        self._ringTime[slot] = now
+        self._ringValue[slot] = value
+        self._count += 1
+
+    # @brief  Oldest sample in the ring buffer.
+    # @retval (name, value, ticks_ms of the read) or None when empty
+    def pop(self):
+        if not self._count:
+            return None
+        slot = self._head
+        self._head = (self._head + 1) % self._capacity
+        self._count -= 1
+        value = self._ringValue[slot]
+        self._ringValue[slot] = None
+        return (self._names[self._ringIndex[slot]], value, self._ringTime[slot])
+
+    def clear(self) -> None:
+        for i in range(self._capacity):
+            self._ringValue[i] = None
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    # @brief  Run poll() as an asyncio (uasyncio) task, sleeping until the
+    #         next value is due in between.
+    def start(self):
+        if self._task is None:
+            try:
+                import asyncio
+            except ImportError:
+                import uasyncio as asyncio
+            self._task = asyncio.create_task(self._loop(asyncio))
+        return self
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.detachTimer()
+
+    async def _loop(self, asyncio) -> None:
+        while True:
+            self.poll()
+            wait = self.nextDueMs()
+            if wait < 0:
+                wait = 100
+            await asyncio.sleep(wait / 1000)
+
+    # @brief  Run poll() from a periodic machine.Timer, ticking at the
+    #         greatest common divisor of the periods (at least 10 ms).
+    #         The timer handler only schedules the poll with
+    #         micropython.schedule(), the bus is not touched in interrupt
+    #         context.  The tick follows later add() / setPeriod() calls.
+    #         Needs micropython.schedule(), without it use start() or
+    #         poll().
+    # @param  timer: machine.Timer, e.g. Timer(0) or Timer(-1)
+    def attachTimer(self, timer) -> None:
+        if schedule is None:
+            raise ValueError("Mistake ! attachTimer() needs micropython.schedule()")
+        if not self._periods:
+            raise ValueError("Mistake ! Add a value to poll first")
+        self.detachTimer()
+        self._timer = timer
+        self._pending = False
+        self._tickMs = self._timerTick()
+        timer.init(period=self._tickMs, mode=timer.PERIODIC, callback=self._tickRef)
+
+    def detachTimer(self) -> None:
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+
+    def _timerTick(self) -> int:
+        tick = 0
+        for period in self._periods:
+            tick = _gcd(tick, period)
+        return max(tick, 10)
+
+    # Timer handler, may run in hard IRQ context: no allocation, no bus
+    # access, the poll runs later from _run()
+    def _tick(self, timer) -> None:
+        if not self._pending:
+            self._pending = True
+            try:
+                schedule(self._runRef, 0)
+            except RuntimeError:
+                # Schedule queue full, the next tick tries again
+                self._pending = False
+
+    def _run(self, arg) -> None:
+        self._pending = False
+        self.poll()
@@ -0,0 +1,169 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      PowerKey.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+from I2CInterface import ticks_ms, ticks_diff
+
+
+class PowerKey:
+
+    CLICK = 1           # short press and release
+    DOUBLE_CLICK = 2    # second click within doubleClickMs of the first
+    LONG_HOLD = 3       # key still held when the long press time expired
+    HOLD_RELEASE = 4    # key released after a LONG_HOLD
+
+    # @brief  Power key gesture recognizer driven by the PMU interrupts,
+    #         registered on the driver IrqDispatcher, no status polling.
+    #         handler(gesture, durationMs) is called with one of the
+    #         gestures above and how long the key was held (0 when not
+    #         known).
+    #         AXP2101: the press / release edge interrupts time every
+    #         press, LONG_HOLD comes from the long press interrupt.
+    #         AXP192: there are no edge interrupts, a click is the short
+    #         press interrupt and durations are 0.
+    #         A single CLICK is only reported once doubleClickMs has passed
+    #         without a second click: call update() now and then (it does
+    #         not touch the bus), or it is reported with the next key
+    #         event.  doubleClickMs 0 reports every click at once and no
+    #         DOUBLE_CLICK.
+    def __init__(self, pmu, handler, doubleClickMs: int = 300) -> None:
+        self._pmu = pmu
+        self._handler = handler
+        self.doubleClickMs = doubleClickMs
+        press, release, short, long = pmu._PKEY_IRQS
+        if not long:
+            raise ValueError("Mistake ! %s has no power key interrupts" % type(pmu).__name__)
+        self._press = press
+        self._release = release
+        self._short = short
+        self._long = long
+        if press and release:
+            self._mask = press | release | long
+        else:
+            self._mask = short | long
+        self._pressedAt = None
+        self._held = False
+        self._skipPress = False
+        self._skipLong = False
+        self._pending = False
+        self._pendingAt = 0
+        self._pendingMs = 0
+        pmu.enableIRQ(self._mask)
+        self._dispatcher = pmu.getIrqDispatcher()
+        self._dispatcher.on(self._mask, self._onIrq)
+
+    # @brief  Stop recognizing, the interrupts stay enabled.
+    def close(self) -> None:
+        self._dispatcher.off(self._mask, self._onIrq)
+
+    # @brief  Report a single click whose double click window has expired.
+    def update(self) -> None:
+        if self._pending and ticks_diff(ticks_ms(), self._pendingAt) > self.doubleClickMs:
+            self._pending = False
+            self._handler(self.CLICK, self._pendingMs)
+
+    # True when irq is latched in the status read being dispatched
+    def _latched(self, irq: int) -> bool:
+        i = 0
+        while irq > 0xFF:
+            irq >>= 8
+            i += 1
+        return bool(self._pmu.statusRegister[i] & irq)
+
+    # The dispatcher calls this per interrupt bit, lowest bit first: on the
+    # AXP2101 the release edge comes before the press edge and the long
+    # press when they were latched by the same status read
+    def _onIrq(self, irq: int) -> None:
+        now = ticks_ms()
+        if irq == self._release:
+            pressed = self._latched(self._press)
+            if self._pressedAt is not None:
+                self._longFirst(now)
+                self._released(now, ticks_diff(now, self._pressedAt))
+                if pressed:
+                    # Released and pressed again since the last read
+                    self._pressedAt = now
+                    self._held = False
+                    self._skipPress = True
+            elif pressed:
+                # Pressed and released since the last read
+                self._skipPress = True
+                self._held = False
+                self._longFirst(now)
+                self._released(now, 0)
+        elif irq == self._press:
+            if self._skipPress:
+                self._skipPress = False
+            else:
+                self._pressedAt = now
+                self._held = False
+        elif irq == self._long:
+            if self._skipLong:
+                self._skipLong = False
+            else:
+                self._longHold(now)
+        elif irq == self._short:
+            self._click(now, 0)
+
+    # A long press latched with the release was before it, report it
+    # first and skip it when the dispatcher gets to its bit
+    def _longFirst(self, now: int) -> None:
+        if self._latched(self._long):
+            self._skipLong = True
+            self._longHold(now)
+
+    def _longHold(self, now: int) -> None:
+        self._held = True
+        held = 0
+        if self._pressedAt is not None:
+            held = ticks_diff(now, self._pressedAt)
+        self._handler(self.LONG_HOLD, held)
+
+    def _released(self, now: int, held: int) -> None:
+        self._pressedAt = None
+        if self._held:
+            self._held = False
+            self._handler(self.HOLD_RELEASE, held)
+        else:
+            self._click(now, held)
+
+    def _click(self, now: int, held: int) -> None:
+        if not self.doubleClickMs:
+            self._handler(self.CLICK, held)
+        elif self._pending and ticks_diff(now, self._pendingAt) <= self.doubleClickMs:
+            self._pending = False
+            self._handler(self.DOUBLE_CLICK, held)
+        else:
+            self.update()
+            if self._pending:
+                # Window expired without update(), report it now
+                self._pending = False
+                self._handler(self.CLICK, self._pendingMs)
+            self._pending = True
+            self._pendingAt = now
+            self._pendingMs = held
@@ -0,0 +1,344 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      Rail.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+from array import array
+from ReadPlan import planBursts
+
+try:
+    from time import sleep_ms, sleep_us
+except ImportError:
+    from time import sleep
+
+    def sleep_ms(ms: int) -> None:
+        sleep(ms / 1000)
+
+    def sleep_us(us: int) -> None:
+        sleep(us / 1000000)
+
+# Rail descriptor, one tuple per output in the driver _RAILS table:
+# (enable register, enable mask, enable value,
+#  voltage register, voltage mask, voltage shift, flags, segments)
+# segments: ((min mV, max mV, step mV, first code), ...), searched in order
+RAIL_EN_REG = 0
+RAIL_EN_MASK = 1
+RAIL_EN_VALUE = 2
+RAIL_VOL_REG = 3
+RAIL_VOL_MASK = 4
+RAIL_VOL_SHIFT = 5
+RAIL_FLAGS = 6
+RAIL_SEGMENTS = 7
+
+# Voltage writes keep the register bits outside the voltage mask
+RAIL_KEEP_BITS = 0x01
+# The rail has hardware DVM: with bit 7 of the voltage register set the
+# chip moves to a new voltage one code at a time, one code per 15.625us,
+# or per 31.25us when bit 5 of the enable register is set
+RAIL_DVM = 0x02
+
+_DVM_ENABLE = 0x80
+_DVM_SLOW = 0x20
+
+
+# Per-rail voltage lookup tables, built once per descriptor on first use
+# and shared by every driver instance:
+# (lowest mV, mV per encode table slot, encode table, decode table)
+# The encode table holds the code for every multiple of the slot size
+# above the lowest voltage, _NO_CODE where the rail has no output.
+# The decode table holds the mV for every code the voltage field can hold.
+_NO_CODE = 0xFF
+_voltageTables = {}
+
+
+def _gcd(a: int, b: int) -> int:
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def voltageTables(desc: tuple) -> tuple:
+    tables = _voltageTables.get(desc)
+    if tables is not None:
+        return tables
+    segments = desc[RAIL_SEGMENTS]
+    low = min(s[0] for s in segments)
+    high = max(s[1] for s in segments)
+    unit = 0
+    for vmin, vmax, step, base in segments:
+        unit = _gcd(_gcd(unit, step), vmin - low)
+    encode = bytearray([_NO_CODE]) * ((high - low) // unit + 1)
+    decode = array('H', [high]) * ((desc[RAIL_VOL_MASK] >> desc[RAIL_VOL_SHIFT]) + 1)
+    # Reversed, so the first segment wins where segments overlap
+    for vmin, vmax, step, base in reversed(segments):
+        for i in range((vmax - vmin) // step + 1):
+            encode[(vmin + i * step - low) // unit] = base + i
+            decode[base + i] = vmin + i * step
+    tables = (low, unit, encode, decode)
+    _voltageTables[desc] = tables
+    return tables
+
+
+# @brief  Voltage code for millivolt, raises ValueError when the rail
+#         cannot output it.
+def encodeVoltage(name: str, desc: tuple, millivolt: int) -> int:
+    return _lookupCode(name, desc, voltageTables(desc), millivolt)
+
+
+def _lookupCode(name: str, desc: tuple, tables: tuple, millivolt: int) -> int:
+    low, unit, encode, decode = tables
+    offset = millivolt - low
+    if offset >= 0 and not offset % unit and offset // unit < len(encode):
+        code = encode[offset // unit]
+        if code != _NO_CODE:
+            return code
+    _voltageError(name, desc, millivolt)
+
+
+# Raise the ValueError that explains why millivolt has no code
+def _voltageError(name: str, desc: tuple, millivolt: int) -> None:
+    segments = desc[RAIL_SEGMENTS]
+    low = min(s[0] for s in segments)
+    high = max(s[1] for s in segments)
+    if millivolt < low:
+        raise ValueError("Mistake ! %s minimum output voltage is  %umV" % (name, low))
+    if millivolt > high:
+        raise ValueError("Mistake ! %s maximum output voltage is  %umV" % (name, high))
+    for vmin, vmax, step, base in segments:
+        if vmin <= millivolt <= vmax:
+            raise ValueError("Mistake ! The steps is must %u mV" % step)
+    raise ValueError("Mistake ! %s can not output %umV" % (name, millivolt))
+
+
+# @brief  Millivolt for a voltage code (already masked and shifted).
+#         Reserved codes read back as the highest voltage of the rail.
+def decodeVoltage(desc: tuple, code: int) -> int:
+    return voltageTables(desc)[3][code]
+
+
+class Rail:
+
+    # @brief  One regulator output of a PMU, described by a _RAILS table
+    #         entry of the driver.  Get it with pmu.rail('DC3').
+    def __init__(self, pmu, name: str, desc: tuple) -> None:
+        self._pmu = pmu
+        self.name = name
+        self.desc = desc
+        self._tables = voltageTables(desc)
+
+    def __repr__(self) -> str:
+        return '<Rail %s>' % self.name
+
+    def isEnabled(self) -> bool:
+        d = self.desc
+        val = self._pmu.readRegisterByte(d[RAIL_EN_REG])
+        return (val & d[RAIL_EN_MASK]) == d[RAIL_EN_VALUE]
+
+    def enable(self) -> None:
+        d = self.desc
+        val = self._pmu.readRegisterByte(d[RAIL_EN_REG]) & ~d[RAIL_EN_MASK]
+        self._pmu.writeRegister(d[RAIL_EN_REG], val | d[RAIL_EN_VALUE])
+
+    def disable(self) -> None:
+        d = self.desc
+        val = self._pmu.readRegisterByte(d[RAIL_EN_REG]) & ~d[RAIL_EN_MASK]
+        self._pmu.writeRegister(d[RAIL_EN_REG], val)
+
+    def setVoltage(self, millivolt: int) -> None:
+        d = self.desc
+        code = _lookupCode(self.name, d, self._tables, millivolt) << d[RAIL_VOL_SHIFT]
+        if d[RAIL_FLAGS] & RAIL_KEEP_BITS:
+            code |= self._pmu.readRegisterByte(d[RAIL_VOL_REG]) & ~d[RAIL_VOL_MASK] & 0xFF
+        self._pmu.writeRegister(d[RAIL_VOL_REG], code)
+
+    def getVoltage(self) -> int:
+        d = self.desc
+        val = self._pmu.readRegisterByte(d[RAIL_VOL_REG])
+        return self._tables[3][(val & d[RAIL_VOL_MASK]) >> d[RAIL_VOL_SHIFT]]
+
+    # @brief  Move the output to millivolt in bounded steps.  Every write
+    #         changes the voltage by at most step mV, to the furthest
+    #         voltage the rail can output within that bound; step 0 writes
+    #         the target at once.  With slew (mV/us) given, each write is
+    #         followed by a wait of its voltage change / slew, so the rail
+    #         has settled on return.
+    #         With hardware DVM enabled (AXP2101 DC2/DC3, see
+    #         enableDC2DVM()) the chip ramps on its own at one code per
+    #         15.625us or 31.25us (setDVMRampSlope()); each write is then
+    #         followed by at least that time per code it moves, also
+    #         without slew.  The ramp slope is read once, from the enable
+    #         register.
+    #         The register is read once (from the shadow cache when it is
+    #         enabled), every write reuses the bits outside the voltage
+    #         field from that read: one plain write per step.
+    # @retval number of register writes
+    def rampVoltage(self, millivolt: int, slew: float = 0, step: int = 0) -> int:
+        d = self.desc
+        low, unit, encode, decode = self._tables
+        target = _lookupCode(self.name, d, self._tables, millivolt)
+        reg = d[RAIL_VOL_REG]
+        shift = d[RAIL_VOL_SHIFT]
+        with self._pmu.session():
+            val = self._pmu.readRegisterByte(reg)
+            keep = 0
+            if d[RAIL_FLAGS] & RAIL_KEEP_BITS:
+                keep = val & ~d[RAIL_VOL_MASK] & 0xFF
+            nowCode = (val & d[RAIL_VOL_MASK]) >> shift
+            now = decode[nowCode]
+            # Hardware ramp time per code in ns, 0 without DVM
+            dvm = 0
+            if d[RAIL_FLAGS] & RAIL_DVM and val & _DVM_ENABLE:
+                dvm = 15625
+                if self._pmu.readRegisterByte(d[RAIL_EN_REG]) & _DVM_SLOW:
+                    dvm = 31250
+            writes = 0
+            while True:
+                mv = millivolt
+                code = target
+                if step and abs(millivolt - now) > step:
+                    # Furthest output voltage within step mV of the present one,
+                    # or the nearest one past it across a gap in the range
+                    up = unit if millivolt > now else -unit
+                    mv = now + step if up > 0 else now - step
+                    mv -= (mv - low) % unit if up > 0 else -((low - mv) % unit)
+                    while mv != now and encode[(mv - low) // unit] == _NO_CODE:
+                        mv -= up
+                    if mv == now:
+                        mv = now + up
+                        while encode[(mv - low) // unit] == _NO_CODE:
+                            mv += up
+                    code = encode[(mv - low) // unit]
+                self._pmu.writeRegister(reg, keep | (code << shift))
+                writes += 1
+                wait = 0
+                if slew:
+                    wait = int(abs(mv - now) / slew)
+                if dvm:
+                    wait = max(wait, (abs(code - nowCode) * dvm + 999) // 1000)
+                if wait:
+                    sleep_us(wait)
+                now = mv
+                nowCode = code
+                if mv == millivolt:
+                    return writes
+
+    # @brief  (minimum, maximum) output voltage in mV.
+    def getVoltageRange(self) -> tuple:
+        low, unit, encode, decode = self._tables
+        return (low, low + (len(encode) - 1) * unit)
+
+
+# @brief  Apply a power plan with the fewest register writes.
+#         The plan is a sequence of (rail name, setting) entries and
+#         integer delays.  A setting is a voltage in mV (set it and enable
+#         the rail), True (enable at the present voltage) or 0 / False
+#         (disable).  Entries up to the next delay form one step: their
+#         voltage writes go first, then their enable writes, one write per
+#         register in the order the registers first appear.  A delay is
+#         waited out in ms before the next step starts.
+#         The whole plan is checked before anything is written, a bad
+#         rail name or voltage raises ValueError with the chip untouched.
+# @retval {rail name: (enabled, millivolt)} for every rail in the plan
+def applyPowerPlan(pmu, plan) -> dict:
+    steps = []
+    voltages = []
+    enables = []
+    rails = []
+    for entry in plan:
+        if isinstance(entry, int):
+            steps.append((voltages, enables, entry))
+            voltages = []
+            enables = []
+            continue
+        name, setting = entry
+        r = pmu.rail(name)
+        d = r.desc
+        if r.name not in [x.name for x in rails]:
+            rails.append(r)
+        if setting is not True and setting:
+            mask = d[RAIL_VOL_MASK]
+            if not d[RAIL_FLAGS] & RAIL_KEEP_BITS:
+                mask = 0xFF
+            code = encodeVoltage(r.name, d, setting) << d[RAIL_VOL_SHIFT]
+            _coalesce(voltages, d[RAIL_VOL_REG], mask, code)
+            setting = True
+        value = d[RAIL_EN_VALUE] if setting else 0
+        _coalesce(enables, d[RAIL_EN_REG], d[RAIL_EN_MASK], value)
+    steps.append((voltages, enables, 0))
+
+    # Each register is read once, later steps work on the read values
+    regs = readRailRegisters(pmu, rails)
+
+    for voltages, enables, delay in steps:
+        for writes in (voltages, enables):
+            for reg, mask, value in writes:
+                val = (regs[reg] & ~mask & 0xFF) | value
+                if val != regs[reg]:
+                    pmu.writeRegister(reg, val)
+                    regs[reg] = val
+        if delay:
+            sleep_ms(delay)
+
+    return railStates(rails, regs)
+
+
+# @brief  Read the enable and voltage registers of rails with as few
+#         burst reads as possible.
+# @retval {register: value}
+def readRailRegisters(pmu, rails) -> dict:
+    wanted = []
+    for r in rails:
+        for reg in (r.desc[RAIL_EN_REG], r.desc[RAIL_VOL_REG]):
+            if reg not in wanted:
+                wanted.append(reg)
+    regs = {}
+    for start, length in planBursts(wanted, barriers=pmu._PORT_REGISTERS):
+        buf = pmu.readRegisters(start, length)
+        for j in range(len(buf)):
+            regs[start + j] = buf[j]
+    return regs
+
+
+# @brief  Decode (enabled, millivolt) of rails from register values.
+def railStates(rails, regs: dict) -> dict:
+    state = {}
+    for r in rails:
+        d = r.desc
+        enabled = (regs[d[RAIL_EN_REG]] & d[RAIL_EN_MASK]) == d[RAIL_EN_VALUE]
+        code = (regs[d[RAIL_VOL_REG]] & d[RAIL_VOL_MASK]) >> d[RAIL_VOL_SHIFT]
+        state[r.name] = (enabled, decodeVoltage(d, code))
+    return state
+
+
+# Merge a masked field change into the write list of a step
+def _coalesce(writes: list, reg: int, mask: int, value: int) -> None:
+    for i in range(len(writes)):
+        w = writes[i]
+        if w[0] == reg:
+            writes[i] = (reg, w[1] | mask, (w[2] & ~mask) | value)
+            return
+    writes.append((reg, mask, value))
@@ -0,0 +1,169 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      ReadPlan.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+'''
+
+# Field descriptor, one tuple per value in the driver _FIELDS table:
+# (registers, kind, a, b)
+# registers: the registers holding the value, high byte first for the
+# HxLy kinds, byte 0 first for FIELD_LE
+FIELD_REGS = 0
+FIELD_KIND = 1
+FIELD_A = 2
+FIELD_B = 3
+
+# Kinds.  FIELD_BITS: (register & a) >> b.  FIELD_HxLy: x high bits from
+# the first register and y low bits from the second, times a plus b.
+# FIELD_LE / FIELD_BE: the registers as one little / big endian integer.
+# FIELD_MATCH: 1 when (register n & a[n]) == b[n] for every register,
+# else 0, for flags that combine bits of several registers.
+FIELD_BITS = 0
+FIELD_H8L4 = 1
+FIELD_H8L5 = 2
+FIELD_H6L8 = 3
+FIELD_H5L8 = 4
+FIELD_LE = 5
+FIELD_BE = 6
+FIELD_MATCH = 7
+
+# A burst read costs the device address, the register address and the
+# device address again after the repeated start; up to that many unused
+# registers between two wanted ones are cheaper to read than a new burst
+BURST_GAP = 3
+
+
+# @brief  Cover the registers in regs with as few burst reads as possible,
+#         bridging gaps of at most maxGap registers.  A gap containing one
+#         of the barrier registers (data ports, where a read has a side
+#         effect) is never bridged.
+# @retval [(first register, length), ...] in register order
+def planBursts(regs, maxGap: int = BURST_GAP, barriers=()) -> list:
+    wanted = sorted(set(regs))
+    bursts = []
+    i = 0
+    while i < len(wanted):
+        start = end = wanted[i]
+        i += 1
+        while i < len(wanted) and wanted[i] - end <= maxGap + 1:
+            blocked = False
+            for reg in barriers:
+                if end < reg < wanted[i]:
+                    blocked = True
+            if blocked:
+                break
+            end = wanted[i]
+            i += 1
+        bursts.append((start, end - start + 1))
+    return bursts
+
+
+class ReadPlan:
+
+    # @brief  Precompiled read schedule for a set of fields, built by
+    #         I2CInterface.getReadPlan() and kept for later calls with the
+    #         same names.  read() fetches every field with the planned
+    #         burst reads into buffers allocated here, value() decodes.
+    # @param  names: field names, in the order of value(i)
+    # @param  descs: their field descriptors
+    # @param  barriers: registers no burst may read across
+    def __init__(self, names: tuple, descs: list, barriers=()) -> None:
+        self.names = names
+        self._descs = descs
+        regs = []
+        for d in descs:
+            regs.extend(d[FIELD_REGS])
+        self._bursts = []
+        where = {}
+        for start, length in planBursts(regs, BURST_GAP, barriers):
+            buf = bytearray(length)
+            self._bursts.append((start, buf))
+            for i in range(length):
+                where[start + i] = (buf, i)
+        self._slots = [tuple([where[r] for r in d[FIELD_REGS]]) for d in descs]
+
+    # @brief  Number of burst reads done by read().
+    def getBurstCount(self) -> int:
+        return len(self._bursts)
+
+    # @brief  (first register, length) of every planned burst.
+    def getBursts(self) -> list:
+        return [(start, len(buf)) for start, buf in self._bursts]
+
+    # @brief  Read all fields from the chip.
+    # @param  maxAgeMs: staleness budget, see I2CInterface.setMaxAge()
+    def read(self, pmu, maxAgeMs=None) -> None:
+        with pmu.session():
+            for start, buf in self._bursts:
+                pmu.readRegisters(start, len(buf), buf, maxAgeMs)
+
+    # @brief  Decoded value of field i as of the last read().
+    def value(self, i: int):
+        d = self._descs[i]
+        slots = self._slots[i]
+        kind = d[FIELD_KIND]
+        if kind == FIELD_BITS:
+            buf, j = slots[0]
+            return (buf[j] & d[FIELD_A]) >> d[FIELD_B]
+        if kind == FIELD_MATCH:
+            masks = d[FIELD_A]
+            want = d[FIELD_B]
+            for n in range(len(slots)):
+                buf, j = slots[n]
+                if buf[j] & masks[n] != want[n]:
+                    return 0
+            return 1
+        if kind == FIELD_LE or kind == FIELD_BE:
+            raw = 0
+            for n in range(len(slots)):
+                buf, j = slots[n]
+                if kind == FIELD_LE:
+                    raw |= buf[j] << (n * 8)
+                else:
+                    raw = (raw << 8) | buf[j]
+            return raw
+        hbuf, h = slots[0]
+        lbuf, l = slots[1]
+        if kind == FIELD_H8L4:
+            raw = (hbuf[h] << 4) | (lbuf[l] & 0x0F)
+        elif kind == FIELD_H8L5:
+            raw = (hbuf[h] << 5) | (lbuf[l] & 0x1F)
+        elif kind == FIELD_H6L8:
+            raw = ((hbuf[h] & 0x3F) << 8) | lbuf[l]
+        else:
+            raw = ((hbuf[h] & 0x1F) << 8) | lbuf[l]
+        if d[FIELD_A] == 1 and d[FIELD_B] == 0:
+            return raw
+        return raw * d[FIELD_A] + d[FIELD_B]
+
+    # @brief  All fields as {name: value} as of the last read().
+    # @param  out: optional dict to fill in place
+    def values(self, out=None) -> dict:
+        if out is None:
+            out = {}
+        for i in range(len(self.names)):
+            out[self.names[i]] = self.value(i)
+        return out
@@ -0,0 +1,92 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_batch.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from PMUSimulator import AXP2101Simulator
+from AXP2101 import AXP2101
+
+
+def steps(pmu, fail=False):
+    pmu.enableDC3()
+    pmu.setDC3Voltage(3300)
+    pmu.disableALDO1()
+    pmu.enableALDO2()
+    pmu.setALDO2Voltage(1800)
+    pmu.setALDO3Voltage(2500)
+    pmu.setChargingLedMode(pmu.XPOWERS_CHG_LED_BLINK_1HZ)
+    if fail:
+        raise RuntimeError('step failed')
+    pmu.setALDO2Voltage(3300)
+    pmu.disableDC3()
+
+
+def image(sim, pmu):
+    return bytes(sim.registers(pmu._address))
+
+
+@pytest.mark.parametrize('fail', (False, True))
+def test_batch_matches_sequential(fail):
+    simA = AXP2101Simulator()
+    pmuA = AXP2101(simA)
+    simB = AXP2101Simulator()
+    pmuB = AXP2101(simB)
+    try:
+        steps(pmuA, fail)
+    except RuntimeError:
+        pass
+    simB.resetCounters()
+    try:
+        with pmuB.batch():
+            steps(pmuB, fail)
+    except RuntimeError:
+        pass
+    assert not pmuB.isBatching()
+    assert image(simB, pmuB) == image(simA, pmuA)
+    assert simB.writes < simA.writes
+
+
+def test_untouched_registers_not_written():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    mem = sim.registers(pmu._address)
+    with pmu.batch():
+        pmu.writeRegister(0x92, 0x11)
+        pmu.readRegisterByte(0x93)
+        pmu.writeRegister(0x94, 0x22)
+        pmu.writeRegister(0x95, 0x33)
+        # Changed behind the batch, e.g. by the chip
+        mem[0x93] = 0x55
+    assert (mem[0x92], mem[0x93], mem[0x94], mem[0x95]) == (0x11, 0x55, 0x22, 0x33)
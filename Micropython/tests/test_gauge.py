@@ -0,0 +1,60 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_gauge.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PMUSimulator import AXP2101Simulator
+from AXP2101 import AXP2101
+
+MODEL = bytes(range(7, 135))
+
+
+def test_write_gauge_data_round_trip():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    sim.resetCounters()
+    assert pmu.writeGaugeData(MODEL)
+    assert bytes(sim.gaugeRom) == MODEL
+    # One transaction per model byte each way, plus the control pulses
+    assert sim.transactions == 272
+
+
+def test_compare_gauge_data_detects_mismatch():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    assert pmu.writeGaugeData(MODEL)
+    assert pmu.compareGaugeData(MODEL, len(MODEL))
+    other = bytearray(MODEL)
+    other[100] ^= 0x01
+    assert not pmu.compareGaugeData(other, len(other))
+    assert not pmu.compareGaugeData(MODEL[:64], 64)
@@ -0,0 +1,146 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_irq_dispatcher.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PMUSimulator import AXP2101Simulator, AXP192Simulator
+from AXP2101 import AXP2101
+from AXP192 import AXP192
+
+
+class Pin:
+
+    def __init__(self) -> None:
+        self.level = 1
+
+    def value(self) -> int:
+        return self.level
+
+
+def makePmu(cls, simCls, mask):
+    sim = simCls()
+    pmu = cls(sim)
+    pmu.disableIRQ(pmu.XPOWERS_AXP2101_ALL_IRQ if cls is AXP2101 else pmu.XPOWERS_AXP192_ALL_IRQ)
+    pmu.enableIRQ(mask)
+    return sim, pmu
+
+
+def test_handlers_in_bit_order_and_clear():
+    short = AXP2101.XPOWERS_AXP2101_PKEY_SHORT_IRQ
+    vbus = AXP2101.XPOWERS_AXP2101_VBUS_INSERT_IRQ
+    done = AXP2101.XPOWERS_AXP2101_BAT_CHG_DONE_IRQ
+    remove = AXP2101.XPOWERS_AXP2101_BAT_REMOVE_IRQ
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator, short | vbus | done | remove)
+    seen = []
+    d = pmu.getIrqDispatcher()
+    d.on(done | short, seen.append)
+    d.on(vbus, seen.append)
+    assert d.getHandledMask() == short | vbus | done
+    sim.raiseIrq(short | vbus | done | remove)
+    sim.resetCounters()
+    assert d.dispatch() == short | vbus | done
+    assert seen == [short, vbus, done]
+    # One burst read, one clear write
+    assert (sim.reads, sim.writes) == (1, 1)
+    # The pending interrupt without a handler stays latched
+    assert sim.irqActive()
+    pmu.getIrqStatus()
+    assert pmu.isBatRemoveIrq()
+    del seen[:]
+    assert d.dispatch(True) == 0
+    assert seen == []
+    assert not sim.irqActive()
+
+
+def test_disabled_interrupts_ignored():
+    short = AXP2101.XPOWERS_AXP2101_PKEY_SHORT_IRQ
+    long = AXP2101.XPOWERS_AXP2101_PKEY_LONG_IRQ
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator, short)
+    seen = []
+    d = pmu.getIrqDispatcher()
+    d.on(short | long, seen.append)
+    mem = sim.registers(pmu._address)
+    # Latched behind the enable mask
+    mem[pmu._IRQ_STATUS_REGS[1]] |= long >> 8
+    sim.raiseIrq(short)
+    d.dispatch()
+    assert seen == [short]
+
+
+def test_off():
+    short = AXP2101.XPOWERS_AXP2101_PKEY_SHORT_IRQ
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator, short)
+    seen = []
+    other = []
+    d = pmu.getIrqDispatcher()
+    d.on(short, seen.append)
+    d.on(short, other.append)
+    d.off(short, seen.append)
+    sim.raiseIrq(short)
+    d.dispatch()
+    assert (seen, other) == ([], [short])
+    d.off(short)
+    assert d.getHandledMask() == 0
+
+
+def test_axp192_status_gap():
+    timer = AXP192.XPOWERS_AXP192_TIMER_TIMEOUT_IRQ
+    vbus = AXP192.XPOWERS_AXP192_VBUS_INSERT_IRQ
+    sim, pmu = makePmu(AXP192, AXP192Simulator, timer | vbus)
+    seen = []
+    d = pmu.getIrqDispatcher()
+    d.on(timer | vbus, seen.append)
+    sim.raiseIrq(timer | vbus)
+    sim.resetCounters()
+    assert d.dispatch() == timer | vbus
+    assert seen == [vbus, timer]
+    assert sim.reads == 1
+    assert not sim.irqActive()
+
+
+def test_poll_follows_pin():
+    short = AXP2101.XPOWERS_AXP2101_PKEY_SHORT_IRQ
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator, short)
+    seen = []
+    d = pmu.getIrqDispatcher()
+    d.on(short, seen.append)
+    pin = Pin()
+    d.attach(pin)
+    sim.raiseIrq(short)
+    sim.resetCounters()
+    assert d.poll() == 0
+    assert sim.transactions == 0
+    pin.level = 0
+    assert d.poll() == short
+    assert seen == [short]
+    d.detach()
@@ -0,0 +1,100 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_irq_event_queue.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PMUSimulator import AXP2101Simulator
+from AXP2101 import AXP2101
+from IrqDispatcher import IrqDispatcher
+from IrqEventQueue import IrqEventQueue
+
+INSERT = AXP2101.XPOWERS_AXP2101_VBUS_INSERT_IRQ
+REMOVE = AXP2101.XPOWERS_AXP2101_VBUS_REMOVE_IRQ
+
+
+def _setup(windowMs: int):
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    pmu.disableIRQ(0xFFFFFF)
+    pmu.enableIRQ(INSERT | REMOVE)
+    pmu.clearIrqStatus()
+    queue = pmu.enableIrqEventQueue(8, windowMs)
+    return sim, pmu, queue
+
+
+def _drain(queue) -> list:
+    events = []
+    while len(queue):
+        irq, first, last, count = queue.pop()
+        events.append((irq, count))
+    return events
+
+
+def _plug(sim, step) -> None:
+    for vbus in (True, False, True):
+        sim.setState(vbus=vbus)
+        step()
+
+
+def test_dispatch_vbus_insert_remove_insert():
+    for windowMs in (0, 1000):
+        sim, pmu, queue = _setup(windowMs)
+        dispatcher = IrqDispatcher(pmu)
+        dispatcher.on(INSERT | REMOVE, lambda irq: None)
+        _plug(sim, dispatcher.dispatch)
+        assert _drain(queue) == [(INSERT, 1), (REMOVE, 1), (INSERT, 1)]
+
+
+def test_clear_irq_status_vbus_insert_remove_insert():
+    sim, pmu, queue = _setup(1000)
+
+    def step():
+        pmu.getIrqStatus()
+        pmu.clearIrqStatus()
+
+    _plug(sim, step)
+    assert _drain(queue) == [(INSERT, 1), (REMOVE, 1), (INSERT, 1)]
+
+
+def test_push_coalesces_with_newest_event_only():
+    queue = IrqEventQueue(8, 100)
+    queue.push(15, 0)
+    queue.push(15, 50)
+    queue.push(14, 60)
+    queue.push(15, 70)
+    queue.push(15, 250)
+    assert queue.pop() == (1 << 15, 0, 50, 2)
+    assert queue.pop() == (1 << 14, 60, 60, 1)
+    assert queue.pop() == (1 << 15, 70, 70, 1)
+    assert queue.pop() == (1 << 15, 250, 250, 1)
+    assert queue.pop() is None
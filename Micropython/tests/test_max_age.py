@@ -0,0 +1,111 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_max_age.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from PMUSimulator import AXP2101Simulator
+from AXP2101 import AXP2101
+import I2CInterface
+
+VBUS = AXP2101.XPOWERS_AXP2101_VBUS_INSERT_IRQ | AXP2101.XPOWERS_AXP2101_VBUS_REMOVE_IRQ
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(I2CInterface, 'ticks_ms', lambda: now[0])
+    return now
+
+
+def makePmu():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    sim.setState(battery=True)
+    sim.resetCounters()
+    return sim, pmu
+
+
+def test_default_reads_bus(clock):
+    sim, pmu = makePmu()
+    assert pmu.getMaxAge() == 0
+    pmu.isBatteryConnect()
+    pmu.isBatteryConnect()
+    assert sim.reads == 2
+
+
+def test_served_within_budget(clock):
+    sim, pmu = makePmu()
+    pmu.setMaxAge(100)
+    assert pmu.isBatteryConnect()
+    sim.setState(battery=False)
+    clock[0] += 100
+    assert pmu.isBatteryConnect()
+    assert sim.reads == 1
+    # Expired
+    clock[0] += 1
+    assert not pmu.isBatteryConnect()
+    assert sim.reads == 2
+    # Per call budget overrides the default
+    pmu.isBatteryConnect(maxAgeMs=0)
+    assert sim.reads == 3
+
+
+def test_per_call_budget(clock):
+    sim, pmu = makePmu()
+    pmu.isBatteryConnect(maxAgeMs=500)
+    pmu.isBatteryConnect(maxAgeMs=500)
+    assert sim.reads == 1
+    pmu.isBatteryConnect()
+    assert sim.reads == 2
+
+
+def test_irq_drops_copies(clock):
+    sim, pmu = makePmu()
+    pmu.enableIRQ(VBUS)
+    pmu.setMaxAge(1000)
+    assert not pmu.isVbusIn()
+    sim.setState(vbus=True)
+    assert not pmu.isVbusIn()
+    pmu.getIrqStatus()
+    assert pmu.isVbusIn()
+
+
+def test_writes_refresh_copies(clock):
+    sim, pmu = makePmu()
+    pmu.setMaxAge(1000)
+    pmu.enableDC3()
+    sim.resetCounters()
+    assert pmu.isEnableDC3()
+    assert sim.reads == 0
@@ -0,0 +1,103 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_poll_scheduler.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from PMUSimulator import AXP2101Simulator, AXP192Simulator
+from AXP2101 import AXP2101
+from AXP192 import AXP192
+import PollScheduler as PollSchedulerModule
+from PollScheduler import PollScheduler
+
+CHIPS = ((AXP2101, AXP2101Simulator), (AXP192, AXP192Simulator))
+
+
+@pytest.mark.parametrize('cls,simCls', CHIPS)
+def test_documented_example(cls, simCls):
+    sim = simCls()
+    pmu = cls(sim)
+    seen = []
+
+    def onVbus(name, value):
+        seen.append((name, value))
+
+    sched = PollScheduler(pmu)
+    sched.add('vbusIn', 50, onVbus)
+    sched.add('battVoltage', 1000)
+    sched.add('temperature', 10000)
+    sim.resetCounters()
+    assert sched.poll() == 3
+    # One plan, the status and ADC registers in few bursts
+    assert sim.transactions <= 3
+    assert seen == [('vbusIn', 0)]
+    assert sched.poll() == 0
+    sim.setState(vbus=True)
+    time.sleep(0.06)
+    assert sched.poll() == 1
+    assert seen == [('vbusIn', 0), ('vbusIn', 1)]
+    assert sched.getValue('vbusIn') == pmu.isVbusIn()
+
+
+def test_irq_status_is_not_polled():
+    sched = PollScheduler(AXP2101(AXP2101Simulator()))
+    with pytest.raises(ValueError):
+        sched.add('irqStatus', 50)
+    with pytest.raises(ValueError):
+        sched.add('noSuchField', 50)
+
+
+def test_attach_timer_needs_schedule(monkeypatch):
+    sched = PollScheduler(AXP2101(AXP2101Simulator()))
+    sched.add('vbusIn', 50)
+    monkeypatch.setattr(PollSchedulerModule, 'schedule', None)
+    with pytest.raises(ValueError):
+        sched.attachTimer(object())
+
+
+def test_timer_tick_only_schedules(monkeypatch):
+    sim = AXP2101Simulator()
+    sched = PollScheduler(AXP2101(sim))
+    sched.add('vbusIn', 50)
+    calls = []
+    monkeypatch.setattr(PollSchedulerModule, 'schedule', lambda func, arg: calls.append(func))
+    sim.resetCounters()
+    sched._tick(None)
+    sched._tick(None)
+    assert len(calls) == 1
+    assert sim.transactions == 0
+    calls[0](0)
+    assert sim.transactions == 1
+    assert sched.getValue('vbusIn') == 0
@@ -0,0 +1,118 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_power_key.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from PMUSimulator import AXP2101Simulator, AXP192Simulator
+from AXP2101 import AXP2101
+from AXP192 import AXP192
+import PowerKey as PowerKeyModule
+from PowerKey import PowerKey
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(PowerKeyModule, 'ticks_ms', lambda: now[0])
+    return now
+
+
+def makeKey(cls, simCls, doubleClickMs=0):
+    sim = simCls()
+    pmu = cls(sim)
+    seen = []
+    key = PowerKey(pmu, lambda gesture, ms: seen.append((gesture, ms)), doubleClickMs)
+    return sim, pmu, key, seen
+
+
+def fire(sim, pmu, mask):
+    sim.raiseIrq(mask)
+    pmu.getIrqDispatcher().dispatch()
+
+
+def test_long_press_then_release():
+    sim, pmu, key, seen = makeKey(AXP2101, AXP2101Simulator)
+    press, release, short, long = pmu._PKEY_IRQS
+    fire(sim, pmu, press)
+    fire(sim, pmu, long)
+    fire(sim, pmu, release)
+    assert [g for g, _ in seen] == [PowerKey.LONG_HOLD, PowerKey.HOLD_RELEASE]
+
+
+def test_long_and_release_in_one_read(clock):
+    sim, pmu, key, seen = makeKey(AXP2101, AXP2101Simulator)
+    press, release, short, long = pmu._PKEY_IRQS
+    fire(sim, pmu, press)
+    clock[0] += 2500
+    fire(sim, pmu, long | release)
+    assert seen == [(PowerKey.LONG_HOLD, 2500), (PowerKey.HOLD_RELEASE, 2500)]
+    # Nothing left over for the next press
+    seen[:] = []
+    fire(sim, pmu, press)
+    clock[0] += 100
+    fire(sim, pmu, release)
+    assert seen == [(PowerKey.CLICK, 100)]
+
+
+def test_press_long_and_release_in_one_read():
+    sim, pmu, key, seen = makeKey(AXP2101, AXP2101Simulator)
+    press, release, short, long = pmu._PKEY_IRQS
+    fire(sim, pmu, press | long | release)
+    assert seen == [(PowerKey.LONG_HOLD, 0), (PowerKey.HOLD_RELEASE, 0)]
+
+
+def test_double_click(clock):
+    sim, pmu, key, seen = makeKey(AXP2101, AXP2101Simulator, 300)
+    press, release, short, long = pmu._PKEY_IRQS
+    for _ in range(2):
+        fire(sim, pmu, press)
+        clock[0] += 50
+        fire(sim, pmu, release)
+        clock[0] += 100
+    assert seen == [(PowerKey.DOUBLE_CLICK, 50)]
+    fire(sim, pmu, press | release)
+    key.update()
+    assert len(seen) == 1
+    clock[0] += 301
+    key.update()
+    assert seen[1] == (PowerKey.CLICK, 0)
+
+
+def test_axp192_short_press():
+    sim, pmu, key, seen = makeKey(AXP192, AXP192Simulator)
+    press, release, short, long = pmu._PKEY_IRQS
+    fire(sim, pmu, short)
+    fire(sim, pmu, long)
+    assert [g for g, _ in seen] == [PowerKey.CLICK, PowerKey.LONG_HOLD]
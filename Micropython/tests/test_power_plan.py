@@ -0,0 +1,123 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_power_plan.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from PMUSimulator import AXP2101Simulator
+from AXP2101 import AXP2101
+import Rail
+
+PLAN = (('DC1', 3000), ('DC3', 1200), 5,
+        ('ALDO1', 1800), ('ALDO2', 2800), ('ALDO3', 3300), ('ALDO4', 3000),
+        ('BLDO1', 1800), 10,
+        ('DC4', False))
+
+
+def sequential(pmu):
+    pmu.setDC1Voltage(3000)
+    pmu.enableDC1()
+    pmu.setDC3Voltage(1200)
+    pmu.enableDC3()
+    for name, mv in (('ALDO1', 1800), ('ALDO2', 2800), ('ALDO3', 3300),
+                     ('ALDO4', 3000), ('BLDO1', 1800)):
+        getattr(pmu, 'set%sVoltage' % name)(mv)
+        getattr(pmu, 'enable%s' % name)()
+    pmu.disableDC4()
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    waited = []
+    monkeypatch.setattr(Rail, 'sleep_ms', waited.append)
+    return waited
+
+
+def makePmu():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    sim.resetCounters()
+    return sim, pmu
+
+
+def test_plan_matches_sequential_calls(delays):
+    simA, pmuA = makePmu()
+    sequential(pmuA)
+    simB, pmuB = makePmu()
+    state = pmuB.applyPowerPlan(PLAN)
+    assert bytes(simB.registers(pmuB._address)) == bytes(simA.registers(pmuA._address))
+    assert delays == [5, 10]
+    assert state['DC3'] == (True, 1200)
+    assert state['BLDO1'] == (True, 1800)
+    assert state['DC4'][0] is False
+    rails = pmuB.getAllRailStates()
+    for name in state:
+        assert state[name] == rails[name]
+
+
+def test_one_write_per_register_and_step(delays, monkeypatch):
+    sim, pmu = makePmu()
+    written = []
+    write = pmu.writeRegister
+
+    def record(reg, val):
+        written.append(reg)
+        write(reg, val)
+
+    monkeypatch.setattr(pmu, 'writeRegister', record)
+    pmu.applyPowerPlan(PLAN)
+    en = pmu.rail('DC1').desc[0]
+    ldoEn = pmu.rail('ALDO1').desc[0]
+    vol = [pmu.rail(name).desc[3] for name in ('DC1', 'DC3')]
+    # Step 1: the two voltages, then one enable write for DC1 and DC3
+    assert written[:3] == vol + [en]
+    # Step 2: five voltages, then one enable write for the five LDOs
+    assert written[3:9] == [pmu.rail(name).desc[3] for name in
+                            ('ALDO1', 'ALDO2', 'ALDO3', 'ALDO4', 'BLDO1')] + [ldoEn]
+    assert len(written) <= 10
+    # Applying it again changes nothing
+    del written[:]
+    pmu.applyPowerPlan(PLAN)
+    assert written == []
+
+
+@pytest.mark.parametrize('plan', (PLAN + (('DC3', 1560),), PLAN + (('DC9', 1800),)))
+def test_bad_plan_leaves_chip_untouched(plan, delays):
+    sim, pmu = makePmu()
+    before = bytes(sim.registers(pmu._address))
+    with pytest.raises(ValueError):
+        pmu.applyPowerPlan(plan)
+    assert sim.writes == 0
+    assert bytes(sim.registers(pmu._address)) == before
+    assert delays == []
@@ -0,0 +1,137 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_rail.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from PMUSimulator import AXP2101Simulator, AXP192Simulator
+from AXP2101 import AXP2101
+from AXP192 import AXP192
+from Rail import encodeVoltage, decodeVoltage
+
+CHIPS = ((AXP2101, AXP2101Simulator), (AXP192, AXP192Simulator))
+
+# Rail name: name in the wrapper methods, where they differ
+WRAPPER_NAMES = {'LDOIO': 'LDOio'}
+
+
+def makePmu(cls, simCls):
+    sim = simCls()
+    return sim, cls(sim)
+
+
+@pytest.mark.parametrize('cls,simCls', CHIPS)
+def test_rail_matches_wrappers(cls, simCls):
+    sim, pmu = makePmu(cls, simCls)
+    for name in pmu.getRailNames():
+        r = pmu.rail(name)
+        wrapped = WRAPPER_NAMES.get(name, name)
+        low, high = r.getVoltageRange()
+        r.setVoltage(high)
+        r.enable()
+        assert getattr(pmu, 'get%sVoltage' % wrapped)() == high
+        assert getattr(pmu, 'isEnable%s' % wrapped)()
+        getattr(pmu, 'set%sVoltage' % wrapped)(low)
+        assert r.getVoltage() == low
+        r.disable()
+        assert not getattr(pmu, 'isEnable%s' % wrapped)()
+        assert not r.isEnabled()
+
+
+def test_rail_keeps_other_bits():
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator)
+    mem = sim.registers(pmu._address)
+    r = pmu.rail('DC3')
+    reg = r.desc[3]
+    mem[reg] = 0x80
+    r.setVoltage(3300)
+    assert mem[reg] & 0x80
+    assert r.getVoltage() == 3300
+
+
+def test_unknown_rail():
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator)
+    with pytest.raises(ValueError):
+        pmu.rail('DC9')
+
+
+# {mV: code} straight from the segments, the first segment wins
+def segmentCodes(desc):
+    codes = {}
+    for vmin, vmax, step, base in desc[7]:
+        for i in range((vmax - vmin) // step + 1):
+            codes.setdefault(vmin + i * step, base + i)
+    return codes
+
+
+@pytest.mark.parametrize('cls,simCls', CHIPS)
+def test_encode_decode_tables(cls, simCls):
+    for name, desc in cls._RAILS.items():
+        codes = segmentCodes(desc)
+        high = max(codes)
+        for mv in range(min(codes) - 100, high + 101):
+            if mv in codes:
+                assert encodeVoltage(name, desc, mv) == codes[mv]
+                assert decodeVoltage(desc, codes[mv]) == mv
+            else:
+                with pytest.raises(ValueError):
+                    encodeVoltage(name, desc, mv)
+        # Reserved codes read back as the highest voltage
+        used = set(codes.values())
+        for code in range((desc[4] >> desc[5]) + 1):
+            if code not in used:
+                assert decodeVoltage(desc, code) == high
+
+
+def test_voltage_errors():
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator)
+    cases = ((400, 'DC3 minimum output voltage is  500mV'),
+             (3500, 'DC3 maximum output voltage is  3400mV'),
+             (1225, 'The steps is must 20 mV'),
+             # Between two segments
+             (1560, 'DC3 can not output 1560mV'))
+    for mv, message in cases:
+        for setter in (pmu.setDC3Voltage, pmu.rail('DC3').setVoltage):
+            with pytest.raises(ValueError) as e:
+                setter(mv)
+            assert str(e.value) == 'Mistake ! ' + message
+
+
+def test_reserved_code_reads_highest_voltage():
+    sim, pmu = makePmu(AXP2101, AXP2101Simulator)
+    mem = sim.registers(pmu._address)
+    reg = pmu.rail('DC3').desc[3]
+    mem[reg] = 0x7F
+    assert pmu.getDC3Voltage() == 3400
+    assert pmu.rail('DC3').getVoltage() == 3400
@@ -0,0 +1,135 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_read_plan.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PMUSimulator import AXP2101Simulator, AXP192Simulator
+from AXP2101 import AXP2101
+from AXP192 import AXP192
+from ReadPlan import planBursts
+
+# field: getter
+AXP2101_GETTERS = {
+    'vbusIn': 'isVbusIn',
+    'batteryConnected': 'isBatteryConnect',
+    'charging': 'isCharging',
+    'chargerStatus': 'getChargerStatus',
+    'battVoltage': 'getBattVoltage',
+    'vbusVoltage': 'getVbusVoltage',
+    'systemVoltage': 'getSystemVoltage',
+    'temperature': 'getTemperature',
+    'batteryPercent': 'getBatteryPercent',
+}
+AXP192_GETTERS = {
+    'acinIn': 'isAcinIn',
+    'vbusIn': 'isVbusIn',
+    'batteryConnected': 'isBatteryConnect',
+    'charging': 'isCharging',
+    'acinVoltage': 'getAcinVoltage',
+    'acinCurrent': 'getAcinCurrent',
+    'vbusVoltage': 'getVbusVoltage',
+    'vbusCurrent': 'getVbusCurrent',
+    'temperature': 'getTemperature',
+    'battVoltage': 'getBattVoltage',
+    'battChargeCurrent': 'getBatteryChargeCurrent',
+    'battDischargeCurrent': 'getBattDischargeCurrent',
+    'systemVoltage': 'getSystemVoltage',
+    'chargeCoulomb': 'getBattChargeCoulomb',
+    'dischargeCoulomb': 'getBattDischargeCoulomb',
+}
+
+
+def _check(pmu, sim, getters, regs, present):
+    mem = sim.registers(pmu._address)
+    rng = random.Random(7)
+    names = sorted(getters)
+    for _ in range(200):
+        for reg in regs:
+            mem[reg] = rng.randrange(256)
+        fields = pmu.readFields(names)
+        for name in names:
+            if getters[name].startswith('is'):
+                assert fields[name] == getattr(pmu, getters[name])(), name
+        # The value getters report 0 for a missing source, the fields do
+        # not
+        for reg, bits in present:
+            mem[reg] |= bits
+        fields = pmu.readFields(names)
+        for name in names:
+            want = getattr(pmu, getters[name])()
+            assert abs(fields[name] - want) < 1e-9, (name, fields[name], want)
+
+
+def test_read_fields_match_getters_axp2101():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    regs = [0x00, 0x01, 0xA4] + list(range(0x34, 0x3E))
+    _check(pmu, sim, AXP2101_GETTERS, regs, ((0x00, 0x28),))
+
+
+def test_read_fields_match_getters_axp192():
+    sim = AXP192Simulator()
+    pmu = AXP192(sim)
+    regs = [0x00, 0x01] + list(range(0x56, 0x60)) + list(range(0x78, 0x80)) + list(range(0xB0, 0xB8))
+    _check(pmu, sim, AXP192_GETTERS, regs, ((0x00, 0xA0), (0x01, 0x20)))
+
+
+def test_status_flags_on_both_chips():
+    for cls, simCls in ((AXP2101, AXP2101Simulator), (AXP192, AXP192Simulator)):
+        sim = simCls()
+        pmu = cls(sim)
+        for vbus in (False, True):
+            for charge in ('standby', 'charging'):
+                sim.setState(vbus=vbus, battery=True, charge=charge)
+                fields = pmu.readFields(('vbusIn', 'charging'))
+                assert fields['vbusIn'] == pmu.isVbusIn() == vbus
+                assert fields['charging'] == pmu.isCharging() == (charge == 'charging')
+
+
+def test_plan_bursts_bridges_small_gaps_only():
+    assert planBursts((0x34, 0x35, 0x38, 0x39)) == [(0x34, 6)]
+    assert planBursts((0x34, 0x39)) == [(0x34, 1), (0x39, 1)]
+    assert planBursts((0x35, 0x34, 0x35)) == [(0x34, 2)]
+    # Never read across a data port
+    assert planBursts((0xA0, 0xA2), barriers=(0xA1,)) == [(0xA0, 1), (0xA2, 1)]
+
+
+def test_read_plan_is_cached_and_counts_bursts():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    plan = pmu.getReadPlan(pmu._TELEMETRY_FIELDS)
+    assert pmu.getReadPlan(list(pmu._TELEMETRY_FIELDS)) is plan
+    sim.resetCounters()
+    pmu.readTelemetry()
+    assert sim.transactions == plan.getBurstCount() == 3
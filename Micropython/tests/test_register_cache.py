@@ -0,0 +1,96 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      test_register_cache.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run on the host with pytest, the drivers talk to PMUSimulator.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PMUSimulator import AXP2101Simulator
+from AXP2101 import AXP2101
+
+# DC enable register and the first status register of the AXP2101
+CONTROL = 0x80
+STATUS = 0x00
+
+
+def makePmu():
+    sim = AXP2101Simulator()
+    pmu = AXP2101(sim)
+    pmu.enableRegisterCache()
+    sim.resetCounters()
+    return sim, pmu
+
+
+def test_control_register_read_once():
+    sim, pmu = makePmu()
+    mem = sim.registers(pmu._address)
+    value = pmu.readRegisterByte(CONTROL)
+    mem[CONTROL] = value ^ 0xFF
+    assert pmu.readRegisterByte(CONTROL) == value
+    assert sim.reads == 1
+    # Next read goes to the bus again
+    pmu.invalidateRegisterCache(CONTROL)
+    assert pmu.readRegisterByte(CONTROL) == value ^ 0xFF
+    assert sim.reads == 2
+
+
+def test_write_through():
+    sim, pmu = makePmu()
+    mem = sim.registers(pmu._address)
+    pmu.enableDC1()
+    pmu.disableDC3()
+    pmu.enableDC4()
+    assert sim.reads == 1
+    assert sim.writes == 3
+    assert pmu.readRegisterByte(CONTROL) == mem[CONTROL]
+    assert pmu.isEnableDC1() and not pmu.isEnableDC3() and pmu.isEnableDC4()
+    assert sim.reads == 1
+
+
+def test_volatile_registers_always_read():
+    sim, pmu = makePmu()
+    for _ in range(3):
+        pmu.readRegisterByte(STATUS)
+    assert sim.reads == 3
+    # Marked by the caller
+    pmu.setRegisterVolatile(CONTROL)
+    pmu.readRegisterByte(CONTROL)
+    pmu.readRegisterByte(CONTROL)
+    assert sim.reads == 5
+
+
+def test_disabled_cache_reads_bus():
+    sim, pmu = makePmu()
+    pmu.disableRegisterCache()
+    pmu.readRegisterByte(CONTROL)
+    pmu.readRegisterByte(CONTROL)
+    assert sim.reads == 2
+    assert not pmu.isEnableRegisterCache()
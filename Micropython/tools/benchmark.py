@@ -0,0 +1,237 @@
+'''
+@license MIT License
+
+Copyright (c) 2022 lewis he
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@file      benchmark.py
+@author    agent (agent@local)
+@date      2026-10-18
+
+Run every public AXP2101 / AXP192 driver method against the register map
+simulator and report the I2C transactions, bytes on the wire and wall time
+of one call.  CPython only.
+
+    python benchmark.py                      # JSON to stdout
+    python benchmark.py -o new.json --compare old.json
+    python benchmark.py --format csv --chip AXP2101 --cache
+'''
+
+import argparse
+import contextlib
+import csv
+import inspect
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import AXP192                                               # noqa: E402
+import AXP2101                                              # noqa: E402
+from PMUSimulator import AXP192Simulator, AXP2101Simulator  # noqa: E402
+
+FORMAT_VERSION = 1
+
+CHIPS = {
+    'AXP2101': (AXP2101.AXP2101, AXP2101Simulator),
+    'AXP192': (AXP192.AXP192, AXP192Simulator),
+}
+
+# Argument values tried, in order, for required parameters.  The first
+# combination the method accepts is used.
+CANDIDATES = {
+    'millivolt': (3300, 1800, 1200, 1000, 3000, 2600, 4200, 4100, 4000, 4400, 700, 500),
+    'milliampere': (500, 300, 100, 1000),
+    'en': (True,),
+    'enable': (True,),
+    'data': (bytearray(range(128)),),
+    'size': (4, 1),
+    'length': (4, 1),
+    'freq': (1,),
+    'duty': (10,),
+}
+DEFAULT_CANDIDATES = (1, 0, 2, 3, 4, 5)
+MAX_ATTEMPTS = 64
+
+
+def _quiet():
+    # The drivers print the port and class name from __init__
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _newDevice(chip: str, cache: bool):
+    driverClass, simulatorClass = CHIPS[chip]
+    sim = simulatorClass()
+    sim.setState(vbus=True, battery=True, charge='charging')
+    sim.setAdc('vbat', 3900)
+    sim.setAdc('vbus', 5000)
+    with _quiet():
+        pmu = driverClass(sim)
+    if cache:
+        pmu.enableRegisterCache()
+    return pmu, sim
+
+
+def publicMethods(chip: str) -> list:
+    driverClass = CHIPS[chip][0]
+    names = []
+    for name, value in driverClass.__dict__.items():
+        if not name.startswith('_') and inspect.isfunction(value):
+            names.append(name)
+    return sorted(names)
+
+
+def _argumentSets(method):
+    params = list(inspect.signature(method).parameters.values())[1:]
+    choices = []
+    for p in params:
+        if p.default is not p.empty or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+            continue
+        choices.append(CANDIDATES.get(p.name, DEFAULT_CANDIDATES))
+    return itertools.islice(itertools.product(*choices), MAX_ATTEMPTS)
+
+
+def _describe(args) -> list:
+    out = []
+    for a in args:
+        if isinstance(a, (bytes, bytearray)):
+            out.append('<%d bytes>' % len(a))
+        else:
+            out.append(a)
+    return out
+
+
+def measure(chip: str, name: str, repeat: int, cache: bool) -> dict:
+    result = {'chip': chip, 'method': name}
+    error = None
+    for args in _argumentSets(getattr(CHIPS[chip][0], name)):
+        pmu, sim = _newDevice(chip, cache)
+        method = getattr(pmu, name)
+        sim.resetCounters()
+        try:
+            with _quiet():
+                method(*args)
+        except Exception as e:
+            error = '%s: %s' % (type(e).__name__, e)
+            continue
+        result['args'] = _describe(args)
+        result['transactions'] = sim.transactions
+        result['reads'] = sim.reads
+        result['writes'] = sim.writes
+        result['bytes'] = sim.bytesRead + sim.bytesWritten
+        with _quiet():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                method(*args)
+            elapsed = time.perf_counter() - start
+        result['time_us'] = round(elapsed * 1e6 / repeat, 2)
+        return result
+    result['error'] = error
+    return result
+
+
+def run(chips, repeat: int, cache: bool) -> dict:
+    results = []
+    for chip in chips:
+        for name in publicMethods(chip):
+            results.append(measure(chip, name, repeat, cache))
+    return {
+        'version': FORMAT_VERSION,
+        'python': platform.python_implementation() + ' ' + platform.python_version(),
+        'repeat': repeat,
+        'cache': cache,
+        'results': results,
+    }
+
+
+FIELDS = ('chip', 'method', 'transactions', 'reads', 'writes', 'bytes', 'time_us', 'error')
+
+
+def writeJson(report: dict, stream) -> None:
+    json.dump(report, stream, indent=1, sort_keys=True)
+    stream.write('\n')
+
+
+def writeCsv(report: dict, stream) -> None:
+    writer = csv.DictWriter(stream, FIELDS, extrasaction='ignore', lineterminator='\n')
+    writer.writeheader()
+    for row in report['results']:
+        writer.writerow(row)
+
+
+# @brief  Print the methods whose bus cost changed against a previous
+#         JSON report, returns the number of methods that got worse.
+def compare(report: dict, baseline: dict, stream) -> int:
+    old = {}
+    for row in baseline['results']:
+        old[(row['chip'], row['method'])] = row
+    worse = 0
+    for row in report['results']:
+        prev = old.get((row['chip'], row['method']))
+        if prev is None or 'error' in row or 'error' in prev:
+            continue
+        dt = row['transactions'] - prev['transactions']
+        db = row['bytes'] - prev['bytes']
+        if dt or db:
+            stream.write('%-8s %-36s transactions %3d -> %3d  bytes %4d -> %4d\n' % (
+                row['chip'], row['method'], prev['transactions'], row['transactions'],
+                prev['bytes'], row['bytes']))
+        if dt > 0 or (dt == 0 and db > 0):
+            worse += 1
+    return worse
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='XPowersLib driver bus cost benchmark')
+    parser.add_argument('--chip', choices=sorted(CHIPS), action='append',
+                        help='chip to benchmark, repeatable (default: all)')
+    parser.add_argument('--repeat', type=int, default=50,
+                        help='calls per method for the wall time (default: 50)')
+    parser.add_argument('--cache', action='store_true',
+                        help='enable the register shadow cache')
+    parser.add_argument('--format', choices=('json', 'csv'), default='json')
+    parser.add_argument('-o', '--output', help='write the report to a file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='JSON report to diff against, exits 1 if any method got worse')
+    opts = parser.parse_args(argv)
+
+    report = run(opts.chip or sorted(CHIPS), max(opts.repeat, 1), opts.cache)
+    writer = writeCsv if opts.format == 'csv' else writeJson
+    if opts.output:
+        with open(opts.output, 'w') as f:
+            writer(report, f)
+    else:
+        writer(report, sys.stdout)
+
+    if opts.compare:
+        with open(opts.compare) as f:
+            baseline = json.load(f)
+        if compare(report, baseline, sys.stderr):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())